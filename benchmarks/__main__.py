@@ -0,0 +1,181 @@
+"""
+Scenario-driven benchmark suite for the game loop.
+
+Run from the project folder with ``python3 -m benchmarks``. Results are written as JSON,
+and if a baseline results file is given the process exits with a non-zero status when
+any scenario is slower or uses more memory than the baseline by more than the threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from .scenarios import SCENARIOS
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+DEFAULT_FRAMES = 1200
+DEFAULT_THRESHOLD = 0.1
+
+
+def run_scenario(
+    scenario, screen: pygame.Surface, frames: int, headless: bool, trace_memory: bool
+) -> dict:
+    """
+    Runs a single scenario for a fixed number of frames. The scenario's controller is
+    seeded with a fixed seed so every run simulates exactly the same frames.
+
+    :param scenario: :class:`benchmarks.scenarios.Scenario` to run
+    :param screen: The display :class:`pygame.Surface`
+    :param frames: :class:`int` amount of frames to run for
+    :param headless: :class:`bool` whether to skip drawing
+    :param trace_memory: :class:`bool` whether to measure peak memory with :mod:`tracemalloc`, which slows the run down
+    :return: :class:`dict` of results
+    """
+    if trace_memory:
+        tracemalloc.start()
+    controller = scenario.build(screen, headless)
+
+    start = time.perf_counter()
+    for frame_number in range(frames):
+        scenario.drive(controller, frame_number)
+        controller.update_all()
+    elapsed = time.perf_counter() - start
+
+    results = {
+        "ms_per_frame": elapsed * 1000 / frames,
+        "frames_per_second": frames / elapsed,
+        "score": controller.score.value,
+        "enemy_pool_misses": controller.enemy_pool.misses,
+        "missile_pool_misses": controller.missile_pool.misses,
+        "missile_pool_hit_rate": controller.missile_pool.hit_rate(),
+    }
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results["peak_memory_kb"] = peak / 1024
+    return results
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Compares results against a baseline, returning a description of every metric
+    which has got worse by more than the threshold.
+
+    :param results: :class:`dict` of results from this run
+    :param baseline: :class:`dict` of results from a previous run
+    :param threshold: :class:`float` allowed fractional increase, eg 0.1 for 10%
+    :return: :class:`list` of :class:`str` regression descriptions
+    """
+    regressions = []
+    for name, baseline_scenario in baseline["scenarios"].items():
+        scenario = results["scenarios"].get(name)
+        if scenario is None:
+            continue
+        for metric in ("ms_per_frame", "peak_memory_kb"):
+            if metric not in scenario or metric not in baseline_scenario:
+                continue
+            limit = baseline_scenario[metric] * (1 + threshold)
+            if scenario[metric] > limit:
+                regressions.append(
+                    f"{name}: {metric} {scenario[metric]:.3f} > {baseline_scenario[metric]:.3f} "
+                    f"(+{(scenario[metric] / baseline_scenario[metric] - 1) * 100:.1f}%)"
+                )
+    return regressions
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    :return: :class:`argparse.Namespace` of arguments
+    """
+    parser = argparse.ArgumentParser(prog="python3 -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=DEFAULT_FRAMES,
+        help="frames to run each scenario for",
+    )
+    parser.add_argument(
+        "--output", default="benchmark_results.json", help="file to write results to"
+    )
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed fractional regression",
+    )
+    parser.add_argument(
+        "--draw", action="store_true", help="draw every frame to the dummy display"
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip the peak memory pass"
+    )
+    parser.add_argument(
+        "scenarios", nargs="*", help="names of scenarios to run, all if omitted"
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """
+    Runs the benchmark suite and writes the results.
+
+    :return: :class:`int` exit status, 1 if a regression was found
+    """
+    arguments = parse_arguments()
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    results = {
+        "frames": arguments.frames,
+        "draw": arguments.draw,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "scenarios": {},
+    }
+    for scenario in SCENARIOS:
+        if arguments.scenarios and scenario.name not in arguments.scenarios:
+            continue
+        scenario_results = run_scenario(
+            scenario, screen, arguments.frames, not arguments.draw, False
+        )
+        if not arguments.no_memory:
+            scenario_results["peak_memory_kb"] = run_scenario(
+                scenario, screen, arguments.frames, not arguments.draw, True
+            )["peak_memory_kb"]
+        scenario_results["enemies"] = scenario.number_of_enemies()
+        results["scenarios"][scenario.name] = scenario_results
+        print(
+            f"{scenario.name:<24} {scenario_results['ms_per_frame']:>8.3f} ms/frame "
+            f"{scenario_results['frames_per_second']:>9.1f} fps "
+            f"{scenario_results.get('peak_memory_kb', 0):>9.1f} KiB peak"
+        )
+
+    with open(arguments.output, "w") as output_file:
+        json.dump(results, output_file, indent=4)
+
+    pygame.quit()
+
+    if arguments.baseline is None:
+        return 0
+    with open(arguments.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions = find_regressions(results, baseline, arguments.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Benchmark comparing the spatial hash broad-phase used by
+:func:`source.game_controller.GameController.check_collisions` against testing
+every missile against every enemy.
+
+Run from the project folder with ``python3 -m benchmarks.collisions``.
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from source import collision, game_controller
+from source.missile import Missile
+from source.settings import Settings
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+ENEMY_COUNTS = [1000, 5000, 10000]
+MISSILE_COUNT = 25
+FRAMES = 60
+SEED = 0
+
+
+def check_collisions_brute_force(controller, missile_list) -> None:
+    """
+    Reference implementation testing every missile against every enemy with the
+    same swept test as check_collisions, but without the broad-phase.
+
+    :param controller: :class:`source.game_controller.GameController` to check
+    :param missile_list: :class:`list` of :class:`source.missile.Missile` to check
+    :return: `None`
+    """
+    for missile in missile_list[:]:
+        if not missile.visible:
+            missile_list.remove(missile)
+            continue
+
+        hit_enemy = False
+        for enemy in controller.current_wave.enemies.sprites():
+            if enemy.visible and collision.contact_time(missile, enemy) is not None:
+                controller.score.increment(enemy.score_value)
+                controller.balance.increment(enemy.balance_value)
+                enemy.visible = False
+                hit_enemy = True
+        if hit_enemy:
+            missile.visible = False
+            missile_list.remove(missile)
+
+
+def build_controller(screen: pygame.Surface, number_of_enemies: int):
+    """
+    Creates a :class:`source.game_controller.GameController` with a wave of enemies
+    scattered randomly over the screen.
+
+    :param screen: The display :class:`pygame.Surface`
+    :param number_of_enemies: :class:`int` amount of enemies to create
+    :return: :class:`source.game_controller.GameController`
+    """
+    settings = Settings()
+    settings.seed = SEED
+    controller = game_controller.GameController(
+        screen, SCREEN_WIDTH, SCREEN_HEIGHT, settings, lambda: None
+    )
+    controller.create_new_wave()
+    for _ in range(number_of_enemies):
+        controller.current_wave.register_enemy()
+    for enemy in controller.current_wave.enemies:
+        enemy.set_course(
+            enemy.start_x,
+            random.randint(0, SCREEN_HEIGHT - 60),
+            enemy.end_x,
+            enemy.end_y,
+            enemy.velocity_x,
+            enemy.velocity_y,
+        )
+    return controller
+
+
+def build_missiles(screen: pygame.Surface) -> list:
+    """
+    Creates missiles scattered randomly over the screen.
+
+    :param screen: The display :class:`pygame.Surface`
+    :return: :class:`list` of :class:`source.missile.Missile`
+    """
+    missiles = []
+    for _ in range(MISSILE_COUNT):
+        missiles.append(
+            Missile(
+                screen,
+                SCREEN_WIDTH,
+                SCREEN_HEIGHT,
+                random.randint(0, SCREEN_WIDTH),
+                random.randint(0, SCREEN_HEIGHT),
+                random.randint(0, SCREEN_WIDTH),
+                0,
+                game_controller.PLAYER_MISSILE_VELOCITY,
+            )
+        )
+    return missiles
+
+
+def run_frames(controller, missiles: list, use_grid: bool) -> float:
+    """
+    Runs the collision checks for a fixed number of frames, restoring every
+    enemy and missile before each frame so that each frame does the same work.
+
+    :param controller: :class:`source.game_controller.GameController` to check
+    :param missiles: :class:`list` of :class:`source.missile.Missile` to fire each frame
+    :param use_grid: :class:`bool` whether to use the spatial hash broad-phase
+    :return: :class:`float` average milliseconds per frame
+    """
+    enemies = controller.current_wave.enemies.sprites()
+    total = 0
+    for _ in range(FRAMES):
+        for enemy in enemies:
+            enemy.visible = True
+        for missile in missiles:
+            missile.visible = True
+
+        start = time.perf_counter()
+        if use_grid:
+            controller.rebuild_enemy_grid()
+            controller.check_collisions(missiles[:])
+        else:
+            check_collisions_brute_force(controller, missiles[:])
+        total += time.perf_counter() - start
+    return total * 1000 / FRAMES
+
+
+def main() -> None:
+    """
+    Runs the benchmark for each enemy count and prints the results.
+
+    :return: `None`
+    """
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    print(f"{'enemies':>8} {'brute ms':>10} {'grid ms':>10} {'speedup':>8} identical")
+    for number_of_enemies in ENEMY_COUNTS:
+        random.seed(SEED)
+        controller = build_controller(screen, number_of_enemies)
+        missiles = build_missiles(screen)
+
+        brute_force_ms = run_frames(controller, missiles, False)
+        brute_force_result = controller.score.value, controller.balance.value
+        controller.score.reset()
+        controller.balance.value = 0
+
+        grid_ms = run_frames(controller, missiles, True)
+        grid_result = controller.score.value, controller.balance.value
+
+        print(
+            f"{number_of_enemies:>8} {brute_force_ms:>10.3f} {grid_ms:>10.3f} "
+            f"{brute_force_ms / grid_ms:>7.1f}x {brute_force_result == grid_result}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
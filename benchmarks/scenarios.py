@@ -0,0 +1,145 @@
+"""
+Scenarios run by the benchmark suite. Each scenario forces the game into a specific
+state, such as a given wave on a given difficulty, then drives it for a fixed number of frames.
+"""
+
+import os
+
+import pygame
+
+from source import game_controller
+from source.settings import Settings
+from source.wave_plan import WavePlan
+
+# Constants
+SEED = 1234
+PLANS_DIRECTORY = os.path.join(os.path.dirname(__file__), "plans")
+BENCHMARK_LIVES = 10**9
+FIRE_INTERVAL = 8
+SWEEP_INTERVAL = 90
+
+
+class Scenario:
+    """
+    Describes one benchmark scenario.
+
+    :param name: :class:`str` unique name of the scenario, used as its key in results
+    :param difficulty: :class:`str` difficulty to play on, one of "EASY", "NORMAL" or "HARD"
+    :param wave_number: :class:`int` wave to start on, the enemy count comes from
+        :func:`source.game_controller.calculate_enemies_for_wave`
+    :param towers: :class:`bool` whether every tower position has a tower placed
+    :param firing: :class:`bool` whether the player fires continuously while sweeping the reticle
+    :param plan: Optional[:class:`str`] file name of a :class:`source.wave_plan.WavePlan` in the plans
+        directory to use for the first wave, instead of a randomly generated wave
+    """
+
+    def __init__(
+        self,
+        name: str,
+        difficulty: str,
+        wave_number: int,
+        towers: bool = False,
+        firing: bool = False,
+        plan: str = None,
+    ) -> None:
+        self.name = name
+        self.difficulty = difficulty
+        self.wave_number = wave_number
+        self.towers = towers
+        self.firing = firing
+        self.plan = plan
+
+    def load_plan(self) -> WavePlan:
+        """
+        Loads the scenario's fixed wave plan.
+
+        :return: :class:`source.wave_plan.WavePlan`
+        """
+        return WavePlan.load(os.path.join(PLANS_DIRECTORY, self.plan))
+
+    def number_of_enemies(self) -> int:
+        """
+        Gets the number of enemies in the scenario's wave.
+
+        :return: :class:`int` amount of enemies
+        """
+        if self.plan is not None:
+            return len(self.load_plan())
+        return game_controller.calculate_enemies_for_wave(
+            game_controller.INITIAL_ENEMIES,
+            self.wave_number,
+            game_controller.ENEMY_CONSTANTS[self.difficulty],
+        )
+
+    def build(self, screen: pygame.Surface, headless: bool):
+        """
+        Creates a :class:`source.game_controller.GameController` in the scenario's starting state.
+        Lives are set high enough that the game never ends during a run.
+
+        :param screen: The display :class:`pygame.Surface`
+        :param headless: :class:`bool` whether the controller should skip drawing
+        :return: :class:`source.game_controller.GameController`
+        """
+        settings = Settings()
+        settings.difficulty = self.difficulty
+        settings.seed = SEED
+        controller = game_controller.GameController(
+            screen,
+            screen.get_width(),
+            screen.get_height(),
+            settings,
+            lambda: None,
+            headless,
+        )
+        controller.wave_number = self.wave_number
+        controller.lives.lives = BENCHMARK_LIVES
+        if self.towers:
+            for tower in controller.towers:
+                tower.place()
+        if self.plan is not None:
+            controller.create_new_wave(self.load_plan())
+        return controller
+
+    def drive(self, controller, frame_number: int) -> None:
+        """
+        Feeds the scenario's input for a single frame into the controller.
+
+        :param controller: :class:`source.game_controller.GameController` being benchmarked
+        :param frame_number: :class:`int` number of the current frame
+        :return: `None`
+        """
+        if not self.firing:
+            return
+        control_scheme = controller.control_scheme
+        if frame_number % SWEEP_INTERVAL == 0:
+            # Alternate sweeping the reticle left and right across the screen
+            sweep_right = (frame_number // SWEEP_INTERVAL) % 2 == 0
+            pressed, released = (
+                (control_scheme.right, control_scheme.left)
+                if sweep_right
+                else (control_scheme.left, control_scheme.right)
+            )
+            controller.process_event(pygame.event.Event(pygame.KEYUP, key=released))
+            controller.process_event(pygame.event.Event(pygame.KEYDOWN, key=pressed))
+        if frame_number % FIRE_INTERVAL == 0:
+            controller.process_event(
+                pygame.event.Event(pygame.KEYDOWN, key=control_scheme.fire)
+            )
+
+
+SCENARIOS = [
+    Scenario("wave_10_easy", "EASY", 10),
+    Scenario("wave_10_normal", "NORMAL", 10),
+    Scenario("wave_10_hard", "HARD", 10),
+    Scenario("wave_30_easy", "EASY", 30),
+    Scenario("wave_30_normal", "NORMAL", 30),
+    Scenario("wave_30_hard", "HARD", 30),
+    Scenario("towers_wave_10_normal", "NORMAL", 10, towers=True),
+    Scenario("firing_wave_10_normal", "NORMAL", 10, firing=True),
+    Scenario("full_wave_30_hard", "HARD", 30, towers=True, firing=True),
+    # 400 enemies spawning within half a second, made with
+    # WavePlan.generate(400, 30, 800, 600, random.Random(SEED)).save(path)
+    Scenario(
+        "burst_400_plan", "NORMAL", 10, towers=True, firing=True, plan="burst_400.json"
+    ),
+]
@@ -1,3 +1,8 @@
+from .startup import startup_report
+
+# Time every import from here on when MISSILE_DEFENCE_STARTUP_REPORT is set
+startup_report.install()
+
 from . import game
 
 game.main()
@@ -0,0 +1,98 @@
+import pygame
+import typing
+
+
+class AnimationClip:
+    """
+    Class to represent an animation built from a spritesheet. The frames are downscaled once
+    into a compact atlas surface, sprites using the clip only need to hold a frame index.
+
+    :param atlas: The :class:`pygame.Surface` made by :func:`source.animation.AnimationClip.build_atlas`
+        holding every frame side by side
+    :param number_of_frames: :class:`int` amount of frames in the atlas
+    """
+
+    def __init__(self, atlas: pygame.Surface, number_of_frames: int) -> None:
+        self.number_of_frames = number_of_frames
+        self.atlas = atlas
+        self.frame_width = atlas.get_width() // number_of_frames
+        self.frame_height = atlas.get_height()
+        self.frames = [
+            self.atlas.subsurface(
+                ((index * self.frame_width, 0), (self.frame_width, self.frame_height))
+            )
+            for index in range(number_of_frames)
+        ]
+
+    @staticmethod
+    def build_atlas(
+        spritesheet: pygame.Surface,
+        number_of_frames: int,
+        frame_size: typing.Tuple[int, int],
+        frame_stride: int,
+        frame_offset: typing.Tuple[int, int],
+        scaled_size: typing.Tuple[int, int],
+    ) -> pygame.Surface:
+        """
+        Downscales every frame of a spritesheet into an atlas, one frame after another.
+
+        :param spritesheet: The :class:`pygame.Surface` containing every frame of the animation
+        :param number_of_frames: :class:`int` amount of frames in the spritesheet
+        :param frame_size: :class:`tuple`[:class:`int`] width and height of each frame in the spritesheet
+        :param frame_stride: :class:`int` horizontal distance in pixels between the start of each frame
+        :param frame_offset: :class:`tuple`[:class:`int`] x, y position of the first frame in the spritesheet
+        :param scaled_size: :class:`tuple`[:class:`int`] width and height of each frame in the atlas
+        :return: :class:`pygame.Surface` atlas of the downscaled frames
+        """
+        frame_width, frame_height = scaled_size
+        atlas = pygame.Surface(
+            (frame_width * number_of_frames, frame_height), pygame.SRCALPHA
+        )
+        for index in range(number_of_frames):
+            source_frame = spritesheet.subsurface(
+                (
+                    (frame_offset[0] + index * frame_stride, frame_offset[1]),
+                    frame_size,
+                )
+            )
+            atlas.blit(
+                pygame.transform.scale(source_frame, scaled_size),
+                (index * frame_width, 0),
+            )
+        return atlas
+
+    def __len__(self) -> int:
+        """
+        Gets the number of frames in the animation.
+
+        :return: :class:`int` number of frames
+        """
+        return self.number_of_frames
+
+    def frame(self, index: int) -> pygame.Surface:
+        """
+        Gets a single frame of the animation. The returned surface shares its pixels with the atlas.
+
+        :param index: :class:`int` index of the frame
+        :return: :class:`pygame.Surface` frame of the animation
+        """
+        return self.frames[index]
+
+    def frame_index(self, elapsed_frames: int) -> int:
+        """
+        Gets the index of the frame shown after the animation has played for a number of
+        simulation steps, one frame per step, looping back to 0 after the last frame.
+
+        :param elapsed_frames: :class:`int` simulation steps since the animation started
+        :return: :class:`int` index of the frame
+        """
+        return elapsed_frames % self.number_of_frames
+
+    def memory_footprint(self) -> int:
+        """
+        Calculates the total memory held by the atlas pixel buffer.
+        Frames are subsurfaces of the atlas so do not add to the total.
+
+        :return: :class:`int` size of the atlas in bytes
+        """
+        return self.atlas.get_width() * self.atlas.get_height() * self.atlas.get_bytesize()
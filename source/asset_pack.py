@@ -0,0 +1,69 @@
+import argparse
+import os
+import time
+
+import pygame
+
+from .assets import assets, AssetPack, PACK_PATH
+from .game import Game, SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+def build(path: str = PACK_PATH) -> int:
+    """
+    Loads every image in :func:`source.game.Game.image_loaders` from its PNG, scaled or built to
+    the size it is drawn at, and bakes them into an asset pack. The display mode must have been set.
+
+    :param path: Optional[:class:`str`] path to write the pack to, :data:`source.assets.PACK_PATH` if unspecified
+    :return: :class:`int` number of images written
+    """
+    use_pack = assets.use_pack
+    assets.use_pack = False
+    assets.clear()
+    try:
+        for loader in Game.image_loaders():
+            loader()
+        AssetPack.write(path, assets.images)
+        return len(assets.images)
+    finally:
+        assets.clear()
+        assets.use_pack = use_pack
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    :return: :class:`argparse.Namespace` of arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="python3 -m source.asset_pack",
+        description="Bakes the game's images at their drawn size into a pack for fast startup.",
+    )
+    parser.add_argument(
+        "--output", default=PACK_PATH, help="file to write, the game's pack by default"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    Builds the asset pack headlessly and prints its size.
+
+    :return: `None`
+    """
+    arguments = parse_arguments()
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    start = time.perf_counter()
+    images = build(arguments.output)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{images} images, {os.path.getsize(arguments.output) / 1024:.0f} KB "
+        f"written to {arguments.output} in {elapsed:.2f}s"
+    )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
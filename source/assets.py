@@ -0,0 +1,343 @@
+import os
+import json
+import mmap
+import zlib
+import struct
+import pygame
+import typing
+import threading
+import importlib_resources as resources
+
+from .rotation_cache import surface_size_in_bytes
+
+# Constants
+IMAGE_PACKAGE = "source.images"
+FONT_PACKAGE = "source.fonts"
+# Baked images written by ``python -m source.asset_pack``, loaded in place of the PNGs when present
+PACK_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "images", "assets.pack"
+)
+PACK_MAGIC = b"MDAP"
+PACK_VERSION = 1
+# Magic, version and the length in bytes of the JSON index which follows it
+PACK_HEADER = struct.Struct("<4sII")
+# Pixel format of the baked buffers, supported by pygame.image.frombuffer on every pygame version
+PACK_FORMAT = "RGBA"
+
+
+def resource_path(package: str, name: str) -> str:
+    """
+    Resolves the path of a file inside a package, relative to the working directory.
+
+    :param package: :class:`str` package path to resource
+    :param name: :class:`str` filename of resource
+    :return: :class:`str` path of the resource
+    """
+    with resources.path(package, name) as path:
+        return os.path.relpath(path)
+
+
+def source_checksum(package: str, name: str) -> typing.Tuple[int, int]:
+    """
+    Gets the size and CRC-32 of a resource file, used to tell whether a baked copy is stale.
+
+    :param package: :class:`str` package path to resource
+    :param name: :class:`str` filename of resource
+    :return: :class:`tuple`[:class:`int`] size in bytes and CRC-32 of the file
+    """
+    data = resources.read_binary(package, name)
+    return len(data), zlib.crc32(data)
+
+
+class AssetPack:
+    """
+    Read only view of an asset pack, a single file of images baked at their final size by
+    ``python -m source.asset_pack``. The file starts with a :data:`PACK_HEADER` and a JSON index
+    of every image, followed by their raw :data:`PACK_FORMAT` pixels. The file is memory mapped
+    and each image is made with :func:`pygame.image.frombuffer` straight from the mapping, so
+    nothing is decoded or scaled at startup.
+
+    Each index entry records the size and CRC-32 of the PNG it was baked from, an image whose
+    PNG has since changed is treated as missing and loaded from the PNG instead.
+
+    :param path: :class:`str` path of the pack file
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_length = PACK_HEADER.unpack_from(self.buffer)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.buffer.close()
+            raise ValueError(f"{path} is not a version {PACK_VERSION} asset pack")
+        index_end = PACK_HEADER.size + index_length
+        self.entries = {
+            self.key(entry["package"], entry["name"], entry["size"]): entry
+            for entry in json.loads(self.buffer[PACK_HEADER.size : index_end])
+        }
+        self.data_offset = index_end
+        # Whether each source file still matches, keyed by package and filename
+        self.fresh = {}
+
+    @classmethod
+    def open(cls, path: str = PACK_PATH) -> typing.Optional["AssetPack"]:
+        """
+        Opens an asset pack if one has been built.
+
+        :param path: Optional[:class:`str`] path of the pack file, :data:`PACK_PATH` if unspecified
+        :return: Optional[:class:`source.assets.AssetPack`], `None` if the file is missing or unreadable
+        """
+        try:
+            return cls(path)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    @staticmethod
+    def key(
+        package: str, name: str, size: typing.Optional[typing.Sequence[int]]
+    ) -> typing.Tuple[str, str, typing.Optional[typing.Tuple[int, int]]]:
+        """
+        Gets the key of an image, the same as used by :class:`source.assets.AssetRegistry`.
+
+        :param package: :class:`str` package path to the image
+        :param name: :class:`str` filename of the image
+        :param size: Optional sequence of :class:`int` width and height the image was baked for
+        :return: :class:`tuple` key of the image
+        """
+        return package, name, None if size is None else tuple(size)
+
+    @staticmethod
+    def write(path: str, images: dict) -> None:
+        """
+        Writes images to a new asset pack, replacing any existing file.
+
+        :param path: :class:`str` path of the pack file
+        :param images: :class:`dict` of :class:`pygame.Surface` keyed by package, filename and size
+        :return: `None`
+        """
+        index = []
+        pixels = []
+        offset = 0
+        for (package, name, size), surface in images.items():
+            source_size, source_crc = source_checksum(package, name)
+            data = pygame.image.tostring(surface, PACK_FORMAT)
+            index.append(
+                {
+                    "package": package,
+                    "name": name,
+                    "size": size,
+                    "width": surface.get_width(),
+                    "height": surface.get_height(),
+                    "source_size": source_size,
+                    "source_crc": source_crc,
+                    "offset": offset,
+                }
+            )
+            pixels.append(data)
+            offset += len(data)
+
+        index_data = json.dumps(index).encode("utf-8")
+        with open(path, "wb") as file:
+            file.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_data)))
+            file.write(index_data)
+            for data in pixels:
+                file.write(data)
+
+    def is_fresh(self, entry: dict) -> bool:
+        """
+        Checks an image was baked from the current version of its PNG.
+
+        :param entry: :class:`dict` index entry of the image
+        :return: :class:`bool` whether the PNG is unchanged
+        """
+        source = (entry["package"], entry["name"])
+        fresh = self.fresh.get(source)
+        if fresh is None:
+            try:
+                fresh = source_checksum(*source) == (
+                    entry["source_size"],
+                    entry["source_crc"],
+                )
+            except OSError:
+                fresh = False
+            self.fresh[source] = fresh
+        return fresh
+
+    def get(
+        self,
+        package: str,
+        name: str,
+        size: typing.Optional[typing.Tuple[int, int]] = None,
+    ) -> typing.Optional[pygame.Surface]:
+        """
+        Gets a baked image, converted for fast blitting. The display mode must have been set.
+
+        :param package: :class:`str` package path to the image
+        :param name: :class:`str` filename of the image
+        :param size: Optional[:class:`tuple`[:class:`int`]] width and height the image was baked for
+        :return: Optional[:class:`pygame.Surface`], `None` if the image is not in the pack or is stale
+        """
+        entry = self.entries.get(self.key(package, name, size))
+        if entry is None or not self.is_fresh(entry):
+            return None
+        width, height = entry["width"], entry["height"]
+        start = self.data_offset + entry["offset"]
+        data = memoryview(self.buffer)[start : start + width * height * 4]
+        # convert_alpha copies the pixels, so the surface does not outlive the mapping
+        return pygame.image.frombuffer(data, (width, height), PACK_FORMAT).convert_alpha()
+
+
+class AssetRegistry:
+    """
+    Process-wide store of every font and image the game loads, so each file is only read from disk
+    the first time it is requested and every later request returns the same shared object.
+
+    Fonts are keyed by package, filename and size. Images are converted for fast blitting with
+    :func:`pygame.Surface.convert_alpha`, and are keyed by package, filename and the size they are
+    scaled to, only the scaled surface being kept. Shared surfaces must not be drawn onto.
+    Hits, misses and the bytes held, pixel buffers for images and file sizes for fonts,
+    are counted for the :class:`source.profiler.FrameProfiler` overlay.
+
+    Images are taken from the :class:`source.assets.AssetPack` at :data:`PACK_PATH` when it has been
+    built and holds an up to date copy, counted in :attr:`source.assets.AssetRegistry.pack_loads`,
+    otherwise they are loaded from their PNG. Images not yet held may be requested from several
+    threads at once, such as by the :class:`source.preload.Preloader`.
+    """
+
+    def __init__(self) -> None:
+        self.fonts = {}
+        self.images = {}
+        self.bytes_held = 0
+        self.hits = 0
+        self.misses = 0
+        self.pack_loads = 0
+        # Set to False to always load from the PNGs, such as when building the pack
+        self.use_pack = True
+        # Opened on the first image miss, False once found to be missing
+        self.pack = None
+        # Held while opening the pack and adding images, which may be loaded on worker threads
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Gets the number of fonts and images currently held by the registry.
+
+        :return: :class:`int` number of assets held
+        """
+        return len(self.fonts) + len(self.images)
+
+    def clear(self) -> None:
+        """
+        Removes every font and image from the registry.
+
+        :return: `None`
+        """
+        self.fonts.clear()
+        self.images.clear()
+        self.bytes_held = 0
+
+    def font(self, package: str, name: str, size: int) -> pygame.font.Font:
+        """
+        Gets a shared font, loading it on the first request.
+
+        :param package: :class:`str` package path to the font
+        :param name: :class:`str` filename of the font
+        :param size: :class:`int` height of the font in pixels
+        :return: :class:`pygame.font.Font`
+        """
+        key = (package, name, size)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        path = resource_path(package, name)
+        font = pygame.font.Font(path, size)
+        self.fonts[key] = font
+        self.bytes_held += os.path.getsize(path)
+        return font
+
+    def load_image(self, package: str, name: str) -> pygame.Surface:
+        """
+        Loads and converts an image without keeping it in the registry, for large images that
+        are only used once to build something else, such as the enemy spritesheet.
+        The display mode must have been set.
+
+        :param package: :class:`str` package path to the image
+        :param name: :class:`str` filename of the image
+        :return: :class:`pygame.Surface` containing the image, with per pixel alpha
+        """
+        return pygame.image.load(resource_path(package, name)).convert_alpha()
+
+    def load_packed_image(
+        self,
+        package: str,
+        name: str,
+        size: typing.Optional[typing.Tuple[int, int]] = None,
+    ) -> typing.Optional[pygame.Surface]:
+        """
+        Loads an image from the asset pack, opening the pack on the first call.
+
+        :param package: :class:`str` package path to the image
+        :param name: :class:`str` filename of the image
+        :param size: Optional[:class:`tuple`[:class:`int`]] width and height of the image
+        :return: Optional[:class:`pygame.Surface`], `None` if the pack is disabled, missing or does not hold the image
+        """
+        if not self.use_pack:
+            return None
+        with self.lock:
+            if self.pack is None:
+                self.pack = AssetPack.open() or False
+        if self.pack is False:
+            return None
+        surface = self.pack.get(package, name, size)
+        if surface is not None:
+            with self.lock:
+                self.pack_loads += 1
+        return surface
+
+    def image(
+        self,
+        package: str,
+        name: str,
+        size: typing.Optional[typing.Tuple[int, int]] = None,
+        build: typing.Optional[
+            typing.Callable[[pygame.Surface], pygame.Surface]
+        ] = None,
+    ) -> pygame.Surface:
+        """
+        Gets a shared converted image, loading and scaling it on the first request.
+        The display mode must have been set.
+
+        :param package: :class:`str` package path to the image
+        :param name: :class:`str` filename of the image
+        :param size: Optional[:class:`tuple`[:class:`int`]] width and height to scale the image to, its original size if unspecified
+        :param build: Optional callable making the image from the full size file in place of scaling it,
+            such as an animation atlas, which must return a surface of the given size
+        :return: :class:`pygame.Surface` containing the image, with per pixel alpha
+        """
+        key = (package, name, size)
+        surface = self.images.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        surface = self.load_packed_image(package, name, size)
+        if surface is None:
+            surface = self.load_image(package, name)
+            if build is not None:
+                surface = build(surface)
+            elif size is not None:
+                surface = pygame.transform.scale(surface, size)
+        with self.lock:
+            self.misses += 1
+            # Another thread may have loaded the same image in the meantime
+            if key not in self.images:
+                self.images[key] = surface
+                self.bytes_held += surface_size_in_bytes(surface)
+            return self.images[key]
+
+
+# Shared instance used by the whole game
+assets = AssetRegistry()
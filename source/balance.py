@@ -1,6 +1,8 @@
 import pygame
+import typing
 
-from . import utils
+from .hud import WHITE
+from .text_cache import get_text_cache
 
 PADDING = 2
 BALANCE_LENGTH = 8
@@ -28,7 +30,7 @@ class Balance:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.font_size = font_size
-        self.font = utils.load_font("source.fonts", "fixedsys.ttf", self.font_size)
+        self.text_cache = get_text_cache(self.font_size, WHITE)
         self.value = 0
 
     def increment(self, amount: int) -> None:
@@ -59,15 +61,37 @@ class Balance:
         zero_padding = "0" * (BALANCE_LENGTH - len(str_balance))
         return "CREDITS " + zero_padding + str_balance
 
-    def update(self) -> None:
+    def step(self) -> None:
         """
-        Renders the balance onto the game surface.
+        The balance has no per-frame state to advance, it only changes when incremented or decremented.
 
         :return: `None`
         """
-        text_surface = self.font.render(
-            self.balance_to_text(), True, pygame.Color("#ffffff")
-        )
+
+    def blits(self) -> typing.List[typing.Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Gets the rendered balance and where it is drawn, the text is only rasterized when the balance changes.
+
+        :return: :class:`list` of :class:`tuple` of :class:`pygame.Surface` and :class:`pygame.Rect`
+        """
+        text_surface = self.text_cache.render(self.balance_to_text())
         text_rect = text_surface.get_rect()
         text_rect.topright = (self.screen_width - PADDING, PADDING + self.font_size)
-        self.game_surface.blit(text_surface, text_rect)
+        return [(text_surface, text_rect)]
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draws the balance onto the game surface.
+
+        :param alpha: Optional[:class:`float`] interpolation factor, unused as the balance does not move
+        :return: `None`
+        """
+        self.game_surface.blits(self.blits(), False)
+
+    def update(self) -> None:
+        """
+        Renders the balance onto the game surface.
+
+        :return: `None`
+        """
+        self.draw()
@@ -0,0 +1,99 @@
+import math
+import pygame
+import typing
+
+
+def intercept_time(
+    a_x: float,
+    a_y: float,
+    a_width: float,
+    a_height: float,
+    b_x: float,
+    b_y: float,
+    b_width: float,
+    b_height: float,
+    displacement_x: float,
+    displacement_y: float,
+) -> typing.Optional[float]:
+    """
+    Swept axis-aligned bounding box test. Box :math:`a` moves by a displacement relative to
+    box :math:`b` over a step, the time each axis starts and stops overlapping is solved
+    directly, and the boxes touch while both axes overlap. Boxes that only share an edge
+    are not colliding, matching :func:`pygame.Rect.colliderect`.
+
+    :param a_x: :math:`x` position of box a at the start of the step
+    :param a_y: :math:`y` position of box a at the start of the step
+    :param a_width: Width of box a
+    :param a_height: Height of box a
+    :param b_x: :math:`x` position of box b at the start of the step
+    :param b_y: :math:`y` position of box b at the start of the step
+    :param b_width: Width of box b
+    :param b_height: Height of box b
+    :param displacement_x: :math:`x` distance box a moves relative to box b over the step
+    :param displacement_y: :math:`y` distance box a moves relative to box b over the step
+    :return: Optional[:class:`float`] fraction of the step between 0 and 1 at which the boxes first overlap,
+        `None` if they do not overlap during the step
+    """
+    entry, exit_ = -math.inf, math.inf
+    for start, size, other_start, other_size, displacement in (
+        (a_x, a_width, b_x, b_width, displacement_x),
+        (a_y, a_height, b_y, b_height, displacement_y),
+    ):
+        # Distances box a must travel along the axis to start and stop overlapping box b
+        near = other_start - (start + size)
+        far = other_start + other_size - start
+        if displacement == 0:
+            if near >= 0 or far <= 0:
+                return None
+            continue
+        if displacement > 0:
+            entry = max(entry, near / displacement)
+            exit_ = min(exit_, far / displacement)
+        else:
+            entry = max(entry, far / displacement)
+            exit_ = min(exit_, near / displacement)
+    if entry >= exit_ or entry > 1 or exit_ <= 0:
+        return None
+    return max(entry, 0.0)
+
+
+def contact_time(mover, target) -> typing.Optional[float]:
+    """
+    Finds when two moving instances first touch during the last step, from their
+    previous and current positions and the size of their images.
+
+    :param mover: An object with x, y, previous_x, previous_y and image attributes, such as a :class:`source.missile.Missile`
+    :param target: An object with the same attributes, such as a :class:`source.enemy.Enemy`
+    :return: Optional[:class:`float`] fraction of the step at which they first touch, `None` if they do not
+    """
+    mover_width, mover_height = mover.image.get_size()
+    target_width, target_height = target.image.get_size()
+    target_previous_x, target_previous_y = target.previous_x, target.previous_y
+    return intercept_time(
+        mover.previous_x,
+        mover.previous_y,
+        mover_width,
+        mover_height,
+        target_previous_x,
+        target_previous_y,
+        target_width,
+        target_height,
+        (mover.x - mover.previous_x) - (target.x - target_previous_x),
+        (mover.y - mover.previous_y) - (target.y - target_previous_y),
+    )
+
+
+def get_swept_rect_of_instance(instance) -> pygame.Rect:
+    """
+    Gets the :class:`pygame.Rect` covering an instance's image at every point between its
+    previous and current positions, used as the broad-phase bounds of a swept test.
+
+    :param instance: An object with x, y, previous_x, previous_y and image attributes
+    :return: :class:`pygame.Rect` bounding the instance's movement over the last step
+    """
+    width, height = instance.image.get_size()
+    left = math.floor(min(instance.previous_x, instance.x))
+    top = math.floor(min(instance.previous_y, instance.y))
+    right = math.ceil(max(instance.previous_x, instance.x) + width)
+    bottom = math.ceil(max(instance.previous_y, instance.y) + height)
+    return pygame.Rect(left, top, right - left, bottom - top)
@@ -0,0 +1,151 @@
+import os
+import pygame
+import typing
+
+# Constants
+ENVIRONMENT_VARIABLE = "MISSILE_DEFENCE_DIRTY_RECTS"
+# Fraction of the screen which, once dirty, is cheaper to push with a single flip than by area
+FULL_UPDATE_FRACTION = 0.5
+
+
+class DirtyRectScreen:
+    """
+    Stands in for the display :class:`pygame.Surface`, recording the area of every blit made onto it
+    so that only the parts of the screen that changed are redrawn and pushed to the window.
+
+    Each frame :func:`source.dirty_rects.DirtyRectScreen.restore` covers everything drawn the previous
+    frame with the matching area of the background, the controllers then draw as normal, and
+    :func:`source.dirty_rects.DirtyRectScreen.present` updates the window with both the previous and
+    current areas, where an instance was and where it now is. Once the dirty areas cover more than
+    :data:`FULL_UPDATE_FRACTION` of the screen the whole background is restored and the display flipped
+    instead. Any other attribute is read from the display surface.
+
+    :param screen: The display :class:`pygame.Surface`
+    :param background: :class:`pygame.Surface` the same size as the screen drawn behind everything
+    :param full_update_fraction: Optional[:class:`float`] fraction of the screen above which the display is flipped
+    """
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        background: pygame.Surface,
+        full_update_fraction: float = FULL_UPDATE_FRACTION,
+    ) -> None:
+        self.screen = screen
+        self.background = background
+        self.screen_rect = screen.get_rect()
+        self.full_update_area = (
+            full_update_fraction * self.screen_rect.width * self.screen_rect.height
+        )
+        self.rects = []
+        self.previous_rects = []
+        # The screen's contents are unknown until the whole background has been drawn once
+        self.full_update = True
+        # Counts frames pushed by area and by a full flip, for profiling
+        self.partial_updates = 0
+        self.full_updates = 0
+
+    @classmethod
+    def from_environment(
+        cls, screen: pygame.Surface, background: pygame.Surface
+    ) -> typing.Optional["DirtyRectScreen"]:
+        """
+        Creates a dirty rect screen if the ``MISSILE_DEFENCE_DIRTY_RECTS`` environment variable is set.
+
+        :param screen: The display :class:`pygame.Surface`
+        :param background: :class:`pygame.Surface` drawn behind everything
+        :return: Optional[:class:`source.dirty_rects.DirtyRectScreen`], `None` if the variable is not set
+        """
+        if not os.environ.get(ENVIRONMENT_VARIABLE):
+            return None
+        return cls(screen, background)
+
+    def __getattr__(self, name: str):
+        return getattr(self.screen, name)
+
+    def blit(
+        self,
+        source: pygame.Surface,
+        dest,
+        area: typing.Optional[pygame.Rect] = None,
+        special_flags: int = 0,
+    ) -> pygame.Rect:
+        """
+        Blits onto the screen, matching :func:`pygame.Surface.blit`, and records the area drawn.
+
+        :return: :class:`pygame.Rect` of the area drawn
+        """
+        rect = self.screen.blit(source, dest, area, special_flags)
+        self.rects.append(rect)
+        return rect
+
+    def blits(
+        self, blit_sequence: typing.Iterable, doreturn: bool = True
+    ) -> typing.Optional[typing.List[pygame.Rect]]:
+        """
+        Blits a sequence onto the screen, matching :func:`pygame.Surface.blits`, and records the areas drawn.
+
+        :return: Optional[:class:`list`] of :class:`pygame.Rect` drawn if doreturn is set
+        """
+        rects = self.screen.blits(blit_sequence, True)
+        self.rects.extend(rects)
+        return rects if doreturn else None
+
+    def fill(
+        self, color, rect: typing.Optional[pygame.Rect] = None, special_flags: int = 0
+    ) -> pygame.Rect:
+        """
+        Fills the screen, matching :func:`pygame.Surface.fill`, and records the area filled.
+
+        :return: :class:`pygame.Rect` of the area filled
+        """
+        rect = self.screen.fill(color, rect, special_flags)
+        self.rects.append(rect)
+        return rect
+
+    def invalidate(self) -> None:
+        """
+        Marks the whole screen as dirty, such as when the window has been uncovered,
+        so the next frame is drawn and pushed in full.
+
+        :return: `None`
+        """
+        self.full_update = True
+
+    def restore(self) -> None:
+        """
+        Draws the background over everything drawn in the previous frame, or over the whole screen
+        if most of it was drawn or it has been invalidated. Called before the controllers draw each frame.
+
+        :return: `None`
+        """
+        self.previous_rects = self.rects
+        self.rects = []
+        if self.full_update:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            background = self.background
+            self.screen.blits(
+                [(background, rect, rect) for rect in self.previous_rects], False
+            )
+
+    def present(self) -> None:
+        """
+        Pushes the areas drawn in the previous and current frame to the window, or flips the whole
+        display if they cover too much of the screen or the screen has been invalidated.
+
+        :return: `None`
+        """
+        dirty_rects = self.previous_rects + self.rects
+        too_large = (
+            sum(rect.width * rect.height for rect in dirty_rects)
+            > self.full_update_area
+        )
+        if self.full_update or too_large:
+            pygame.display.flip()
+            self.full_updates += 1
+        else:
+            pygame.display.update(dirty_rects)
+            self.partial_updates += 1
+        # When most of the screen was drawn it is cheaper to restore the whole background next frame
+        self.full_update = too_large
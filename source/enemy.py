@@ -1,8 +1,12 @@
+import math
 import pygame
 import random
 import typing
 
 from . import utils
+from .animation import AnimationClip
+from .rotation_cache import rotation_cache
+from .assets import assets, IMAGE_PACKAGE
 
 # Constants
 SPRITE_WIDTH = 25
@@ -11,6 +15,25 @@ ENEMY_VELOCITY = 2
 ANGLE_OFFSET = 270
 NUMBER_OF_FRAMES = 14
 FRAME_SIZE = (210, 387)
+FRAME_STRIDE = 220
+FRAME_OFFSET = (5, 5)
+# Stationary course given to enemies allocated ahead of a wave, so that creating them draws
+# no random numbers, their real course is set when they are acquired
+RESERVED_COURSE = (0, 0, 0, 0, 0.0, 0.0)
+# Attributes needed to recreate an enemy mid-flight
+SNAPSHOT_ATTRIBUTES = (
+    "start_x",
+    "start_y",
+    "spawn_frame",
+    "impact_frame",
+    "end_x",
+    "end_y",
+    "velocity_x",
+    "velocity_y",
+    "visible",
+    "hit_ground",
+    "angle",
+)
 
 
 class Enemy(pygame.sprite.Sprite):
@@ -18,15 +41,24 @@ class Enemy(pygame.sprite.Sprite):
     Represents a game enemy, what the player is trying to prevent
     from reaching the bottom of the screen.
 
+    Enemies move in a straight line at a constant velocity, so rather than being moved each
+    frame their position is calculated from the frames elapsed since they spawned, read from
+    the wave they belong to. The frame they reach the ground is calculated when they spawn,
+    allowing the wave to schedule the impact instead of checking every enemy every frame.
+
     :param sprite_group: The :class:`pygame.sprite.Group` that the enemy is a part of
     :param game_surface: The :class:`pygame.Surface` to blit the sprite onto
     :param screen_width: :class:`int` width of the screen in pixels
     :param screen_height: :class:`int` height of the screen in pixels
     :param hit_ground_func: Method called when the enemy reaches the bottom of the screen
-    :param mark_wave_incomplete_func: Method called to mark the wave incomplete while the enemy is still visible
+    :param rng: Optional[:class:`random.Random`] random number generator to draw positions from, the global :mod:`random` module if unspecified
+    :param course: Optional[:class:`tuple`] of start x, start y, end x, end y, velocity x, velocity y to use instead of drawing random positions,
+        see :func:`source.wave_plan.WavePlan.course`
+    :param wave: Optional[:class:`source.wave.Wave`] the enemy belongs to, whose frame counter positions are calculated from,
+        the enemy stays at its start position if unspecified
     """
 
-    spritesheet = None
+    animation = None
 
     def __init__(
         self,
@@ -35,43 +67,110 @@ class Enemy(pygame.sprite.Sprite):
         screen_width: int,
         screen_height: int,
         hit_ground_func: typing.Callable,
-        mark_wave_incomplete_func: typing.Callable,
+        rng: random.Random = None,
+        course: typing.Optional[tuple] = None,
+        wave=None,
     ) -> None:
-        super().__init__(sprite_group)
+        super().__init__()
+
+        if Enemy.animation is None:
+            Enemy.animation = Enemy.load_animation()
+
+        self.reset(
+            sprite_group,
+            game_surface,
+            screen_width,
+            screen_height,
+            hit_ground_func,
+            rng,
+            course,
+            wave,
+        )
 
-        if Enemy.spritesheet is None:
-            Enemy.spritesheet = utils.load_image(
-                "source.images", "enemy_spritesheet.png"
-            ).convert_alpha()
-        self.asset = Enemy.spritesheet
+    def reset(
+        self,
+        sprite_group: typing.Optional[pygame.sprite.Group],
+        game_surface: pygame.Surface,
+        screen_width: int,
+        screen_height: int,
+        hit_ground_func: typing.Callable,
+        rng: random.Random = None,
+        course: typing.Optional[tuple] = None,
+        wave=None,
+    ) -> None:
+        """
+        Reinitialises the enemy as if it had just spawned, adding it to the sprite group, allowing it
+        to be reused by a :class:`source.pool.ObjectPool`. Takes the same parameters as the constructor.
 
+        :return: `None`
+        """
+        if sprite_group is not None:
+            self.add(sprite_group)
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.game_surface = game_surface
         self.hit_ground_func = hit_ground_func
-        self.mark_wave_incomplete_func = mark_wave_incomplete_func
-        self.generate_positions_and_velocities()
+        self.rng = random if rng is None else rng
+        self.wave = wave
+        if course is None:
+            self.generate_positions_and_velocities()
+        else:
+            self.set_course(*course)
         self.visible = True
-        self.respawn = False
         self.hit_ground = False
-        self.current_frame = 0
         self.score_value = 150
         self.balance_value = 5
 
-        self.frames = []
-        self.create_animation_frames()
+        self.angle = 0
         self.rotate_all_frames()
 
-        self.image: pygame.Surface
+        self.image = self.current_frame_image()
 
-    def create_animation_frames(self) -> None:
+    @staticmethod
+    def load_animation() -> AnimationClip:
         """
-        Takes the spritesheet and splits it into a list of animation frames.
+        Gets the enemy animation, its spritesheet downscaled into an atlas which is shared through
+        the :class:`source.assets.AssetRegistry`. Only called once, the clip is shared by all enemies
+        and the full size spritesheet is discarded.
 
-        :return: `None`
+        :return: :class:`source.animation.AnimationClip` of the enemy animation
+        """
+        atlas = assets.image(
+            IMAGE_PACKAGE,
+            "enemy_spritesheet.png",
+            (SPRITE_WIDTH * NUMBER_OF_FRAMES, SPRITE_HEIGHT),
+            lambda spritesheet: AnimationClip.build_atlas(
+                spritesheet,
+                NUMBER_OF_FRAMES,
+                FRAME_SIZE,
+                FRAME_STRIDE,
+                FRAME_OFFSET,
+                (SPRITE_WIDTH, SPRITE_HEIGHT),
+            ),
+        )
+        return AnimationClip(atlas, NUMBER_OF_FRAMES)
+
+    @staticmethod
+    def possible_angles(screen_width: int, screen_height: int) -> typing.List[float]:
+        """
+        Gets every quantized angle a randomly spawned enemy can be drawn at, flying from anywhere
+        along the top of the screen to anywhere along the bottom.
+
+        :param screen_width: :class:`int` width of the screen
+        :param screen_height: :class:`int` height of the screen
+        :return: :class:`list` of :class:`float` angles in degrees
         """
-        for x in range(NUMBER_OF_FRAMES):
-            self.frames.append(self.asset.subsurface(((5 + x * 220, 5), FRAME_SIZE)))
+        furthest = screen_width - SPRITE_WIDTH
+        return sorted(
+            {
+                rotation_cache.quantize(
+                    utils.get_angle_positions(
+                        0, 0, offset, screen_height - SPRITE_HEIGHT, ANGLE_OFFSET
+                    )
+                )
+                for offset in range(-furthest, furthest + 1)
+            }
+        )
 
     def random_start_position(self) -> typing.Tuple[int, int]:
         """
@@ -79,7 +178,7 @@ class Enemy(pygame.sprite.Sprite):
 
         :return: :class:`tuple`[:class:`int`] x, y coordinate
         """
-        return random.randint(0, self.screen_width - SPRITE_WIDTH), 0
+        return self.rng.randint(0, self.screen_width - SPRITE_WIDTH), 0
 
     def random_aim_position(self) -> typing.Tuple[int, int]:
         """
@@ -89,7 +188,7 @@ class Enemy(pygame.sprite.Sprite):
         :return: :class:`tuple`[:class:`int`] x, y coordinate
         """
         return (
-            random.randint(0, self.screen_width - SPRITE_WIDTH),
+            self.rng.randint(0, self.screen_width - SPRITE_WIDTH),
             self.screen_height - SPRITE_HEIGHT,
         )
 
@@ -100,80 +199,188 @@ class Enemy(pygame.sprite.Sprite):
 
         :return: `None`
         """
-        self.x, self.y = self.random_start_position()
-        self.end_x, self.end_y = self.random_aim_position()
-        self.velocity_x, self.velocity_y = utils.vector_from_positions(
-            self.x, self.y, self.end_x, self.end_y, ENEMY_VELOCITY
+        start_x, start_y = self.random_start_position()
+        end_x, end_y = self.random_aim_position()
+        self.set_course(
+            start_x,
+            start_y,
+            end_x,
+            end_y,
+            *utils.vector_from_positions(start_x, start_y, end_x, end_y, ENEMY_VELOCITY),
         )
 
-    def move(self) -> None:
+    def set_course(
+        self,
+        start_x: int,
+        start_y: int,
+        end_x: int,
+        end_y: int,
+        velocity_x: float,
+        velocity_y: float,
+    ) -> None:
         """
-        Moves the enemy by the amount defined by its velocity.
+        Places the enemy at a start position on the current frame, moving with a given velocity
+        towards an end position, and calculates the frame it will reach the ground.
 
+        :param start_x: :math:`x` position to start at
+        :param start_y: :math:`y` position to start at
+        :param end_x: :math:`x` position aimed towards
+        :param end_y: :math:`y` position aimed towards
+        :param velocity_x: :math:`x` component of the velocity
+        :param velocity_y: :math:`y` component of the velocity
         :return: `None`
         """
-        self.x += self.velocity_x
-        self.y += self.velocity_y
+        self.start_x, self.start_y = start_x, start_y
+        self.spawn_frame = self.current_wave_frame()
+        self.end_x, self.end_y = end_x, end_y
+        self.velocity_x, self.velocity_y = velocity_x, velocity_y
+        self.impact_frame = self.calculate_impact_frame()
+
+    def current_wave_frame(self) -> int:
+        """
+        Gets the current frame of the wave the enemy belongs to.
+
+        :return: :class:`int` frames since the wave started, 0 if the enemy has no wave
+        """
+        return 0 if self.wave is None else self.wave.frames_since_start
+
+    def calculate_impact_frame(self) -> typing.Optional[int]:
+        """
+        Calculates the frame of the wave on which the enemy reaches the bottom of the screen.
+
+        :return: Optional[:class:`int`] frame of the impact, `None` if the enemy never reaches the ground
+        """
+        ground = self.screen_height - SPRITE_HEIGHT
+        if self.start_y >= ground:
+            return self.spawn_frame
+        if self.velocity_y <= 0:
+            return None
+        frames = math.ceil((ground - self.start_y) / self.velocity_y)
+        # Corrects for rounding so that the impact agrees with the position reported by y
+        while frames > 0 and self.start_y + self.velocity_y * (frames - 1) >= ground:
+            frames -= 1
+        while self.start_y + self.velocity_y * frames < ground:
+            frames += 1
+        return self.spawn_frame + frames
+
+    def elapsed_frames(self) -> int:
+        """
+        Gets the number of frames the enemy has been moving for.
+
+        :return: :class:`int` frames since the enemy spawned
+        """
+        return self.current_wave_frame() - self.spawn_frame
+
+    @property
+    def x(self) -> float:
+        return self.start_x + self.velocity_x * self.elapsed_frames()
+
+    @property
+    def y(self) -> float:
+        return self.start_y + self.velocity_y * self.elapsed_frames()
+
+    @property
+    def previous_x(self) -> float:
+        return self.start_x + self.velocity_x * max(self.elapsed_frames() - 1, 0)
+
+    @property
+    def previous_y(self) -> float:
+        return self.start_y + self.velocity_y * max(self.elapsed_frames() - 1, 0)
+
+    @property
+    def current_frame(self) -> int:
+        """
+        The index of the animation frame shown, advancing one frame per simulation step since
+        the enemy spawned, like its position, so it is independent of how often it is drawn.
+        """
+        return Enemy.animation.frame_index(self.elapsed_frames())
 
     def rotate_all_frames(self) -> None:
         """
-        Rotates all frames of the enemy animation to point towards the enemy's aim position.
+        Sets the angle the frames of the enemy animation are drawn at so that they point
+        towards the enemy's aim position.
 
         :return: `None`
         """
-        fixed_frames = []
-        for frame in self.frames:
-            frame = pygame.transform.scale(frame, (SPRITE_WIDTH, SPRITE_HEIGHT))
-            frame = pygame.transform.rotate(
-                frame,
-                utils.get_angle_positions(
-                    self.x, self.y, self.end_x, self.end_y, ANGLE_OFFSET
-                ),
+        self.angle = rotation_cache.quantize(
+            utils.get_angle_positions(
+                self.x, self.y, self.end_x, self.end_y, ANGLE_OFFSET
             )
-            fixed_frames.append(frame)
-        self.frames = fixed_frames
+        )
 
-    def next_frame(self) -> None:
+    def current_frame_image(self) -> pygame.Surface:
         """
-        Defines the index of the current frame, looping back to 0 once all frames have been shown.
+        Gets the current frame of the animation rotated to the enemy's angle.
+        Rotated frames are fetched from the shared :class:`source.rotation_cache.RotationCache`.
 
-        :return: `None`
+        :return: :class:`pygame.Surface` rotated animation frame
         """
-        self.current_frame += 1
-        if self.current_frame >= len(self.frames):
-            self.current_frame = 0
+        return rotation_cache.get(
+            "enemy",
+            self.current_frame,
+            self.angle,
+            Enemy.animation.frame(self.current_frame),
+        )
 
-    def draw_frame(self) -> None:
+    def frame_blit(
+        self, alpha: float = 1.0
+    ) -> typing.Tuple[pygame.Surface, typing.Tuple[float, float]]:
         """
-        Draws the current frame of the animation onto the game surface
+        Gets the current frame of the animation and the position to draw it at. The position is
+        only calculated once rather than through each of the position properties. Nothing is
+        changed, the animation advances as the simulation steps.
 
-        :return: `None`
+        :param alpha: Optional[:class:`float`] fraction of a step to interpolate the position by
+        :return: :class:`tuple` of the :class:`pygame.Surface` frame and its :math:`x, y` position
+        """
+        elapsed = self.elapsed_frames()
+        frame = Enemy.animation.frame_index(elapsed)
+        current_frame_image = rotation_cache.get(
+            "enemy", frame, self.angle, Enemy.animation.frame(frame)
+        )
+        previous_elapsed = max(elapsed - 1, 0)
+        return (
+            current_frame_image,
+            (
+                utils.interpolate(
+                    self.start_x + self.velocity_x * previous_elapsed,
+                    self.start_x + self.velocity_x * elapsed,
+                    alpha,
+                ),
+                utils.interpolate(
+                    self.start_y + self.velocity_y * previous_elapsed,
+                    self.start_y + self.velocity_y * elapsed,
+                    alpha,
+                ),
+            ),
+        )
+
+    def blits(self, alpha: float = 1.0) -> list:
         """
-        current_frame_image = self.frames[self.current_frame]
-        self.image = current_frame_image
-        self.game_surface.blit(current_frame_image, (self.x, self.y))
-        self.next_frame()
+        Gets the current frame of the animation to draw if the enemy is visible,
+        to be submitted with :func:`pygame.Surface.blits`.
 
-    def update(self) -> None:
+        :param alpha: Optional[:class:`float`] fraction of a step to interpolate the position by
+        :return: :class:`list` of (:class:`pygame.Surface`, position) pairs to draw
         """
-        Updates the enemy's position on the screen, also checks
-        whether or not it has reached the bottom of the screen.
+        if self.visible:
+            return [self.frame_blit(alpha)]
+        return []
 
-        :return: `None`
+    def snapshot(self) -> dict:
         """
-        if self.y >= self.screen_height - SPRITE_HEIGHT:
-            self.velocity_y = 0
-            self.hit_ground = True
+        Copies the enemy's simulation state into a :class:`dict`.
 
-        if self.visible:
-            self.move()
-            self.draw_frame()
-        elif self.respawn:
-            self.generate_positions_and_velocities()
-            self.visible = True
+        :return: :class:`dict` snapshot of the enemy
+        """
+        return utils.snapshot_attributes(self, SNAPSHOT_ATTRIBUTES)
 
-        if self.hit_ground and self.visible:
-            self.hit_ground_func()
-            self.visible = False
-        if self.visible:
-            self.mark_wave_incomplete_func()
+    def restore(self, state: dict) -> None:
+        """
+        Restores the enemy's simulation state from a snapshot.
+
+        :param state: :class:`dict` made by :func:`source.enemy.Enemy.snapshot`
+        :return: `None`
+        """
+        utils.restore_attributes(self, state)
+        self.image = self.current_frame_image()
@@ -1,76 +1,228 @@
 import pygame
 import os
+import time
+import typing
 
-from .game_controller import GameController
+from .game_controller import GameController, FRAME_RATE
 from .menu_controller import MenuController
 from .settings import Settings
-from . import utils
+from .profiler import FrameProfiler
+from .replay import ReplayRecorder
+from .dirty_rects import DirtyRectScreen
+from .assets import assets, IMAGE_PACKAGE
+from .preload import Preloader
+from .rotation_cache import rotation_cache
+from .enemy import Enemy
+from .missile import Missile
+from .reticle import Reticle
+from .tower import Tower
+from .startup import startup_report
 
 # Constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
+# The simulation always advances in steps of this length, whatever the display's refresh rate
+TICK_LENGTH = 1 / FRAME_RATE
+# Longest frame the simulation will catch up on, prevents a spiral of ever longer frames
+MAX_FRAME_TIME = 0.25
+MAX_RENDER_RATE = 240
+# States the game moves through in order, starting again from the menu on restart
+STATES = ("START", "PLAYING", "RESTART", "QUIT")
 
 
 class Game:
     """
     Class to initialise pygame and contain the main game loop.
     Initialises the game surface and the :class:`pygame.time.Clock`.
+
+    :param headless: Optional[:class:`bool`] whether to run without a display, using the SDL dummy video driver
     """
 
-    def __init__(self) -> None:
+    def __init__(self, headless: bool = False) -> None:
+        self.headless = headless
+        # Prints how long startup took once the first frame is drawn, if enabled
+        self.startup_report = startup_report
         # Centre the game window on the monitor
         os.environ['SDL_VIDEO_CENTERED'] = '1'
+        if self.headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
         # Initialise pygame and set the game window caption
         pygame.init()
         pygame.display.set_caption("Missile Defence")
+        self.startup_report.mark("pygame initialised")
         # Create a default instance of settings
         self.settings = Settings()
 
-        self.states = ["START", "PLAYING", "RESTART", "QUIT"]
+        self.states = list(STATES)
         self.state = self.states.pop(0)
 
         # Create a display with the dimensions specified by the constants
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.startup_report.mark("display created")
         self.running = True
-        self.restart = False
         self.clock = pygame.time.Clock()
+        # Toggled with F3, writes per-frame timings to CSV when MISSILE_DEFENCE_PROFILE_CSV is set
+        self.profiler = FrameProfiler.from_environment()
+        # Created when play starts if MISSILE_DEFENCE_RECORD is set to a file path, each game
+        # being recorded to its own file numbered by the games finished before it
+        self.recorder = None
+        self.games_finished = 0
+        # Load everything up front behind a loading bar rather than on first use mid game
+        self.preload()
+        self.startup_report.mark("assets preloaded")
         # Create the background surface and fill it with a solid colour (black)
         self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.background.fill(pygame.Color("#000000"))
 
-        stars = utils.load_image("source.images", "stars.png").convert_alpha()
-        stars = pygame.transform.scale(stars, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.background.blit(stars, (0, 0))
+        self.background.blit(Game.load_stars(), (0, 0))
+        # Set when MISSILE_DEFENCE_DIRTY_RECTS is set, the controllers then draw through it so
+        # that only the changed areas of the screen are redrawn and pushed to the window
+        self.dirty_rect_screen = DirtyRectScreen.from_environment(
+            self.screen, self.background
+        )
+        self.game_surface = (
+            self.screen if self.dirty_rect_screen is None else self.dirty_rect_screen
+        )
+
+        # Controllers keyed by state, each only created the first time its state is entered
+        self.controllers = {}
+
+    def controller(self, state: str) -> typing.Union[MenuController, GameController, None]:
+        """
+        Gets the controller of a state, creating it the first time the state is entered, so the menu
+        can be shown without building the game, its highscore database or its worker threads.
+
+        :param state: :class:`str` state of the game, one of :data:`STATES`
+        :return: Union[:class:`source.menu_controller.MenuController`, :class:`source.game_controller.GameController`, `None`]
+            controller of the state, `None` for states without one
+        """
+        controller = self.controllers.get(state)
+        if controller is not None:
+            return controller
 
-        self.controllers = {
-            "START": MenuController(
-                self.screen,
+        if state == "START":
+            controller = MenuController(
+                self.game_surface,
                 SCREEN_WIDTH,
                 SCREEN_HEIGHT,
                 self.settings,
                 self.advance_state,
-            ),
-            "PLAYING": GameController(
-                self.screen,
+            )
+        elif state == "PLAYING":
+            controller = GameController(
+                self.game_surface,
                 SCREEN_WIDTH,
                 SCREEN_HEIGHT,
                 self.settings,
                 self.advance_state,
-            ),
-            "RESTART": None,
-            "QUIT": None,
-        }
+                self.headless,
+                self.profiler,
+            )
+        else:
+            return None
+        self.controllers[state] = controller
+        self.startup_report.mark(f"{state.lower()} controller created")
+        return controller
+
+    @staticmethod
+    def load_stars() -> pygame.Surface:
+        """
+        Gets the starfield drawn behind everything at the size of the screen, shared through
+        the :class:`source.assets.AssetRegistry`.
+
+        :return: :class:`pygame.Surface` of the starfield
+        """
+        return assets.image(IMAGE_PACKAGE, "stars.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
 
     @staticmethod
-    def quit() -> None:
+    def image_loaders() -> typing.Tuple[typing.Callable, ...]:
+        """
+        Gets a function for every image the game draws at a fixed size, each loading its image into
+        the :class:`source.assets.AssetRegistry` when called. Used to preload the images and to
+        build the asset pack.
+
+        :return: :class:`tuple` of callables taking no arguments
+        """
+        return (
+            Game.load_stars,
+            Enemy.load_animation,
+            Missile.load_image,
+            Tower.load_image,
+            Reticle.load_image,
+        )
+
+    def preload(self) -> None:
+        """
+        Loads every image and font and rotates every sprite to each angle it can be drawn at,
+        on worker threads behind a loading bar, so the first wave never stalls on loading.
+
+        :return: `None`
+        """
+        preloader = Preloader(self.screen)
+        preloader.load_fonts()
+        preloader.run("LOADING", Game.image_loaders())
+        if Enemy.animation is None:
+            Enemy.animation = Enemy.load_animation()
+
+        angles = rotation_cache.angles()
+        if not angles:
+            return
+        enemy_angles = Enemy.possible_angles(SCREEN_WIDTH, SCREEN_HEIGHT)
+        preloader.warm_rotations(
+            "PREPARING",
+            [
+                ("missile", 0, Missile.load_image(), angles),
+                ("tower", 0, Tower.load_image(), angles),
+            ]
+            + [
+                ("enemy", frame, Enemy.animation.frame(frame), enemy_angles)
+                for frame in range(len(Enemy.animation))
+            ],
+        )
+
+    def quit(self) -> None:
         """
-        Quit out of pygame. Method can be static as it does not require access
-        to any attributes defined in self.
+        Quit out of pygame, closing the profiler's CSV output and the replay recording
+        if they are being written.
 
         :return: `None`
         """
+        self.close_outputs()
         pygame.quit()
 
+    def close_outputs(self) -> None:
+        """
+        Closes the profiler's CSV output and the replay recording if they are being written.
+
+        :return: `None`
+        """
+        self.profiler.close()
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def restart(self) -> None:
+        """
+        Warm restarts the game back to the menu, resetting the controllers created so far in place.
+        The window, loaded assets, controllers and the highscore worker threads are all kept,
+        so the menu is ready again almost immediately. The time taken is recorded by the profiler.
+        Any replay being recorded is closed, the next game is recorded to a new file.
+
+        :return: `None`
+        """
+        start_time = time.perf_counter()
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+        self.games_finished += 1
+        self.states = list(STATES)
+        self.state = self.states.pop(0)
+        for controller in self.controllers.values():
+            controller.reset()
+        if self.dirty_rect_screen is not None:
+            self.dirty_rect_screen.invalidate()
+        self.profiler.record_restart(time.perf_counter() - start_time)
+
     def advance_state(self) -> None:
         """
         Move the game into the next state.
@@ -85,57 +237,116 @@ class Game:
         game loop. Handles passing of events to the controller as well
         as flipping the display each frame.
 
+        The simulation runs in fixed steps of :data:`TICK_LENGTH` seconds using an accumulator,
+        as many steps as the elapsed time requires, while rendering happens once per loop and
+        interpolates between the last two steps. A slow frame therefore costs smoothness rather
+        than game speed, and fast displays get smoother motion without speeding the game up.
+
         :return: `None`
         """
+        previous_time = time.perf_counter()
+        accumulator = 0.0
         # Create the main game loop, broken out of when the user quits
         while self.running:
-            controller = self.controllers[self.state]
+            controller = self.controller(self.state)
+            recording = self.state == "PLAYING"
+            if recording and self.recorder is None:
+                self.recorder = ReplayRecorder.from_environment(
+                    controller, self.games_finished + 1
+                )
+            recording = recording and self.recorder is not None
 
-            self.screen.blit(self.background, (0, 0))
-            self.clock.tick(60)
+            self.clock.tick(MAX_RENDER_RATE)
+            current_time = time.perf_counter()
+            accumulator += min(current_time - previous_time, MAX_FRAME_TIME)
+            previous_time = current_time
 
             # Get all events occuring at a specific frame
+            restarted = False
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay()
+                elif (
+                    event.type == pygame.VIDEOEXPOSE
+                    and self.dirty_rect_screen is not None
+                ):
+                    self.dirty_rect_screen.invalidate()
                 # Pass the event to the controller to relay instructions
                 # to the other parts of the game if required
+                if recording:
+                    self.recorder.record_event(controller.ticks, event)
                 controller.process_event(event)
 
                 if self.state == "RESTART":
-                    self.running = False
-                    self.restart = True
-                    return
+                    self.restart()
+                    restarted = True
+                    break
                 elif self.state == "QUIT":
                     self.running = False
-                    self.restart = False
                     return
+            # The menu takes over from the next loop, the remaining events were for the last game
+            if restarted:
+                continue
+
+            # Step the simulation as many times as the elapsed time requires
+            while accumulator >= TICK_LENGTH:
+                controller.step_all()
+                if recording:
+                    self.recorder.step(controller)
+                accumulator -= TICK_LENGTH
 
-            # Update all instances required to be updated in any specific frame
-            controller.update_all()
+            # Draw the simulation part way between the last two steps and flip the display,
+            # or only redraw and update the areas that changed when using dirty rects
+            if not self.headless and self.dirty_rect_screen is not None:
+                self.dirty_rect_screen.restore()
+                controller.draw_all(accumulator / TICK_LENGTH)
+                self.profiler.draw(self.dirty_rect_screen)
+                with self.profiler.stage("flip"):
+                    self.dirty_rect_screen.present()
+            elif not self.headless:
+                self.screen.blit(self.background, (0, 0))
+                controller.draw_all(accumulator / TICK_LENGTH)
+                self.profiler.draw(self.screen)
+                with self.profiler.stage("flip"):
+                    pygame.display.flip()
+            self.profiler.end_frame()
+            self.startup_report.finish()
 
-            # Clear the display at the end of each frame
-            pygame.display.flip()
+
+def create_headless_controller(settings: Settings = None) -> GameController:
+    """
+    Initialises pygame with the SDL dummy video driver and creates a headless
+    :class:`source.game_controller.GameController` which only runs the simulation.
+    Used to run many simulated frames quickly for testing and balancing.
+
+    :param settings: Optional[:class:`source.settings.Settings`] to use, the defaults if unspecified
+    :return: :class:`source.game_controller.GameController` that does not draw anything
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return GameController(
+        screen,
+        SCREEN_WIDTH,
+        SCREEN_HEIGHT,
+        Settings() if settings is None else settings,
+        lambda: None,
+        True,
+    )
 
 
 def main() -> None:
     """
-    Creates a while loop to instantiate a new :class:`source.game.Game` object each time the user
-    restarts, or quits out of the program when prompted.
+    Creates a :class:`source.game.Game` and runs it until the user quits, restarting
+    in place each time the user returns to the menu, then quits out of the program.
 
     :return: `None`
     """
-    while True:
-        # Create a new instance of Game each loop to slightly increase memory
-        # efficiency and performance; prevents a backup of thousands of references
-        # that never get thrown away, preventing crippling of a weaker computer
-        game = Game()
-        game.run()
-        # If the user chooses to quit rather than restart, quit the game and break
-        # out of the overseer loop
-        if not game.restart:
-            game.quit()
-            return
+    game = Game()
+    game.run()
+    game.quit()
 
 
 if __name__ == "__main__":
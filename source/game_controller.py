@@ -1,17 +1,26 @@
 import pygame
 import math
+import random
 import typing
 
 from .reticle import Reticle
 from .missile import Missile
+from .enemy import Enemy
+from .pool import ObjectPool
 from .wave import Wave
+from .wave_plan import WavePlan
 from .score import Score
 from .balance import Balance
 from .lives import Lives
+from .hud import Hud
 from .game_over import GameOver
 from .tower import Tower
 from .highscore import HighscoreTable
 from .textinput import TextInput
+from .spatial_hash import SpatialHash
+from .collision import contact_time, get_swept_rect_of_instance
+from .profiler import FrameProfiler
+from .render_queue import RenderQueue
 
 # Constants
 MAX_MISSILES = 5
@@ -21,9 +30,28 @@ TIME_BETWEEN_WAVES = 1
 FRAME_RATE = 60
 LIVES = 3
 FONT_SIZE = 24
+# Height of the strip along the top of the screen holding the score, balance and lives
+HUD_HEIGHT = 3 * FONT_SIZE
 PLAYER_MISSILE_VELOCITY = 7
 TOWER_MISSILE_VELOCITY = 5
 POSSIBLE_TOWER_POSITIONS = [(100, 550), (200, 550), (565, 550), (665, 550)]
+# Render layer each type of instance is drawn on
+RENDER_LAYERS = {
+    Tower: "towers",
+    Wave: "enemies",
+    Missile: "missiles",
+    Reticle: "reticle",
+    Score: "hud",
+    Balance: "hud",
+    Lives: "hud",
+    Hud: "hud",
+    GameOver: "hud",
+    HighscoreTable: "hud",
+    TextInput: "hud",
+}
+# Profiler stages each type of instance is timed under while being stepped and drawn
+STEP_STAGES = {kind: f"{layer}_step" for kind, layer in RENDER_LAYERS.items()}
+DRAW_STAGES = {kind: f"{layer}_draw" for kind, layer in RENDER_LAYERS.items()}
 
 
 def calculate_enemies_for_wave(
@@ -84,6 +112,16 @@ def is_colliding(rect1: pygame.Rect, rect2: pygame.Rect) -> bool:
     return rect1.colliderect(rect2)
 
 
+def is_visible(instance) -> bool:
+    """
+    Gets whether an instance is visible, used to skip enemies destroyed earlier in the frame.
+
+    :param instance: An object that has a visible attribute
+    :return: :class:`bool` whether the instance is visible
+    """
+    return instance.visible
+
+
 class GameController:
     """
     Link class which acts as a bridge between the main game
@@ -101,6 +139,8 @@ class GameController:
     :param screen_height: :class:`int` height of the window in pixels
     :param settings: :class:`source.settings.Settings` instance
     :param advance_state_func: Procedure to advance the game state
+    :param headless: Optional[:class:`bool`] whether to only run the simulation, without drawing anything
+    :param profiler: Optional[:class:`source.profiler.FrameProfiler`] to time each stage of the frame with
     """
 
     def __init__(
@@ -110,14 +150,59 @@ class GameController:
         screen_height: int,
         settings,
         advance_state_func: typing.Callable,
+        headless: bool = False,
+        profiler: typing.Optional[FrameProfiler] = None,
     ) -> None:
         self.game_surface = game_surface
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.settings = settings
         self.advance_state_func = advance_state_func
+        self.headless = headless
+        self.profiler = FrameProfiler() if profiler is None else profiler
 
         self.control_scheme = self.settings.control_scheme
+        # Enemies and missiles are reused rather than reallocated, shared by every wave and tower
+        self.enemy_pool = ObjectPool(Enemy)
+        self.missile_pool = ObjectPool(Missile)
+        self.enemy_grid = SpatialHash()
+        # Kept between games along with its database check and worker threads
+        self.highscores_table = HighscoreTable(
+            self.game_surface, self.screen_width, self.screen_height
+        )
+        self.render_queue = RenderQueue()
+        self.missiles = []
+        self.current_wave = None
+        self.towers = []
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Starts a new game in place, returning every missile and enemy to their pools and
+        recreating the per-game state. The pools, the highscore table and its worker threads
+        are kept, so restarting does not repeat any of the controller's setup.
+
+        :return: `None`
+        """
+        # Every random choice in the game is drawn from this generator, so a fixed
+        # seed reproduces the same game frame by frame given the same input
+        self.seed = (
+            random.SystemRandom().randrange(2 ** 32)
+            if self.settings.seed is None
+            else self.settings.seed
+        )
+        self.rng = random.Random(self.seed)
+        # Number of simulation steps run so far, used to timestamp recorded input
+        self.ticks = 0
+
+        for missile in self.missiles:
+            self.missile_pool.release(missile)
+        for tower in self.towers:
+            for missile in tower.missiles:
+                self.missile_pool.release(missile)
+        if self.current_wave is not None:
+            self.current_wave.release_enemies()
+
         self.reticle = Reticle(self.game_surface, self.screen_width, self.screen_height)
         self.missiles = []
 
@@ -145,11 +230,17 @@ class GameController:
         self.balance = Balance(
             self.game_surface, self.screen_width, self.screen_height, FONT_SIZE
         )
-        self.highscores_table = HighscoreTable(
-            self.game_surface, self.screen_width, self.screen_height
+        # The counters are composited onto one layer, only redrawn when one of them changes
+        self.hud = Hud(
+            self.game_surface,
+            self.screen_width,
+            HUD_HEIGHT,
+            [self.lives, self.score, self.balance],
         )
+        self.highscores_table.reset()
         self.score_saved = False
         self.text_input = None
+        self.to_be_drawn = []
 
     def save_score(self, name: str) -> None:
         """
@@ -162,14 +253,15 @@ class GameController:
             self.highscores_table.add_new_score(name, self.score.value)
             self.score_saved = True
 
-    def enemy_hit_ground(self) -> None:
+    def enemy_hit_ground(self, amount: int = 1) -> None:
         """
         Callback function passed into Wave on instantiation. Provides a method for the enemies to
         tell the :class:`source.controller.Controller` class when to decrement the lives counter.
 
+        :param amount: Optional[:class:`int`] number of enemies that hit the ground
         :return: `None`
         """
-        self.lives.decrement()
+        self.lives.decrement(amount)
 
     def get_current_enemies(self) -> typing.Optional[typing.List]:
         """
@@ -182,6 +274,23 @@ class GameController:
             None if self.current_wave is None else self.current_wave.get_all_enemies()
         )
 
+    def find_nearest_enemy(self, x: float, y: float, radius: float):
+        """
+        Function passed to :class:`source.tower.Tower` on init. Gets the visible enemy in the
+        current wave closest to a position, within a radius, from the grid rebuilt each frame
+        by rebuild_enemy_grid, or from the swarm's arrays when the swarm backend is in use.
+
+        :param x: :math:`x` coordinate of the position
+        :param y: :math:`y` coordinate of the position
+        :param radius: Maximum distance of the enemy from the position
+        :return: Optional nearest enemy in range
+        """
+        if self.current_wave is None:
+            return None
+        if self.current_wave.backend == "SWARM":
+            return self.current_wave.enemies.nearest(x, y, radius)
+        return self.enemy_grid.nearest(x, y, radius, is_visible)
+
     def create_towers(self):
         return [
             Tower(
@@ -192,16 +301,19 @@ class GameController:
                 y,
                 self.get_current_enemies,
                 TOWER_MISSILE_VELOCITY,
+                self.missile_pool,
+                self.find_nearest_enemy,
             )
             for x, y in POSSIBLE_TOWER_POSITIONS
         ]
 
-    def create_new_wave(self) -> None:
+    def create_new_wave(self, plan: typing.Optional[WavePlan] = None) -> None:
         """
         Instantiate a new :class:`source.wave.Wave` object after calculating the correct number
         of enemies to be spawned in the wave.
         Increments the current wave number by 1.
 
+        :param plan: Optional[:class:`source.wave_plan.WavePlan`] fixed spawns for the wave, randomly generated if unspecified
         :return: `None`
         """
         number_of_enemies = calculate_enemies_for_wave(
@@ -217,6 +329,10 @@ class GameController:
             self.enemy_hit_ground,
             self.wave_number,
             FONT_SIZE,
+            self.settings.enemy_backend,
+            self.rng,
+            self.enemy_pool,
+            plan,
         )
 
         self.wave_number += 1
@@ -231,7 +347,7 @@ class GameController:
         if len(self.missiles) < MAX_MISSILES:
             reticle_position = self.reticle.current_position()
             self.missiles.append(
-                Missile(
+                self.missile_pool.acquire(
                     self.game_surface,
                     self.screen_width,
                     self.screen_height,
@@ -290,40 +406,84 @@ class GameController:
         if self.text_input is not None:
             self.text_input.process_event(event)
 
-    def check_collisions(self, missile_list) -> None:
+    def rebuild_enemy_grid(self) -> None:
+        """
+        Rebuilds the :class:`source.spatial_hash.SpatialHash` of visible enemies
+        used as the broad-phase by check_collisions. Called once per frame.
+        Enemies are stored by the bounds of their movement over the last step.
+
+        :return: `None`
+        """
+        if self.current_wave is None or self.current_wave.backend == "SWARM":
+            self.enemy_grid.clear()
+        else:
+            self.enemy_grid.rebuild(
+                (enemy for enemy in self.current_wave.enemies if enemy.visible),
+                get_swept_rect_of_instance,
+            )
+
+    def check_collisions(
+        self, missile_list, missile_pool: typing.Optional[ObjectPool] = None
+    ) -> None:
         """
         Check if any sprites are colliding such that
         a missile or enemy needs to be removed from the display.
-
+        Missiles and enemies are tested over the whole of the last step rather than
+        only at their current positions, see :func:`source.collision.contact_time`,
+        so fast missiles cannot pass through an enemy between steps.
+        Only enemies whose movement shares a grid cell with the missile's are tested,
+        see :func:`source.game_controller.GameController.rebuild_enemy_grid`.
+
+        :param missile_list: :class:`list` of :class:`source.missile.Missile` to check, missiles that are removed are removed from this list
+        :param missile_pool: Optional[:class:`source.pool.ObjectPool`] to release removed missiles into, when the list owns its missiles
         :return: `None`
         """
         for missile in missile_list[:]:  # Loop through a copy of self.missiles
             # Check if a missile has flown out of bounds and remove it if necessary
             if not missile.visible:
                 missile_list.remove(missile)
+                if missile_pool is not None:
+                    missile_pool.release(missile)
                 continue
 
             hit_enemy = False
-            missile_rect = get_rect_of_instance(missile)
-            # Loop through a list of enemies if there is currently a wave
-            # else loop though an empty list meaning the loop does not occur
-            for enemy in (
-                [] if self.current_wave is None else self.current_wave.enemies.sprites()
-            ):
-                # Check if the enemy is colliding with the missile
-                if enemy.visible and is_colliding(
-                    missile_rect, get_rect_of_instance(enemy)
-                ):
+            if self.current_wave is not None and self.current_wave.backend == "SWARM":
+                # The swarm resolves every enemy colliding with the missile at once,
+                # only imported once a swarm wave exists so the sprite backend never loads it
+                from .swarm import SwarmEnemy
+
+                killed = self.current_wave.enemies.hit_by_swept(
+                    missile.previous_x,
+                    missile.previous_y,
+                    *missile.image.get_size(),
+                    missile.x - missile.previous_x,
+                    missile.y - missile.previous_y,
+                )
+                if killed:
+                    self.score.increment(killed * SwarmEnemy.score_value)
+                    self.balance.increment(killed * SwarmEnemy.balance_value)
+                    missile.visible = False
+                    missile_list.remove(missile)
+                    if missile_pool is not None:
+                        missile_pool.release(missile)
+                continue
+
+            # Loop through the enemies colliding with the missile, those hit by an
+            # earlier missile this frame are no longer visible so are skipped
+            for enemy in self.enemy_grid.query(get_swept_rect_of_instance(missile)):
+                if enemy.visible and contact_time(missile, enemy) is not None:
                     # Increment score and balance, toggle enemy visibility, mark the missile
                     # to be removed at the end of this iteration
                     self.score.increment(enemy.score_value)
                     self.balance.increment(enemy.balance_value)
-                    enemy.visible = False
+                    self.current_wave.destroy_enemy(enemy)
                     hit_enemy = True
             if hit_enemy:
                 # Remove the missile from self.missiles if it hit an enemy
                 missile.visible = False
                 missile_list.remove(missile)
+                if missile_pool is not None:
+                    missile_pool.release(missile)
 
     def get_what_needs_to_be_updated(self) -> list:
         """
@@ -336,7 +496,7 @@ class GameController:
         to_be_updated = []
 
         if self.internal_game_over:
-            to_be_updated += [self.score, self.balance, self.lives]
+            to_be_updated += [self.hud]
 
             if self.text_input is None:
                 self.text_input = TextInput(
@@ -364,12 +524,7 @@ class GameController:
             if self.current_wave is not None:
                 to_be_updated += [self.current_wave]
 
-            to_be_updated += self.missiles + [
-                self.reticle,
-                self.score,
-                self.balance,
-                self.lives,
-            ]
+            to_be_updated += self.missiles + [self.reticle, self.hud]
 
         return to_be_updated
 
@@ -397,6 +552,8 @@ class GameController:
         :return: None
         """
         if self.current_wave is None or self.current_wave.finished:
+            if self.current_wave is not None:
+                self.current_wave.release_enemies()
             self.current_wave = None
             # Begins the between wave timer if the wave has been completed
             if not self.counting_down:
@@ -436,10 +593,96 @@ class GameController:
                 tower_to_place.placed = True
                 self.balance.decrement(tower_to_place.price)
 
-    def update_all(self) -> None:
+    def snapshot(self) -> dict:
         """
-        Updates all instances fetched by get_what_needs_to_be_updated() and
-        runs game_over logic.
+        Copies the complete simulation state into a :class:`dict`, used as a replay keyframe.
+        Drawing-only state such as fonts and surfaces is not included.
+
+        :return: :class:`dict` snapshot of the game
+        """
+        return {
+            "ticks": self.ticks,
+            "wave_number": self.wave_number,
+            "frames_to_next_wave": self.frames_to_next_wave,
+            "counting_down": self.counting_down,
+            "internal_game_over": self.internal_game_over,
+            "score": self.score.value,
+            "balance": self.balance.value,
+            "lives": self.lives.lives,
+            "reticle": self.reticle.snapshot(),
+            "missiles": [missile.snapshot() for missile in self.missiles],
+            "towers": [tower.snapshot() for tower in self.towers],
+            "current_wave": (
+                None if self.current_wave is None else self.current_wave.snapshot()
+            ),
+            "rng": self.rng.getstate(),
+        }
+
+    def restore(self, state: dict) -> None:
+        """
+        Restores the complete simulation state from a snapshot.
+
+        :param state: :class:`dict` made by :func:`source.game_controller.GameController.snapshot`
+        :return: `None`
+        """
+        self.ticks = state["ticks"]
+        self.wave_number = state["wave_number"]
+        self.frames_to_next_wave = state["frames_to_next_wave"]
+        self.counting_down = state["counting_down"]
+        self.internal_game_over = state["internal_game_over"]
+        self.score.value = state["score"]
+        self.balance.value = state["balance"]
+        self.lives.lives = state["lives"]
+        self.reticle.restore(state["reticle"])
+
+        for missile in self.missiles:
+            self.missile_pool.release(missile)
+        self.missiles = []
+        for missile_state in state["missiles"]:
+            missile = self.missile_pool.acquire(
+                self.game_surface,
+                self.screen_width,
+                self.screen_height,
+                missile_state["start_x"],
+                missile_state["start_y"],
+                missile_state["end_x"],
+                missile_state["end_y"],
+                missile_state["fire_velocity"],
+            )
+            missile.restore(missile_state)
+            self.missiles.append(missile)
+        for tower, tower_state in zip(self.towers, state["towers"]):
+            tower.restore(tower_state)
+
+        if self.current_wave is not None:
+            self.current_wave.release_enemies()
+        wave_state = state["current_wave"]
+        if wave_state is None:
+            self.current_wave = None
+        else:
+            self.current_wave = Wave(
+                wave_state["number_of_enemies"],
+                wave_state["time_limit_in_frames"],
+                self.game_surface,
+                self.screen_width,
+                self.screen_height,
+                self.enemy_hit_ground,
+                wave_state["num"] - 1,
+                FONT_SIZE,
+                wave_state["backend"],
+                self.rng,
+                self.enemy_pool,
+                WavePlan.from_dict(wave_state["plan"]),
+            )
+            self.current_wave.restore(wave_state)
+        # Restored last as recreating the wave and its enemies draws from the generator
+        self.rng.setstate(state["rng"])
+        self.to_be_drawn = self.get_what_needs_to_be_updated()
+
+    def step_all(self) -> None:
+        """
+        Advances the simulation by one step. Steps all instances fetched by
+        get_what_needs_to_be_updated() and runs game_over logic.
 
         :return: None
         """
@@ -447,15 +690,49 @@ class GameController:
         if self.lives == 0:
             self.internal_game_over = True
         else:
-            self.create_new_wave_if_required()
-            self.check_collisions(self.missiles)
-            tower_missiles = []
-            for tower in self.towers:
-                tower_missiles += tower.missiles
-            self.check_collisions(tower_missiles)
+            with self.profiler.stage("wave_creation"):
+                self.create_new_wave_if_required()
+            with self.profiler.stage("collisions_player"):
+                self.rebuild_enemy_grid()
+                self.check_collisions(self.missiles, self.missile_pool)
+            with self.profiler.stage("collisions_towers"):
+                tower_missiles = []
+                for tower in self.towers:
+                    tower_missiles += tower.missiles
+                self.check_collisions(tower_missiles)
             self.check_if_wave_finished()
 
-        # Gets all instances that need to be updated in a given frame and calls update() on each in turn
+        # Gets all instances that need to be updated in a given frame and calls step() on each in turn
         to_be_updated = self.get_what_needs_to_be_updated()
         for instance in to_be_updated:
-            instance.update()
+            with self.profiler.stage(STEP_STAGES[type(instance)]):
+                instance.step()
+        self.to_be_drawn = to_be_updated
+        self.ticks += 1
+
+    def draw_all(self, alpha: float = 1.0) -> None:
+        """
+        Draws all instances stepped by the most recent call to step_all(),
+        unless the controller is headless. Every instance is queued onto its layer of the
+        :class:`source.render_queue.RenderQueue`, then each layer is drawn with a single batched blit.
+
+        :param alpha: Optional[:class:`float`] fraction of a step elapsed since the last step, used to interpolate positions
+        :return: None
+        """
+        if self.headless:
+            return
+        render_queue = self.render_queue
+        for instance in self.to_be_drawn:
+            kind = type(instance)
+            with self.profiler.stage(DRAW_STAGES[kind]):
+                render_queue.extend(RENDER_LAYERS[kind], instance.blits(alpha))
+        render_queue.submit(self.game_surface, self.profiler)
+
+    def update_all(self) -> None:
+        """
+        Steps the simulation once then draws the result.
+
+        :return: None
+        """
+        self.step_all()
+        self.draw_all()
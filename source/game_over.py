@@ -1,6 +1,6 @@
 import pygame
 
-from . import utils
+from .text_cache import get_text_cache
 
 
 class GameOver:
@@ -24,24 +24,52 @@ class GameOver:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.font_size = font_size
-        self.font = utils.load_font("source.fonts", "fixedsys.ttf", self.font_size)
+        self.text_cache = get_text_cache(self.font_size, pygame.Color("#ff0000"))
 
-    def update(self) -> None:
+    def step(self) -> None:
         """
-        Draws the game_over text onto the game surface each time this is called.
+        The game_over screen has no per-frame state to advance.
 
         :return: `None`
         """
-        game_over_surface = self.font.render("GAME OVER", True, pygame.Color("#ff0000"))
+
+    def blits(self, alpha: float = 1.0) -> list:
+        """
+        Gets the game_over text and the positions to draw it at,
+        to be submitted with :func:`pygame.Surface.blits`.
+
+        :param alpha: Optional[:class:`float`] interpolation factor, unused as the game_over text does not move
+        :return: :class:`list` of (:class:`pygame.Surface`, position) pairs to draw
+        """
+        game_over_surface = self.text_cache.render("GAME OVER")
         game_over_rect = game_over_surface.get_rect()
         game_over_rect.center = self.game_surface.get_rect().center
-        self.game_surface.blit(game_over_surface, game_over_rect)
-        restart_msg_surface = self.font.render(
-            "Press [ENTER] to return to menu or [ESC] to quit", True, pygame.Color("#ff0000")
+        restart_msg_surface = self.text_cache.render(
+            "Press [ENTER] to return to menu or [ESC] to quit"
         )
         restart_msg_rect = restart_msg_surface.get_rect()
         restart_msg_rect.center = (
             game_over_rect.center[0],
             game_over_rect.center[1] + self.font_size,
         )
-        self.game_surface.blit(restart_msg_surface, restart_msg_rect)
+        return [
+            (game_over_surface, game_over_rect),
+            (restart_msg_surface, restart_msg_rect),
+        ]
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draws the game_over text onto the game surface each time this is called.
+
+        :param alpha: Optional[:class:`float`] interpolation factor, unused as the game_over text does not move
+        :return: `None`
+        """
+        self.game_surface.blits(self.blits(alpha), False)
+
+    def update(self) -> None:
+        """
+        Draws the game_over text onto the game surface each time this is called.
+
+        :return: `None`
+        """
+        self.draw()
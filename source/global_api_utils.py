@@ -1,5 +1,4 @@
 from concurrent import futures
-import requests
 import typing
 import time
 
@@ -40,6 +39,9 @@ class APIWorker:
         :return: `None`
         """
         try:
+            # Imported on first use, on the worker thread, as it is slow to import at startup
+            import requests
+
             json_to_send = {"name": name, "score": score}
             resp = requests.post(f"{BASE_URL}{POST_ENDPOINT}", json=json_to_send)
             resp.raise_for_status()
@@ -54,6 +56,8 @@ class APIWorker:
         :return: :class:`list` of name, score pairs
         """
         try:
+            import requests
+
             resp = requests.get(f"{BASE_URL}{GET_ENDPOINT}", timeout=5)
             resp.raise_for_status()
             response = resp.json()
@@ -1,9 +1,8 @@
 import concurrent
 import pygame
 import typing
-import requests
 
-from . import utils
+from .text_cache import get_text_cache
 from . import db_utils
 from . import global_api_utils
 
@@ -21,20 +20,12 @@ class HighscoreRow:
     :param score: The :class:`int` score of the player
     """
 
-    font = None
-
     def __init__(self, name: str, score: int) -> None:
-        if HighscoreRow.font is None:
-            HighscoreRow.font = utils.load_font(
-                "source.fonts", "fixedsys.ttf", FONT_SIZE
-            )
-        self.font = HighscoreRow.font
-
         self.name = name
         self.score = score
         self.string_to_render = f"{self.name} - {self.score}"
-        self.rendered_row = self.font.render(
-            self.string_to_render, True, pygame.Color("#FFFFFF")
+        self.rendered_row = get_text_cache(FONT_SIZE, pygame.Color("#FFFFFF")).render(
+            self.string_to_render
         )
 
 
@@ -55,15 +46,24 @@ class HighscoreTable:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.game_surface = game_surface
-        self.font = utils.load_font("source.fonts", "fixedsys.ttf", FONT_SIZE)
+        self.text_cache = get_text_cache(FONT_SIZE, pygame.Color("#FFFFFF"))
+        self.loading_surface = self.render_loading_surface()
+        self.api_worker = global_api_utils.APIWorker()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Empties the table ready for a new game, keeping the worker threads.
+        Any request still running for the previous game is ignored.
+
+        :return: `None`
+        """
         self.rows = []
         self.num_rows = len(self.rows)
         self.visible = False
-        self.loading_surface = self.render_loading_surface()
         self.surface_to_draw = None
         self.request_running = False
         self.global_fetch_succeeded = False
-        self.api_worker = global_api_utils.APIWorker()
         self.request_future = None
 
     @staticmethod
@@ -108,7 +108,7 @@ class HighscoreTable:
         title_text = (
             "Global High Scores" if self.global_fetch_succeeded else "Local High Scores"
         )
-        title_surface = self.font.render(title_text, True, pygame.Color("#FFFFFF"))
+        title_surface = self.text_cache.render(title_text)
         title_surface_rect = title_surface.get_rect()
         title_surface_rect.midtop = (self.screen_width // 2, PADDING_TOP)
 
@@ -133,10 +133,8 @@ class HighscoreTable:
             # Displays a message to the user if the global high scores
             # couldn't be fetched from the api
         if not self.global_fetch_succeeded:
-            footer_surface = self.font.render(
-                "Global fetch failed: displaying local scores only.",
-                True,
-                pygame.Color("#FF0000"),
+            footer_surface = get_text_cache(FONT_SIZE, pygame.Color("#FF0000")).render(
+                "Global fetch failed: displaying local scores only."
             )
             footer_surface_rect = footer_surface.get_rect()
             # Position the message in the bottom centre of the screen
@@ -150,7 +148,7 @@ class HighscoreTable:
         return highscore_surface
 
     def render_loading_surface(self):
-        title_surface = self.font.render("Loading High Scores...", True, pygame.Color("#FFFFFF"))
+        title_surface = self.text_cache.render("Loading High Scores...")
         title_surface_rect = title_surface.get_rect()
         title_surface_rect.midtop = (self.screen_width // 2, PADDING_TOP)
 
@@ -172,9 +170,10 @@ class HighscoreTable:
         self.rows = self.parse_scores(raw_rows)
         self.surface_to_draw = self.render()
 
-    def update(self) -> None:
+    def step(self) -> None:
         """
-        Draws the highscore table onto the game surface
+        Checks whether the highscore request has completed and regenerates
+        the table if it has
 
         :return: `None`
         """
@@ -193,4 +192,29 @@ class HighscoreTable:
             else:
                 self.surface_to_draw = self.loading_surface
 
-        self.game_surface.blit(self.surface_to_draw, (0, 0))
+    def blits(self, alpha: float = 1.0) -> list:
+        """
+        Gets the highscore table to draw, to be submitted with :func:`pygame.Surface.blits`.
+
+        :param alpha: Optional[:class:`float`] interpolation factor, unused as the highscore table does not move
+        :return: :class:`list` of (:class:`pygame.Surface`, position) pairs to draw
+        """
+        return [(self.surface_to_draw, (0, 0))]
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draws the highscore table onto the game surface
+
+        :param alpha: Optional[:class:`float`] interpolation factor, unused as the highscore table does not move
+        :return: `None`
+        """
+        self.game_surface.blits(self.blits(alpha), False)
+
+    def update(self) -> None:
+        """
+        Checks the highscore request then draws the highscore table onto the game surface
+
+        :return: `None`
+        """
+        self.step()
+        self.draw()
@@ -0,0 +1,109 @@
+import pygame
+import typing
+
+# Constants
+WHITE = pygame.Color("#ffffff")
+RED = pygame.Color("#ff0000")
+
+
+def merge_rects(rects: typing.List[pygame.Rect]) -> typing.List[pygame.Rect]:
+    """
+    Merges overlapping rects into their union until none overlap.
+
+    :param rects: :class:`list` of :class:`pygame.Rect` to merge
+    :return: :class:`list` of non-overlapping :class:`pygame.Rect` covering the same area
+    """
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        overlapping = rect.collidelist(merged)
+        while overlapping != -1:
+            rect.union_ip(merged.pop(overlapping))
+            overlapping = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class Hud:
+    """
+    Retained layer compositing the HUD counters onto a single transparent surface along the
+    top of the screen. Counters provide their text surfaces through a ``blits`` method, taken from
+    a :class:`source.text_cache.TextCache` so that unchanged text keeps the same surface, and the
+    layer is only recomposited when one of those surfaces changes. Each frame only the
+    regions of the layer holding text are blitted, rather than the whole strip.
+
+    :param game_surface: The :class:`pygame.Surface` to draw the HUD onto
+    :param screen_width: :class:`int` width of the window in pixels
+    :param height: :class:`int` height of the HUD strip in pixels
+    :param counters: :class:`list` of counters, such as :class:`source.score.Score`, to composite
+    """
+
+    def __init__(
+        self,
+        game_surface: pygame.Surface,
+        screen_width: int,
+        height: int,
+        counters: typing.List,
+    ) -> None:
+        self.game_surface = game_surface
+        self.surface = pygame.Surface((screen_width, height), pygame.SRCALPHA)
+        self.counters = counters
+        self.composited = None
+        self.regions = []
+        self.compositions = 0
+
+    def composite(self) -> None:
+        """
+        Redraws every counter onto the HUD surface if any of their rendered text has changed.
+
+        :return: `None`
+        """
+        blits = []
+        for counter in self.counters:
+            blits += counter.blits()
+        surfaces = [surface for surface, _ in blits]
+        if self.composited is not None and len(surfaces) == len(self.composited) and all(
+            surface is previous for surface, previous in zip(surfaces, self.composited)
+        ):
+            return
+        self.surface.fill((0, 0, 0, 0))
+        self.surface.blits(blits, False)
+        self.composited = surfaces
+        self.regions = merge_rects([rect for _, rect in blits])
+        self.compositions += 1
+
+    def step(self) -> None:
+        """
+        The HUD has no per-frame state to advance, the counters change when the game updates them.
+
+        :return: `None`
+        """
+
+    def blits(self, alpha: float = 1.0) -> list:
+        """
+        Composites the counters if required, then gets the regions of the HUD surface to draw,
+        to be submitted with :func:`pygame.Surface.blits`.
+
+        :param alpha: Optional[:class:`float`] interpolation factor, unused as the HUD does not move
+        :return: :class:`list` of (:class:`pygame.Surface`, position, area) to draw
+        """
+        self.composite()
+        surface = self.surface
+        return [(surface, region, region) for region in self.regions]
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Composites the counters if required, then draws the HUD onto the game surface.
+
+        :param alpha: Optional[:class:`float`] interpolation factor, unused as the HUD does not move
+        :return: `None`
+        """
+        self.game_surface.blits(self.blits(alpha), False)
+
+    def update(self) -> None:
+        """
+        Draws the HUD onto the game surface.
+
+        :return: `None`
+        """
+        self.draw()
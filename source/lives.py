@@ -1,6 +1,8 @@
 import pygame
+import typing
 
-from . import utils
+from .hud import WHITE, RED
+from .text_cache import get_text_cache
 
 
 class Lives:
@@ -26,7 +28,8 @@ class Lives:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.lives = lives
-        self.font = utils.load_font("source.fonts", "fixedsys.ttf", font_size)
+        self.text_cache = get_text_cache(font_size, WHITE)
+        self.warning_text_cache = get_text_cache(font_size, RED)
 
     def __eq__(self, value: int) -> bool:
         """
@@ -37,28 +40,52 @@ class Lives:
         """
         return self.lives == value
 
-    def decrement(self) -> None:
+    def decrement(self, amount: int = 1) -> None:
         """
-        Decrements the current life count by 1 each time it is called. Life count
-        cannot be less than 0.
+        Decrements the current life count by a given amount, 1 by default, each time it is called.
+        Life count cannot be less than 0.
 
+        :param amount: Optional[:class:`int`] amount of lives to remove
         :return: `None`
         """
-        self.lives -= 1 if self.lives > 0 else 0
+        self.lives = max(self.lives - amount, 0)
 
-    def update(self) -> None:
+    def step(self) -> None:
         """
-        Draws the life counter onto the game surface each time this is called.
+        The life counter has no per-frame state to advance, it only changes when decremented.
 
         :return: `None`
         """
-        white, red = pygame.Color("#ffffff"), pygame.Color("#ff0000")
-        colour = red if self.lives <= 1 else white
-        lives_text_surface = self.font.render("LIVES", True, white)
+
+    def blits(self) -> typing.List[typing.Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Gets the rendered life counter and where it is drawn, the number is only rasterized
+        when the life count changes.
+
+        :return: :class:`list` of :class:`tuple` of :class:`pygame.Surface` and :class:`pygame.Rect`
+        """
+        text_cache = self.warning_text_cache if self.lives <= 1 else self.text_cache
+        lives_text_surface = self.text_cache.render("LIVES")
         lives_text_rect = lives_text_surface.get_rect()
         lives_text_rect.topleft = (2, 2)
-        lives_num_surface = self.font.render(f"      {self.lives}", True, colour)
+        lives_num_surface = text_cache.render(f"      {self.lives}")
         lives_num_rect = lives_num_surface.get_rect()
         lives_num_rect.topleft = (2, 2)
-        self.game_surface.blit(lives_text_surface, lives_text_rect)
-        self.game_surface.blit(lives_num_surface, lives_num_rect)
+        return [(lives_text_surface, lives_text_rect), (lives_num_surface, lives_num_rect)]
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draws the life counter onto the game surface each time this is called.
+
+        :param alpha: Optional[:class:`float`] interpolation factor, unused as the life counter does not move
+        :return: `None`
+        """
+        self.game_surface.blits(self.blits(), False)
+
+    def update(self) -> None:
+        """
+        Draws the life counter onto the game surface each time this is called.
+
+        :return: `None`
+        """
+        self.draw()
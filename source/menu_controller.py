@@ -1,11 +1,11 @@
 import pygame
 import typing
 import webbrowser
-import copy
 import random
 
 from .missile import Missile
-from . import utils
+from .pool import ObjectPool
+from .text_cache import get_text_cache
 
 MISSILE_LIMIT = 10
 COLOURS = {
@@ -48,8 +48,7 @@ class Button:
 
         self.image = pygame.Surface((self.size_x, self.size_y))
         self.image.fill(pygame.Color("#737373"))
-        self.title_font = utils.load_font("source.fonts", "fixedsys.ttf", font_size)
-        self.text = self.title_font.render(text, True, pygame.Color("#FFFFFF"))
+        self.text = get_text_cache(font_size, pygame.Color("#FFFFFF")).render(text)
         text_rect = self.text.get_rect()
         text_rect.center = self.image.get_rect().center
         self.image.blit(self.text, text_rect)
@@ -81,14 +80,30 @@ class Button:
         if button_rect.collidepoint(mouse_position):
             self.on_press()
 
-    def update(self) -> None:
+    def step(self) -> None:
+        """
+        Buttons only react to events, so have no per-frame state to advance
+
+        :return: `None`
+        """
+
+    def draw(self, alpha: float = 1.0) -> None:
         """
         Draws the button onto the game :class:`pygame.Surface`
 
+        :param alpha: Optional[:class:`float`] interpolation factor, unused as buttons do not move
         :return: `None`
         """
         self.game_surface.blit(self.image, (self.x, self.y))
 
+    def update(self) -> None:
+        """
+        Draws the button onto the game :class:`pygame.Surface`
+
+        :return: `None`
+        """
+        self.draw()
+
 
 class MenuController:
     """
@@ -111,6 +126,8 @@ class MenuController:
         self.advance_state_func = advance_state_func
 
         self.decorative_missiles = []
+        self.missile_pool = ObjectPool(Missile)
+        self.rng = random.Random(self.settings.seed)
 
         self.listening_up = False
         self.listening_down = False
@@ -118,8 +135,8 @@ class MenuController:
         self.listening_right = False
         self.listening_fire = False
 
-        self.title_font = utils.load_font("source.fonts", "fixedsys.ttf", 50)
-        self.text_font = utils.load_font("source.fonts", "fixedsys.ttf", 24)
+        self.title_text_cache = get_text_cache(50, pygame.Color("#FFFFFF"))
+        self.body_text_cache = get_text_cache(24, pygame.Color("#FFFFFF"))
 
         self.menu_background = pygame.Surface(
             (self.screen_width, self.screen_height), pygame.SRCALPHA
@@ -137,10 +154,14 @@ class MenuController:
             (self.screen_width, self.screen_height), pygame.SRCALPHA
         )
 
+        # Areas of each background that have been drawn onto, only these are blitted
+        # as the rest of the background is fully transparent
+        self.menu_background_areas = []
+        self.settings_background_areas = []
+        self.instructions_background_areas = []
+
         self.listening_for_key_background.fill((0, 0, 0, 200))
-        key_prompt = self.title_font.render(
-            "Press a key", True, pygame.Color("#FFFFFF")
-        )
+        key_prompt = self.title_text_cache.render("Press a key")
         self.listening_for_key_background.blit(
             key_prompt,
             self.centre_rect(
@@ -330,6 +351,20 @@ class MenuController:
         surface_rect.center = position
         return surface_rect
 
+    def reset(self) -> None:
+        """
+        Returns the controller to the menu screen, no longer listening for a key,
+        ready for a new game. The rendered screens and buttons are kept.
+
+        :return: `None`
+        """
+        self.state = "MENU"
+        self.listening_up = False
+        self.listening_down = False
+        self.listening_left = False
+        self.listening_right = False
+        self.listening_fire = False
+
     def settings_state(self) -> None:
         """
         Change the controller into the settings screen state
@@ -405,14 +440,14 @@ class MenuController:
 
         :return: `None`
         """
-        welcome_text = self.title_font.render(
-            "Missile Defence", True, pygame.Color("#FFFFFF")
-        )
-        self.menu_background.blit(
-            welcome_text,
-            self.centre_rect(
-                welcome_text, (self.screen_width // 2, self.screen_height // 2 - 250)
-            ),
+        welcome_text = self.title_text_cache.render("Missile Defence")
+        self.menu_background_areas.append(
+            self.menu_background.blit(
+                welcome_text,
+                self.centre_rect(
+                    welcome_text, (self.screen_width // 2, self.screen_height // 2 - 250)
+                ),
+            )
         )
 
     def render_instructions_background(self) -> None:
@@ -421,23 +456,23 @@ class MenuController:
 
         :return: `None`
         """
-        instructions_title = self.title_font.render(
-            "Instructions", True, pygame.Color("#FFFFFF")
-        )
-        self.instructions_background.blit(
-            instructions_title,
-            self.centre_rect(
-                instructions_title, (self.screen_width // 2, self.screen_height // 2 - 250)
-            ),
-        )
-        instructions_text = self.text_font.render(
-            "To Be Written...", True, pygame.Color("#FFFFFF")
+        instructions_title = self.title_text_cache.render("Instructions")
+        self.instructions_background_areas.append(
+            self.instructions_background.blit(
+                instructions_title,
+                self.centre_rect(
+                    instructions_title, (self.screen_width // 2, self.screen_height // 2 - 250)
+                ),
+            )
         )
-        self.instructions_background.blit(
-            instructions_text,
-            self.centre_rect(
-                instructions_text, (self.screen_width // 2, self.screen_height // 2)
-            ),
+        instructions_text = self.body_text_cache.render("To Be Written...")
+        self.instructions_background_areas.append(
+            self.instructions_background.blit(
+                instructions_text,
+                self.centre_rect(
+                    instructions_text, (self.screen_width // 2, self.screen_height // 2)
+                ),
+            )
         )
 
     def render_settings_background(self) -> None:
@@ -446,42 +481,44 @@ class MenuController:
 
         :return: `None`
         """
-        settings_title = self.title_font.render(
-            "Settings", True, pygame.Color("#FFFFFF")
-        )
-        self.settings_background.blit(
-            settings_title,
-            self.centre_rect(
-                settings_title, (self.screen_width // 2, self.screen_height // 2 - 250)
-            ),
+        settings_title = self.title_text_cache.render("Settings")
+        self.settings_background_areas.append(
+            self.settings_background.blit(
+                settings_title,
+                self.centre_rect(
+                    settings_title, (self.screen_width // 2, self.screen_height // 2 - 250)
+                ),
+            )
         )
 
-        difficulty_title = self.text_font.render(
-            "Difficulty:", True, pygame.Color("#FFFFFF")
-        )
-        self.settings_background.blit(
-            difficulty_title, self.centre_rect(difficulty_title, (150, 150))
+        difficulty_title = self.body_text_cache.render("Difficulty:")
+        self.settings_background_areas.append(
+            self.settings_background.blit(
+                difficulty_title, self.centre_rect(difficulty_title, (150, 150))
+            )
         )
 
-        difficulty_label = self.text_font.render(
-            "Currently:", True, pygame.Color("#FFFFFF")
-        )
-        self.settings_background.blit(
-            difficulty_label, self.centre_rect(difficulty_label, (150, 350))
+        difficulty_label = self.body_text_cache.render("Currently:")
+        self.settings_background_areas.append(
+            self.settings_background.blit(
+                difficulty_label, self.centre_rect(difficulty_label, (150, 350))
+            )
         )
 
-        controls_label = self.text_font.render(
-            "Controls:", True, pygame.Color("#FFFFFF")
-        )
-        self.settings_background.blit(
-            controls_label,
-            self.centre_rect(controls_label, (self.screen_width // 2, 150)),
+        controls_label = self.body_text_cache.render("Controls:")
+        self.settings_background_areas.append(
+            self.settings_background.blit(
+                controls_label,
+                self.centre_rect(controls_label, (self.screen_width // 2, 150)),
+            )
         )
 
-        keybinds_label = self.text_font.render("Rebind:", True, pygame.Color("#FFFFFF"))
-        self.settings_background.blit(
-            keybinds_label,
-            self.centre_rect(keybinds_label, (self.screen_width - 150, 150)),
+        keybinds_label = self.body_text_cache.render("Rebind:")
+        self.settings_background_areas.append(
+            self.settings_background.blit(
+                keybinds_label,
+                self.centre_rect(keybinds_label, (self.screen_width - 150, 150)),
+            )
         )
 
     def render_current_difficulty(self, target: pygame.Surface) -> None:
@@ -492,8 +529,8 @@ class MenuController:
         :param target: :class:`pygame.Surface` to draw difficulty onto
         :return: `None`
         """
-        current_difficulty = self.text_font.render(
-            self.settings.difficulty, True, COLOURS[self.settings.difficulty]
+        current_difficulty = get_text_cache(24, COLOURS[self.settings.difficulty]).render(
+            self.settings.difficulty
         )
         target.blit(
             current_difficulty, self.centre_rect(current_difficulty, (150, 380))
@@ -507,30 +544,20 @@ class MenuController:
         :param target:
         :return:
         """
-        up = self.text_font.render(
-            f"UP - {pygame.key.name(self.settings.control_scheme.up)}",
-            True,
-            pygame.Color("#FFFFFF"),
+        up = self.body_text_cache.render(
+            f"UP - {pygame.key.name(self.settings.control_scheme.up)}"
         )
-        down = self.text_font.render(
-            f"DOWN - {pygame.key.name(self.settings.control_scheme.down)}",
-            True,
-            pygame.Color("#FFFFFF"),
+        down = self.body_text_cache.render(
+            f"DOWN - {pygame.key.name(self.settings.control_scheme.down)}"
         )
-        left = self.text_font.render(
-            f"LEFT - {pygame.key.name(self.settings.control_scheme.left)}",
-            True,
-            pygame.Color("#FFFFFF"),
+        left = self.body_text_cache.render(
+            f"LEFT - {pygame.key.name(self.settings.control_scheme.left)}"
         )
-        right = self.text_font.render(
-            f"RIGHT - {pygame.key.name(self.settings.control_scheme.right)}",
-            True,
-            pygame.Color("#FFFFFF"),
+        right = self.body_text_cache.render(
+            f"RIGHT - {pygame.key.name(self.settings.control_scheme.right)}"
         )
-        fire = self.text_font.render(
-            f"FIRE - {pygame.key.name(self.settings.control_scheme.fire)}",
-            True,
-            pygame.Color("#FFFFFF"),
+        fire = self.body_text_cache.render(
+            f"FIRE - {pygame.key.name(self.settings.control_scheme.fire)}"
         )
         surfaces = [up, down, left, right, fire]
         vertical_offset = 200
@@ -544,14 +571,14 @@ class MenuController:
     def fire_decorative_missile(self):
         if len(self.decorative_missiles) < MISSILE_LIMIT:
             self.decorative_missiles.append(
-                Missile(
+                self.missile_pool.acquire(
                     self.game_surface,
                     self.screen_width,
                     self.screen_height,
-                    random.randint(0, self.screen_width),
+                    self.rng.randint(0, self.screen_width),
                     self.screen_height,
-                    random.randint(0, self.screen_width),
-                    random.randint(0, 3*(self.screen_height // 4)),
+                    self.rng.randint(0, self.screen_width),
+                    self.rng.randint(0, 3*(self.screen_height // 4)),
                     5,
                 )
             )
@@ -644,32 +671,59 @@ class MenuController:
 
         return to_be_updated
 
-    def update_all(self) -> None:
+    def step_all(self) -> None:
+        """
+        Advance the decorative missiles by one step, firing a new one
+        and removing any that have left the screen.
+
+        :return: `None`
+        """
+        for instance in self.get_what_needs_to_be_updated():
+            instance.step()
+
+        self.fire_decorative_missile()
+        for missile in self.decorative_missiles[:]:
+            if not missile.visible:
+                self.decorative_missiles.remove(missile)
+                self.missile_pool.release(missile)
+
+    def blit_background(
+        self, background: pygame.Surface, areas: typing.List[pygame.Rect]
+    ) -> None:
+        """
+        Blit the areas of a background that have been drawn onto, rather than the
+        whole mostly transparent surface, onto the game's :class:`pygame.Surface`.
+
+        :param background: :class:`pygame.Surface` the size of the screen to blit
+        :param areas: List[:class:`pygame.Rect`] drawn onto when the background was rendered
+        :return: `None`
         """
-        Blit the menu or settings screen onto the game's :class:`pygame.Surface`, update
+        self.game_surface.blits([(background, area, area) for area in areas], False)
+
+    def draw_all(self, alpha: float = 1.0) -> None:
+        """
+        Blit the menu or settings screen onto the game's :class:`pygame.Surface`, draw
         all instances required in a given frame and blit a separate background if the controller
         is listening for a key input.
 
+        :param alpha: Optional[:class:`float`] fraction of a step elapsed since the last step, used to interpolate positions
         :return: `None`
         """
-        to_be_updated = self.get_what_needs_to_be_updated()
-        for instance in to_be_updated:
-            instance.update()
+        for instance in self.get_what_needs_to_be_updated():
+            instance.draw(alpha)
 
         if self.state == "MENU":
-            self.game_surface.blit(self.menu_background, (0, 0))
+            self.blit_background(self.menu_background, self.menu_background_areas)
         elif self.state == "SETTINGS":
-            background_to_blit = copy.copy(self.settings_background)
-            self.render_current_difficulty(background_to_blit)
-            self.render_current_controls(background_to_blit)
-            self.game_surface.blit(background_to_blit, (0, 0))
+            self.blit_background(
+                self.settings_background, self.settings_background_areas
+            )
+            self.render_current_difficulty(self.game_surface)
+            self.render_current_controls(self.game_surface)
         elif self.state == "INSTRUCTIONS":
-            self.game_surface.blit(self.instructions_background, (0, 0))
-
-        self.fire_decorative_missile()
-        for missile in self.decorative_missiles:
-            if not missile.visible:
-                self.decorative_missiles.remove(missile)
+            self.blit_background(
+                self.instructions_background, self.instructions_background_areas
+            )
 
         if any(
             [
@@ -681,3 +735,12 @@ class MenuController:
             ]
         ):
             self.game_surface.blit(self.listening_for_key_background, (0, 0))
+
+    def update_all(self) -> None:
+        """
+        Step the menu once then draw the result.
+
+        :return: `None`
+        """
+        self.step_all()
+        self.draw_all()
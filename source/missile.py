@@ -2,10 +2,28 @@ import pygame
 import typing
 
 from . import utils
+from .rotation_cache import rotation_cache
+from .assets import assets, IMAGE_PACKAGE
 
 SPRITE_WIDTH = 15
 SPRITE_HEIGHT = 25
 ANGLE_OFFSET = 90
+# Attributes needed to recreate a missile mid-flight
+SNAPSHOT_ATTRIBUTES = (
+    "start_x",
+    "start_y",
+    "end_x",
+    "end_y",
+    "fire_velocity",
+    "x",
+    "y",
+    "previous_x",
+    "previous_y",
+    "velocity_x",
+    "velocity_y",
+    "visible",
+    "moving",
+)
 
 
 class Missile(pygame.sprite.Sprite):
@@ -22,8 +40,6 @@ class Missile(pygame.sprite.Sprite):
     :param fire_velocity: Magnitude of the missile's launch velocity
     """
 
-    asset = None
-
     def __init__(
         self,
         game_surface: pygame.Surface,
@@ -37,42 +53,90 @@ class Missile(pygame.sprite.Sprite):
     ) -> None:
         super().__init__()
 
-        if Missile.asset is None:
-            Missile.asset = utils.load_image(
-                "source.images", "missile.png"
-            ).convert_alpha()
-        self.asset = Missile.asset
+        self.reset(
+            game_surface,
+            screen_width,
+            screen_height,
+            start_x,
+            start_y,
+            end_x,
+            end_y,
+            fire_velocity,
+        )
 
+    def reset(
+        self,
+        game_surface: pygame.Surface,
+        screen_width: int,
+        screen_height: int,
+        start_x: typing.Union[int, float],
+        start_y: typing.Union[int, float],
+        end_x: typing.Union[int, float],
+        end_y: typing.Union[int, float],
+        fire_velocity: typing.Union[int, float],
+    ) -> None:
+        """
+        Reinitialises the missile as if it had just been fired, allowing it to be
+        reused by a :class:`source.pool.ObjectPool`. Takes the same parameters as the constructor.
+
+        :return: `None`
+        """
         self.game_surface = game_surface
         self.visible = True
         self.moving = True
         self.screen_width, self.screen_height = screen_width, screen_height
+        self.start_x, self.start_y = start_x, start_y
+        self.fire_velocity = fire_velocity
         self.x, self.y = start_x, start_y
+        self.previous_x, self.previous_y = self.x, self.y
         self.end_x, self.end_y = end_x, end_y
         self.velocity_x, self.velocity_y = utils.vector_from_positions(
             self.x, self.y, self.end_x, self.end_y, fire_velocity
         )
 
-        self.image = pygame.Surface(
-            (self.asset.get_width(), self.asset.get_height()), pygame.SRCALPHA
-        )
-        self.image.blit(self.asset, (0, 0))
-        self.image = pygame.transform.scale(self.image, (SPRITE_WIDTH, SPRITE_HEIGHT))
-
-        self.image = pygame.transform.rotate(
-            self.image,
+        self.image = rotation_cache.get(
+            "missile",
+            0,
             utils.get_angle_positions(
                 self.x, self.y, self.end_x, self.end_y, ANGLE_OFFSET
             ),
+            Missile.load_image(),
         )
 
-    def update(self) -> None:
+    @staticmethod
+    def load_image() -> pygame.Surface:
+        """
+        Gets the missile image at its drawn size, shared through the :class:`source.assets.AssetRegistry`.
+
+        :return: :class:`pygame.Surface` of the missile
+        """
+        return assets.image(IMAGE_PACKAGE, "missile.png", (SPRITE_WIDTH, SPRITE_HEIGHT))
+
+    def snapshot(self) -> dict:
         """
-        Moves the :class:`pygame.sprite.Sprite` on the game surface if required and draws it if the missile
-        is currently visible.
+        Copies the missile's simulation state into a :class:`dict`.
+
+        :return: :class:`dict` snapshot of the missile
+        """
+        return utils.snapshot_attributes(self, SNAPSHOT_ATTRIBUTES)
+
+    def restore(self, state: dict) -> None:
+        """
+        Restores the missile's simulation state from a snapshot.
+
+        :param state: :class:`dict` made by :func:`source.missile.Missile.snapshot`
+        :return: `None`
+        """
+        utils.restore_attributes(self, state)
+
+    def step(self) -> None:
+        """
+        Moves the :class:`pygame.sprite.Sprite` if required and hides it once
+        it leaves the screen.
 
         :return: `None`
         """
+        self.previous_x, self.previous_y = self.x, self.y
         if self.moving:
             self.x += self.velocity_x
             self.y += self.velocity_y
@@ -85,5 +149,40 @@ class Missile(pygame.sprite.Sprite):
         ):
             self.visible = False
 
-        if self.visible:
-            self.game_surface.blit(self.image, (self.x, self.y))
+    def blits(self, alpha: float = 1.0) -> list:
+        """
+        Gets the missile's image and the position to draw it at if it is currently visible,
+        to be submitted with :func:`pygame.Surface.blits`.
+
+        :param alpha: Optional[:class:`float`] fraction of a step to interpolate the position by
+        :return: :class:`list` of (:class:`pygame.Surface`, position) pairs to draw
+        """
+        if not self.visible:
+            return []
+        return [
+            (
+                self.image,
+                (
+                    utils.interpolate(self.previous_x, self.x, alpha),
+                    utils.interpolate(self.previous_y, self.y, alpha),
+                ),
+            )
+        ]
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draws the missile onto the game surface if it is currently visible.
+
+        :param alpha: Optional[:class:`float`] fraction of a step to interpolate the position by
+        :return: `None`
+        """
+        self.game_surface.blits(self.blits(alpha), False)
+
+    def update(self) -> None:
+        """
+        Steps the missile then draws it onto the game surface.
+
+        :return: `None`
+        """
+        self.step()
+        self.draw()
@@ -0,0 +1,71 @@
+import typing
+
+
+class ObjectPool:
+    """
+    Keeps released objects so that they can be reused instead of allocating new ones.
+    Objects must have a ``reset`` method taking the same arguments as their constructor,
+    which reinitialises them as if they had just been created.
+
+    :param factory: Class or function called with the acquire arguments when the pool is empty
+    """
+
+    def __init__(self, factory: typing.Callable) -> None:
+        self.factory = factory
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """
+        Gets the number of objects waiting in the pool to be reused.
+
+        :return: :class:`int` number of free objects
+        """
+        return len(self.free)
+
+    def reserve(self, count: int, *args) -> None:
+        """
+        Allocates objects up front until the pool holds at least a given number,
+        so that acquiring them later does not allocate.
+
+        :param count: :class:`int` number of free objects the pool should hold
+        :param args: Arguments to create the objects with, they are reset when acquired
+        :return: `None`
+        """
+        for _ in range(count - len(self.free)):
+            self.free.append(self.factory(*args))
+
+    def acquire(self, *args):
+        """
+        Gets an object initialised with the given arguments, reusing a free object if
+        there is one, otherwise creating a new one.
+
+        :param args: Arguments passed to the object's ``reset`` method or constructor
+        :return: The initialised object
+        """
+        if self.free:
+            self.hits += 1
+            instance = self.free.pop()
+            instance.reset(*args)
+            return instance
+        self.misses += 1
+        return self.factory(*args)
+
+    def release(self, instance) -> None:
+        """
+        Returns an object to the pool once it is no longer being used.
+
+        :param instance: Object previously returned by :func:`source.pool.ObjectPool.acquire`
+        :return: `None`
+        """
+        self.free.append(instance)
+
+    def hit_rate(self) -> float:
+        """
+        Gets the fraction of acquires which reused a free object.
+
+        :return: :class:`float` between 0 and 1, 0 if nothing has been acquired
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,128 @@
+import concurrent.futures
+import functools
+import pygame
+import typing
+
+from .assets import assets, FONT_PACKAGE
+from .rotation_cache import rotation_cache
+from .text_cache import get_text_cache, FONT_NAME
+
+# Constants
+WORKERS = 4
+# Sizes of the default font the game draws text at
+FONT_SIZES = (10, 14, 24, 50)
+LABEL_FONT_SIZE = 24
+BAR_WIDTH = 300
+BAR_HEIGHT = 20
+BAR_BORDER = 2
+WHITE = pygame.Color("#FFFFFF")
+BLACK = pygame.Color("#000000")
+
+
+class Preloader:
+    """
+    Loads assets before play starts, so that no image is decoded and no sprite rotated the
+    first time it is needed mid game. Work is split into tasks run on a pool of worker threads,
+    pygame releasing the GIL while it decodes, scales and rotates, while the main thread keeps
+    the window responsive and draws a loading bar as each task completes.
+
+    Fonts are opened on the main thread, as the font renderer is not safe to use from several
+    threads, and rotated surfaces are added to the shared
+    :class:`source.rotation_cache.RotationCache` once they have all been built.
+
+    :param screen: The display :class:`pygame.Surface` to draw the loading bar onto
+    :param workers: Optional[:class:`int`] number of worker threads
+    """
+
+    def __init__(self, screen: pygame.Surface, workers: int = WORKERS) -> None:
+        self.screen = screen
+        self.workers = workers
+
+    def load_fonts(self, sizes: typing.Iterable[int] = FONT_SIZES) -> None:
+        """
+        Opens the default font at each size through the :class:`source.assets.AssetRegistry`.
+
+        :param sizes: Optional iterable of :class:`int` font sizes, :data:`FONT_SIZES` if unspecified
+        :return: `None`
+        """
+        for size in sizes:
+            assets.font(FONT_PACKAGE, FONT_NAME, size)
+
+    def run(self, label: str, tasks: typing.Sequence[typing.Callable]) -> list:
+        """
+        Runs tasks on the worker threads, redrawing the loading bar each time one completes.
+
+        :param label: :class:`str` shown above the loading bar
+        :param tasks: Sequence of callables taking no arguments
+        :return: :class:`list` of the value returned by each task, in the order of the tasks
+        """
+        self.draw_progress(label, 0)
+        with concurrent.futures.ThreadPoolExecutor(self.workers) as executor:
+            futures = [executor.submit(task) for task in tasks]
+            for completed, _ in enumerate(concurrent.futures.as_completed(futures), 1):
+                self.draw_progress(label, completed / len(futures))
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def rotate(
+        base_surface: pygame.Surface, angles: typing.Iterable[typing.Union[int, float]]
+    ) -> typing.List[typing.Tuple[typing.Union[int, float], pygame.Surface]]:
+        """
+        Rotates a surface to each angle, safe to call on a worker thread.
+
+        :param base_surface: The unrotated :class:`pygame.Surface`
+        :param angles: Iterable of Union[:class:`int`, :class:`float`] quantized angles in degrees
+        :return: :class:`list` of :class:`tuple` containing each angle and the rotated :class:`pygame.Surface`
+        """
+        return [(angle, pygame.transform.rotate(base_surface, angle)) for angle in angles]
+
+    def warm_rotations(
+        self,
+        label: str,
+        rotations: typing.Sequence[
+            typing.Tuple[str, int, pygame.Surface, typing.Sequence[typing.Union[int, float]]]
+        ],
+    ) -> None:
+        """
+        Builds rotated surfaces ahead of time and adds them to the shared rotation cache.
+
+        :param label: :class:`str` shown above the loading bar
+        :param rotations: Sequence of :class:`tuple` containing the asset name, frame index,
+            unrotated :class:`pygame.Surface` and quantized angles to rotate it to
+        :return: `None`
+        """
+        results = self.run(
+            label,
+            [
+                functools.partial(Preloader.rotate, base_surface, angles)
+                for _, _, base_surface, angles in rotations
+            ],
+        )
+        for (asset, frame, _, _), rotated in zip(rotations, results):
+            for angle, surface in rotated:
+                rotation_cache.add(asset, frame, angle, surface)
+
+    def draw_progress(self, label: str, fraction: float) -> None:
+        """
+        Draws the label and loading bar in the centre of the screen and updates the display.
+
+        :param label: :class:`str` shown above the loading bar
+        :param fraction: :class:`float` between 0 and 1 of the bar to fill
+        :return: `None`
+        """
+        pygame.event.pump()
+        self.screen.fill(BLACK)
+        bar_rect = pygame.Rect(0, 0, BAR_WIDTH, BAR_HEIGHT)
+        bar_rect.center = self.screen.get_rect().center
+
+        text = get_text_cache(LABEL_FONT_SIZE, WHITE).render(label)
+        text_rect = text.get_rect()
+        text_rect.midbottom = (bar_rect.centerx, bar_rect.top - LABEL_FONT_SIZE // 2)
+        self.screen.blit(text, text_rect)
+
+        pygame.draw.rect(self.screen, WHITE, bar_rect, BAR_BORDER)
+        filled_rect = bar_rect.inflate(-4 * BAR_BORDER, -4 * BAR_BORDER)
+        filled_rect.width = round(filled_rect.width * fraction)
+        if filled_rect.width:
+            self.screen.fill(WHITE, filled_rect)
+        pygame.display.flip()
@@ -0,0 +1,262 @@
+import collections
+import csv
+import os
+import time
+import typing
+
+import pygame
+
+from .text_cache import TextCache, get_text_cache
+from .assets import assets
+
+# Constants
+# Each render layer is timed separately while stepping the simulation and while drawing
+STAGES = [
+    "wave_creation",
+    "collisions_player",
+    "collisions_towers",
+    "towers_step",
+    "enemies_step",
+    "missiles_step",
+    "reticle_step",
+    "hud_step",
+    "towers_draw",
+    "enemies_draw",
+    "missiles_draw",
+    "reticle_draw",
+    "hud_draw",
+    "flip",
+]
+ROLLING_WINDOW = 240
+OVERLAY_REFRESH_FRAMES = 30
+FONT_SIZE = 14
+CSV_ENVIRONMENT_VARIABLE = "MISSILE_DEFENCE_PROFILE_CSV"
+
+
+def percentile(sorted_values: typing.List[int], fraction: float) -> int:
+    """
+    Gets the value below which a given fraction of a sorted list of values fall,
+    using the nearest-rank method.
+
+    :param sorted_values: :class:`list` of values sorted in ascending order
+    :param fraction: :class:`float` between 0 and 1, eg 0.95 for the 95th percentile
+    :return: The percentile value, 0 if there are no values
+    """
+    if not sorted_values:
+        return 0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class NullStage:
+    """
+    Context manager returned by :func:`source.profiler.FrameProfiler.stage` while profiling is
+    disabled. Does nothing, so instrumented code costs a single method call.
+    """
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *_) -> None:
+        pass
+
+
+NULL_STAGE = NullStage()
+
+
+class Stage:
+    """
+    Context manager which times the code inside it with :func:`time.perf_counter_ns` and
+    adds the result to the current frame of a :class:`source.profiler.FrameProfiler`.
+
+    :param profiler: The :class:`source.profiler.FrameProfiler` to record into
+    :param name: :class:`str` name of the stage being timed
+    """
+
+    def __init__(self, profiler, name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *_) -> None:
+        self.profiler.current_frame[self.name] += time.perf_counter_ns() - self.start
+
+
+class FrameProfiler:
+    """
+    Times each stage of a frame, keeping a rolling window of recent frames to display
+    p50/p95/p99 timings in a toggleable overlay and optionally writing every frame to a CSV file.
+
+    Timing is only performed while the overlay is visible or a CSV file is being written,
+    otherwise every stage is a no-op.
+
+    :param csv_path: Optional[:class:`str`] path of a CSV file to write per-frame timings to
+    """
+
+    def __init__(self, csv_path: typing.Optional[str] = None) -> None:
+        self.overlay_visible = False
+        self.enabled = csv_path is not None
+        self.frame_number = 0
+        self.current_frame = dict.fromkeys(STAGES, 0)
+        self.history = {name: collections.deque(maxlen=ROLLING_WINDOW) for name in STAGES}
+        # Time and total text renders at the end of each frame, to measure renders per second
+        self.render_samples = collections.deque(maxlen=ROLLING_WINDOW)
+        # Seconds the last warm restart took, from the restart key to the menu being ready
+        self.restart_time = None
+        self.overlay_surface = None
+
+        self.csv_file = None
+        self.csv_writer = None
+        if csv_path is not None:
+            # Each run of the game replaces the previous file, so frame numbers are unique,
+            # warm restarts keep the same profiler and carry on writing to it
+            self.csv_file = open(csv_path, "w", newline="")
+            self.csv_writer = csv.writer(self.csv_file)
+            self.csv_writer.writerow(["frame"] + [f"{name}_ns" for name in STAGES])
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Creates a profiler which writes CSV output if the ``MISSILE_DEFENCE_PROFILE_CSV``
+        environment variable is set to a file path.
+
+        :return: :class:`source.profiler.FrameProfiler`
+        """
+        return cls(os.environ.get(CSV_ENVIRONMENT_VARIABLE) or None)
+
+    def toggle_overlay(self) -> None:
+        """
+        Shows or hides the overlay, enabling timing while it is visible.
+
+        :return: `None`
+        """
+        self.overlay_visible = not self.overlay_visible
+        self.enabled = self.overlay_visible or self.csv_writer is not None
+
+    def stage(self, name: str) -> typing.Union[Stage, NullStage]:
+        """
+        Gets a context manager timing the code inside it as part of a named stage.
+
+        :param name: :class:`str` name of the stage, one of :data:`STAGES`
+        :return: Context manager timing the stage
+        """
+        if self.enabled:
+            return Stage(self, name)
+        return NULL_STAGE
+
+    def end_frame(self) -> None:
+        """
+        Stores the timings of the frame just finished and starts a new frame.
+
+        :return: `None`
+        """
+        if not self.enabled:
+            return
+        frame = self.current_frame
+        for name in STAGES:
+            self.history[name].append(frame[name])
+        self.render_samples.append((time.perf_counter(), TextCache.rasterizations))
+        if self.csv_writer is not None:
+            self.csv_writer.writerow([self.frame_number] + [frame[name] for name in STAGES])
+        if self.overlay_visible and self.frame_number % OVERLAY_REFRESH_FRAMES == 0:
+            self.overlay_surface = None
+        self.current_frame = dict.fromkeys(STAGES, 0)
+        self.frame_number += 1
+
+    def record_restart(self, seconds: float) -> None:
+        """
+        Stores how long the last warm restart of the game took, shown in the overlay.
+
+        :param seconds: :class:`float` duration of the restart in seconds
+        :return: `None`
+        """
+        self.restart_time = seconds
+        self.overlay_surface = None
+
+    def summary(self) -> typing.Dict[str, typing.Tuple[float, float, float]]:
+        """
+        Calculates the p50, p95 and p99 time of each stage over the rolling window.
+
+        :return: :class:`dict` of stage name to a :class:`tuple` of p50, p95, p99 in milliseconds
+        """
+        result = {}
+        for name in STAGES:
+            values = sorted(self.history[name])
+            result[name] = tuple(
+                percentile(values, fraction) / 1000000 for fraction in (0.5, 0.95, 0.99)
+            )
+        return result
+
+    def text_renders_per_second(self) -> float:
+        """
+        Calculates how many times text was rendered per second over the rolling window,
+        counted by :class:`source.text_cache.TextCache`.
+
+        :return: :class:`float` text renders per second, 0 until two frames have been timed
+        """
+        if len(self.render_samples) < 2:
+            return 0.0
+        (start_time, start_renders), (end_time, end_renders) = (
+            self.render_samples[0],
+            self.render_samples[-1],
+        )
+        if end_time <= start_time:
+            return 0.0
+        return (end_renders - start_renders) / (end_time - start_time)
+
+    def render_overlay(self) -> pygame.Surface:
+        """
+        Renders the current summary into a translucent surface.
+
+        :return: :class:`pygame.Surface` containing the overlay
+        """
+        text_cache = get_text_cache(FONT_SIZE, pygame.Color("#00FF00"))
+        lines = [f"{'stage':<18}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for name, (p50, p95, p99) in self.summary().items():
+            lines.append(f"{name:<18}{p50:>7.2f}{p95:>7.2f}{p99:>7.2f}")
+        lines.append(f"{'text renders/s':<18}{self.text_renders_per_second():>7.1f}")
+        lines.append(f"{'asset hits/misses':<18}{assets.hits:>7}{assets.misses:>7}")
+        lines.append(f"{'asset KB':<18}{assets.bytes_held / 1024:>7.0f}")
+        if self.restart_time is not None:
+            lines.append(f"{'restart ms':<18}{self.restart_time * 1000:>7.2f}")
+
+        surface = pygame.Surface(
+            (FONT_SIZE * 22, (len(lines) + 1) * FONT_SIZE), pygame.SRCALPHA
+        )
+        surface.fill((0, 0, 0, 180))
+        for index, line in enumerate(lines):
+            text_cache.draw(
+                surface, line, (FONT_SIZE // 2, FONT_SIZE // 2 + index * FONT_SIZE)
+            )
+        return surface
+
+    def draw(self, target: pygame.Surface) -> None:
+        """
+        Draws the overlay in the bottom left of the target surface if it is visible.
+        The overlay is only re-rendered every few frames.
+
+        :param target: :class:`pygame.Surface` to draw onto
+        :return: `None`
+        """
+        if not self.overlay_visible:
+            return
+        if self.overlay_surface is None:
+            self.overlay_surface = self.render_overlay()
+        overlay_rect = self.overlay_surface.get_rect()
+        overlay_rect.bottomleft = target.get_rect().bottomleft
+        target.blit(self.overlay_surface, overlay_rect)
+
+    def close(self) -> None:
+        """
+        Closes the CSV file if one is being written.
+
+        :return: `None`
+        """
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = None
+            self.csv_writer = None
+            self.enabled = self.overlay_visible
@@ -0,0 +1,54 @@
+import pygame
+import typing
+
+from .profiler import FrameProfiler
+
+# Constants
+# Layers in the order they are drawn, the starfield background is drawn by the game beforehand
+LAYERS = ("towers", "enemies", "missiles", "reticle", "hud")
+
+
+class RenderQueue:
+    """
+    Collects everything to be drawn in a frame into layers, each a list of (surface, position)
+    or (surface, position, area) tuples as taken by :func:`pygame.Surface.blits`. Once every
+    instance has been queued, each layer is drawn with a single :func:`pygame.Surface.blits` call
+    in the order of :data:`LAYERS`, rather than one :func:`pygame.Surface.blit` call per sprite.
+
+    :param layers: Optional[:class:`tuple`] of :class:`str` layer names in the order they are drawn
+    """
+
+    def __init__(self, layers: typing.Tuple[str, ...] = LAYERS) -> None:
+        self.layers = {layer: [] for layer in layers}
+        # Profiler stage each layer is timed under, the same stage its blits were gathered under
+        self.stages = {layer: f"{layer}_draw" for layer in layers}
+
+    def extend(self, layer: str, blits: list) -> None:
+        """
+        Adds blits to the end of a layer, so they are drawn over anything already in it.
+
+        :param layer: :class:`str` name of the layer
+        :param blits: :class:`list` of tuples taken by :func:`pygame.Surface.blits`
+        :return: `None`
+        """
+        self.layers[layer] += blits
+
+    def submit(
+        self, target: pygame.Surface, profiler: typing.Optional[FrameProfiler] = None
+    ) -> None:
+        """
+        Draws every layer onto the target in order and empties the queue.
+
+        :param target: :class:`pygame.Surface` to draw onto
+        :param profiler: Optional[:class:`source.profiler.FrameProfiler`] to time each layer under its draw stage, eg ``towers_draw``
+        :return: `None`
+        """
+        for layer, blits in self.layers.items():
+            if not blits:
+                continue
+            if profiler is None:
+                target.blits(blits, False)
+            else:
+                with profiler.stage(self.stages[layer]):
+                    target.blits(blits, False)
+            blits.clear()
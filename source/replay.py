@@ -0,0 +1,452 @@
+import argparse
+import os
+import pickle
+import queue
+import struct
+import threading
+import time
+import typing
+import zlib
+
+import pygame
+
+from .settings import Settings
+
+# Constants
+MAGIC = b"MDRP"
+INDEX_MAGIC = b"MDRI"
+VERSION = 6
+# magic, version, signed seed, difficulty, enemy backend, width, height, up, down, left, right, fire
+HEADER = struct.Struct("<4sHq16s16sHH5i")
+RECORD_KIND = struct.Struct("<B")
+# tick, event type, key or button, mouse x, mouse y
+EVENT_RECORD = struct.Struct("<IBiHH")
+# tick, length of the compressed snapshot which follows
+KEYFRAME_RECORD = struct.Struct("<II")
+INDEX_ENTRY = struct.Struct("<IQ")
+# number of index entries, last step recorded, offset of the first entry, magic
+INDEX_FOOTER = struct.Struct("<IIQ4s")
+KIND_EVENT = 1
+KIND_KEYFRAME = 2
+# Only the event types that change the simulation are recorded
+EVENT_CODES = {pygame.KEYDOWN: 1, pygame.KEYUP: 2, pygame.MOUSEBUTTONDOWN: 3}
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+KEYFRAME_INTERVAL = 600
+FLUSH_BYTES = 4096
+RECORD_ENVIRONMENT_VARIABLE = "MISSILE_DEFENCE_RECORD"
+
+
+def encode_event(tick: int, event: pygame.event.Event) -> bytes:
+    """
+    Packs a single event into its fixed size binary record.
+
+    :param tick: :class:`int` simulation step the event was processed before
+    :param event: :class:`pygame.event.Event` to pack, one of the types in :data:`EVENT_CODES`
+    :return: :class:`bytes` record
+    """
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        value = event.button
+        x, y = event.pos
+    else:
+        value = event.key
+        x, y = 0, 0
+    return RECORD_KIND.pack(KIND_EVENT) + EVENT_RECORD.pack(
+        tick, EVENT_CODES[event.type], value, x, y
+    )
+
+
+def decode_event(event_type: int, value: int, x: int, y: int) -> pygame.event.Event:
+    """
+    Recreates an event from the fields of its binary record.
+
+    :param event_type: :class:`int` code from :data:`EVENT_CODES`
+    :param value: :class:`int` key or mouse button
+    :param x: :class:`int` x coordinate of the mouse
+    :param y: :class:`int` y coordinate of the mouse
+    :return: :class:`pygame.event.Event`
+    """
+    pygame_type = EVENT_TYPES[event_type]
+    if pygame_type == pygame.MOUSEBUTTONDOWN:
+        return pygame.event.Event(pygame_type, button=value, pos=(x, y))
+    return pygame.event.Event(pygame_type, key=value, unicode="")
+
+
+def numbered_path(path: str, game_number: int) -> str:
+    """
+    Gets the path to record a game to, the path itself for the first game and with the game's
+    number added before the extension for each later game, so that warm restarts do not
+    overwrite earlier recordings, eg game.mdr, game-2.mdr, game-3.mdr.
+
+    :param path: :class:`str` path the recordings are named after
+    :param game_number: :class:`int` number of the game since the program started, from 1
+    :return: :class:`str` path of the game's recording
+    """
+    if game_number <= 1:
+        return path
+    root, extension = os.path.splitext(path)
+    return f"{root}-{game_number}{extension}"
+
+
+class ReplayRecorder:
+    """
+    Records the input fed to a :class:`source.game_controller.GameController` into a compact
+    binary file, along with the seed and settings needed to reproduce the game exactly.
+
+    Events are buffered in memory and handed to a background thread in chunks, as are
+    periodic snapshots of the simulation, which the thread compresses and writes.
+    The game loop therefore never waits on the disk or on compression.
+    An index of keyframe offsets is appended when the recorder is closed, allowing
+    playback to seek without reading the whole file.
+
+    :param path: :class:`str` path of the file to write
+    :param controller: The :class:`source.game_controller.GameController` being recorded
+    :param keyframe_interval: Optional[:class:`int`] number of steps between snapshots
+    """
+
+    def __init__(
+        self, path: str, controller, keyframe_interval: int = KEYFRAME_INTERVAL
+    ) -> None:
+        self.keyframe_interval = keyframe_interval
+        self.file = open(path, "wb")
+        self.buffer = bytearray()
+        self.index = []
+        self.ticks = controller.ticks
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self.write_records, daemon=True)
+
+        settings = controller.settings
+        control_scheme = controller.control_scheme
+        self.file.write(
+            HEADER.pack(
+                MAGIC,
+                VERSION,
+                controller.seed,
+                settings.difficulty.encode(),
+                settings.enemy_backend.encode(),
+                controller.screen_width,
+                controller.screen_height,
+                control_scheme.up,
+                control_scheme.down,
+                control_scheme.left,
+                control_scheme.right,
+                control_scheme.fire,
+            )
+        )
+        self.writer.start()
+        self.record_keyframe(controller)
+
+    @classmethod
+    def from_environment(cls, controller, game_number: int = 1):
+        """
+        Creates a recorder if the ``MISSILE_DEFENCE_RECORD`` environment variable is set to a file path.
+        Each game played gets its own file, see :func:`source.replay.numbered_path`.
+
+        :param controller: The :class:`source.game_controller.GameController` to record
+        :param game_number: Optional[:class:`int`] number of the game since the program started, from 1
+        :return: Optional[:class:`source.replay.ReplayRecorder`]
+        """
+        path = os.environ.get(RECORD_ENVIRONMENT_VARIABLE)
+        return None if not path else cls(numbered_path(path, game_number), controller)
+
+    def write_records(self) -> None:
+        """
+        Runs on the writer thread, writing chunks of event records and compressing keyframes
+        until `None` is received.
+
+        :return: `None`
+        """
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if isinstance(item, bytearray):
+                self.file.write(item)
+                continue
+            tick, state = item
+            data = zlib.compress(pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
+            self.index.append((tick, self.file.tell()))
+            self.file.write(
+                RECORD_KIND.pack(KIND_KEYFRAME) + KEYFRAME_RECORD.pack(tick, len(data))
+            )
+            self.file.write(data)
+
+    def flush(self) -> None:
+        """
+        Hands the buffered event records to the writer thread.
+
+        :return: `None`
+        """
+        if self.buffer:
+            self.queue.put(self.buffer)
+            self.buffer = bytearray()
+
+    def record_event(self, tick: int, event: pygame.event.Event) -> None:
+        """
+        Buffers an event if it is one that affects the simulation.
+
+        :param tick: :class:`int` simulation step the event is being processed before
+        :param event: :class:`pygame.event.Event` passed to the controller
+        :return: `None`
+        """
+        if event.type not in EVENT_CODES:
+            return
+        self.buffer += encode_event(tick, event)
+        if len(self.buffer) >= FLUSH_BYTES:
+            self.flush()
+
+    def record_keyframe(self, controller) -> None:
+        """
+        Snapshots the controller and queues it to be written as a keyframe.
+
+        :param controller: The :class:`source.game_controller.GameController` being recorded
+        :return: `None`
+        """
+        self.flush()
+        self.queue.put((controller.ticks, controller.snapshot()))
+
+    def step(self, controller) -> None:
+        """
+        Called after every simulation step, records a keyframe when one is due.
+        No keyframes are recorded after the game is over.
+
+        :param controller: The :class:`source.game_controller.GameController` being recorded
+        :return: `None`
+        """
+        self.ticks = controller.ticks
+        if (
+            controller.ticks % self.keyframe_interval == 0
+            and not controller.internal_game_over
+        ):
+            self.record_keyframe(controller)
+
+    def close(self) -> None:
+        """
+        Writes any remaining records and the keyframe index, then closes the file.
+
+        :return: `None`
+        """
+        if self.file is None:
+            return
+        self.flush()
+        self.queue.put(None)
+        self.writer.join()
+        index_offset = self.file.tell()
+        for tick, offset in self.index:
+            self.file.write(INDEX_ENTRY.pack(tick, offset))
+        self.file.write(
+            INDEX_FOOTER.pack(len(self.index), self.ticks, index_offset, INDEX_MAGIC)
+        )
+        self.file.close()
+        self.file = None
+
+
+class ReplayPlayer:
+    """
+    Plays back a file written by :class:`source.replay.ReplayRecorder` through a headless
+    :class:`source.game_controller.GameController`, as fast as the simulation can run.
+
+    :param path: :class:`str` path of the replay file
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as replay_file:
+            self.data = replay_file.read()
+
+        (
+            magic,
+            version,
+            self.seed,
+            difficulty,
+            backend,
+            self.screen_width,
+            self.screen_height,
+            *keys,
+        ) = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay file")
+        self.difficulty = difficulty.rstrip(b"\0").decode()
+        self.backend = backend.rstrip(b"\0").decode()
+        self.keys = keys
+
+        self.events = []
+        self.keyframes = {}
+        self.ticks = 0
+        self.read_records()
+        self.controller = None
+
+    def read_records(self) -> None:
+        """
+        Reads every event and the offset of every keyframe. Uses the index written on close
+        to find the end of the records, otherwise scans to the end of the file so that
+        recordings cut short by a crash can still be played.
+
+        :return: `None`
+        """
+        end = len(self.data)
+        footer_offset = end - INDEX_FOOTER.size
+        if footer_offset >= HEADER.size:
+            count, ticks, index_offset, magic = INDEX_FOOTER.unpack_from(
+                self.data, footer_offset
+            )
+            if magic == INDEX_MAGIC:
+                self.ticks = ticks
+                end = index_offset
+                for entry in range(count):
+                    tick, offset = INDEX_ENTRY.unpack_from(
+                        self.data, index_offset + entry * INDEX_ENTRY.size
+                    )
+                    self.keyframes[tick] = offset
+
+        offset = HEADER.size
+        while offset < end:
+            (kind,) = RECORD_KIND.unpack_from(self.data, offset)
+            offset += RECORD_KIND.size
+            if kind == KIND_EVENT:
+                if offset + EVENT_RECORD.size > end:
+                    break
+                self.events.append(EVENT_RECORD.unpack_from(self.data, offset))
+                offset += EVENT_RECORD.size
+            elif kind == KIND_KEYFRAME:
+                if offset + KEYFRAME_RECORD.size > end:
+                    break
+                tick, length = KEYFRAME_RECORD.unpack_from(self.data, offset)
+                if offset + KEYFRAME_RECORD.size + length > end:
+                    break
+                self.keyframes.setdefault(tick, offset - RECORD_KIND.size)
+                offset += KEYFRAME_RECORD.size + length
+            else:
+                break
+
+    def last_tick(self) -> int:
+        """
+        Gets the last step that the recording is known to reach, which is the last
+        event or keyframe if the recording was cut short before its index was written.
+
+        :return: :class:`int` last recorded step
+        """
+        return max(
+            [self.ticks] + [event[0] for event in self.events[-1:]] + list(self.keyframes)
+        )
+
+    def load_keyframe(self, tick: int) -> dict:
+        """
+        Decompresses the keyframe recorded at a given step.
+
+        :param tick: :class:`int` step of the keyframe
+        :return: :class:`dict` made by :func:`source.game_controller.GameController.snapshot`
+        """
+        offset = self.keyframes[tick] + RECORD_KIND.size
+        _, length = KEYFRAME_RECORD.unpack_from(self.data, offset)
+        offset += KEYFRAME_RECORD.size
+        return pickle.loads(zlib.decompress(self.data[offset : offset + length]))
+
+    def create_controller(self):
+        """
+        Creates a headless controller with the recorded seed and settings.
+
+        :return: :class:`source.game_controller.GameController`
+        """
+        # Imported here so that the game module is only loaded when a replay is played
+        from .game import create_headless_controller
+
+        settings = Settings()
+        settings.seed = self.seed
+        settings.difficulty = self.difficulty
+        settings.enemy_backend = self.backend
+        for direction, key in zip(("up", "down", "left", "right", "fire"), self.keys):
+            settings.change_keybind(direction, key)
+        return create_headless_controller(settings)
+
+    def seek(self, tick: int) -> None:
+        """
+        Moves playback to a given step by restoring the closest earlier keyframe,
+        then simulating the remaining steps.
+
+        :param tick: :class:`int` step to seek to
+        :return: `None`
+        """
+        self.controller = self.create_controller()
+        keyframe_ticks = [keyframe for keyframe in self.keyframes if keyframe <= tick]
+        if keyframe_ticks:
+            self.controller.restore(self.load_keyframe(max(keyframe_ticks)))
+        self.play(tick)
+
+    def play(self, until: typing.Optional[int] = None) -> None:
+        """
+        Simulates from the current step without any frame rate cap, feeding in each
+        recorded event before the step it was originally processed before.
+        Stops at the given step, the end of the recording, or when the game is over.
+
+        :param until: Optional[:class:`int`] step to stop at, the end of the recording if unspecified
+        :return: `None`
+        """
+        if self.controller is None:
+            # Starts from the first keyframe, which holds any state set before recording began
+            self.seek(0)
+        controller = self.controller
+        until = self.last_tick() if until is None else until
+
+        events = self.events
+        # Events are recorded in order, so skip straight past those already simulated
+        low, high = 0, len(events)
+        while low < high:
+            middle = (low + high) // 2
+            if events[middle][0] < controller.ticks:
+                low = middle + 1
+            else:
+                high = middle
+        event_index = low
+
+        while controller.ticks < until and not controller.internal_game_over:
+            while event_index < len(events) and events[event_index][0] == controller.ticks:
+                controller.process_event(decode_event(*events[event_index][1:]))
+                event_index += 1
+            controller.step_all()
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    :return: :class:`argparse.Namespace` of arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="python3 -m source.replay",
+        description="Plays back a recorded game headlessly as fast as possible.",
+    )
+    parser.add_argument("path", help="replay file to play")
+    parser.add_argument("--seek", type=int, help="step to start playing from")
+    parser.add_argument("--until", type=int, help="step to stop playing at")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    Plays back a replay file and prints the final score and simulation speed.
+
+    :return: `None`
+    """
+    arguments = parse_arguments()
+    player = ReplayPlayer(arguments.path)
+    if arguments.seek is not None:
+        player.seek(arguments.seek)
+    seek_ticks = 0 if player.controller is None else player.controller.ticks
+    start = time.perf_counter()
+    player.play(arguments.until)
+    elapsed = time.perf_counter() - start
+
+    controller = player.controller
+    print(
+        f"ticks {controller.ticks} score {controller.score.value} "
+        f"lives {controller.lives.lives} wave {controller.wave_number}"
+    )
+    print(
+        f"{controller.ticks - seek_ticks} steps in {elapsed:.2f}s "
+        f"({(controller.ticks - seek_ticks) / elapsed:.0f} steps/s, "
+        f"{len(player.keyframes)} keyframes)"
+    )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,20 @@ import pygame
 import typing
 
 from . import utils
+from .assets import assets, IMAGE_PACKAGE
 
 # Constants
 RETICLE_SPEED = 6.5
+SNAPSHOT_ATTRIBUTES = (
+    "x",
+    "y",
+    "previous_x",
+    "previous_y",
+    "moving_up",
+    "moving_down",
+    "moving_left",
+    "moving_right",
+)
 
 
 def clamp(
@@ -36,14 +47,10 @@ class Reticle:
     def __init__(
         self, game_surface: pygame.Surface, screen_width: int, screen_height: int
     ) -> None:
-        self.asset = utils.load_image("source.images", "reticle.png").convert_alpha()
-        self.asset_width, self.asset_height = (
-            self.asset.get_width(),
-            self.asset.get_height(),
-        )
         self.game_surface = game_surface
         self.screen_width, self.screen_height = screen_width, screen_height
         self.x, self.y = game_surface.get_rect().center
+        self.previous_x, self.previous_y = self.x, self.y
 
         self.moving_up = False
         self.moving_down = False
@@ -52,11 +59,16 @@ class Reticle:
 
         self.speed = RETICLE_SPEED
 
-        self.image = pygame.Surface(
-            (self.asset_width, self.asset_height), pygame.SRCALPHA
-        )
-        self.image.blit(self.asset, (0, 0))
-        self.image = pygame.transform.scale(self.image, (50, 50))
+        self.image = Reticle.load_image()
+
+    @staticmethod
+    def load_image() -> pygame.Surface:
+        """
+        Gets the reticle image at its drawn size, shared through the :class:`source.assets.AssetRegistry`.
+
+        :return: :class:`pygame.Surface` of the reticle
+        """
+        return assets.image(IMAGE_PACKAGE, "reticle.png", (50, 50))
 
     def current_position(self) -> typing.Tuple[int, int]:
         """
@@ -102,12 +114,30 @@ class Reticle:
         """
         self.moving_right = enable
 
-    def update(self) -> None:
+    def snapshot(self) -> dict:
         """
-        Move the reticle in directions indicated by the flags and draw it onto the game surface.
+        Copies the reticle's position and movement flags into a :class:`dict`.
+
+        :return: :class:`dict` snapshot of the reticle
+        """
+        return utils.snapshot_attributes(self, SNAPSHOT_ATTRIBUTES)
+
+    def restore(self, state: dict) -> None:
+        """
+        Restores the reticle's position and movement flags from a snapshot.
+
+        :param state: :class:`dict` made by :func:`source.reticle.Reticle.snapshot`
+        :return: `None`
+        """
+        utils.restore_attributes(self, state)
+
+    def step(self) -> None:
+        """
+        Move the reticle in directions indicated by the flags.
 
         :return: `None`
         """
+        self.previous_x, self.previous_y = self.x, self.y
         if self.moving_up:
             self.y -= self.speed
         if self.moving_down:
@@ -120,10 +150,40 @@ class Reticle:
         self.x = clamp(self.x, self.screen_width)
         self.y = clamp(self.y, self.screen_height - self.speed)
 
-        self.game_surface.blit(
-            self.image,
+    def blits(self, alpha: float = 1.0) -> list:
+        """
+        Gets the reticle's image and the position to draw it at, centred on its position,
+        to be submitted with :func:`pygame.Surface.blits`.
+
+        :param alpha: Optional[:class:`float`] fraction of a step to interpolate the position by
+        :return: :class:`list` of (:class:`pygame.Surface`, position) pairs to draw
+        """
+        return [
             (
-                self.x - self.image.get_width() // 2,
-                self.y - self.image.get_height() // 2,
-            ),
-        )
+                self.image,
+                (
+                    utils.interpolate(self.previous_x, self.x, alpha)
+                    - self.image.get_width() // 2,
+                    utils.interpolate(self.previous_y, self.y, alpha)
+                    - self.image.get_height() // 2,
+                ),
+            )
+        ]
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draw the reticle onto the game surface centred on its position.
+
+        :param alpha: Optional[:class:`float`] fraction of a step to interpolate the position by
+        :return: `None`
+        """
+        self.game_surface.blits(self.blits(alpha), False)
+
+    def update(self) -> None:
+        """
+        Move the reticle in directions indicated by the flags and draw it onto the game surface.
+
+        :return: `None`
+        """
+        self.step()
+        self.draw()
@@ -0,0 +1,173 @@
+import collections
+import math
+import typing
+
+import pygame
+
+# Constants
+ANGLE_STEP = 3
+MAX_CACHE_BYTES = 16 * 1024 * 1024
+
+
+def surface_size_in_bytes(surface: pygame.Surface) -> int:
+    """
+    Calculates the approximate amount of memory held by a surface's pixel buffer.
+
+    :param surface: The :class:`pygame.Surface` to measure
+    :return: :class:`int` size of the pixel buffer in bytes
+    """
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class RotationCache:
+    """
+    Process-wide least recently used cache of rotated surfaces, shared by the
+    :class:`source.enemy.Enemy`, :class:`source.missile.Missile` and :class:`source.tower.Tower`
+    sprites so that each rotated surface is only built once.
+
+    Surfaces are keyed by asset name, frame index and angle, the angle being quantized to
+    the nearest multiple of the angle step so that sprites facing almost the same direction
+    share a surface.
+
+    :param angle_step: Union[:class:`int`, :class:`float`] size in degrees of each angle bucket
+    :param max_bytes: :class:`int` maximum amount of pixel memory to hold before evicting surfaces
+    """
+
+    def __init__(
+        self,
+        angle_step: typing.Union[int, float] = ANGLE_STEP,
+        max_bytes: int = MAX_CACHE_BYTES,
+    ) -> None:
+        self.angle_step = angle_step
+        self.max_bytes = max_bytes
+        self.surfaces = collections.OrderedDict()
+        self.bytes_held = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """
+        Gets the number of rotated surfaces currently held by the cache.
+
+        :return: :class:`int` number of cached surfaces
+        """
+        return len(self.surfaces)
+
+    def configure(
+        self,
+        angle_step: typing.Optional[typing.Union[int, float]] = None,
+        max_bytes: typing.Optional[int] = None,
+    ) -> None:
+        """
+        Changes the angle step and/or memory cap of the cache. Changing the angle step
+        empties the cache as existing keys would no longer match.
+
+        :param angle_step: Optional[Union[:class:`int`, :class:`float`]] new angle bucket size in degrees
+        :param max_bytes: Optional[:class:`int`] new memory cap in bytes
+        :return: `None`
+        """
+        if angle_step is not None and angle_step != self.angle_step:
+            self.angle_step = angle_step
+            self.clear()
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+            self.evict_if_required()
+
+    def clear(self) -> None:
+        """
+        Removes every surface from the cache.
+
+        :return: `None`
+        """
+        self.surfaces.clear()
+        self.bytes_held = 0
+
+    def quantize(self, angle: typing.Union[int, float]) -> typing.Union[int, float]:
+        """
+        Rounds an angle to the nearest multiple of the angle step, wrapped into the range [0, 360).
+
+        :param angle: Union[:class:`int`, :class:`float`] angle in degrees
+        :return: Union[:class:`int`, :class:`float`] quantized angle in degrees
+        """
+        if self.angle_step <= 0:
+            return angle % 360
+        return (round(angle / self.angle_step) * self.angle_step) % 360
+
+    def angles(self) -> typing.List[typing.Union[int, float]]:
+        """
+        Gets every angle a surface can be cached at, used to build them ahead of time.
+
+        :return: :class:`list` of Union[:class:`int`, :class:`float`] quantized angles in degrees, empty if angles are not quantized
+        """
+        if self.angle_step <= 0:
+            return []
+        steps = math.ceil(360 / self.angle_step)
+        return sorted({self.quantize(index * self.angle_step) for index in range(steps)})
+
+    def evict_if_required(self) -> None:
+        """
+        Evicts the least recently used surfaces until the memory held is within the cap.
+
+        :return: `None`
+        """
+        while self.bytes_held > self.max_bytes and self.surfaces:
+            _, surface = self.surfaces.popitem(last=False)
+            self.bytes_held -= surface_size_in_bytes(surface)
+
+    def get(
+        self,
+        asset: str,
+        frame: int,
+        angle: typing.Union[int, float],
+        base_surface: pygame.Surface,
+    ) -> pygame.Surface:
+        """
+        Gets the rotated version of a surface, rotating and storing it if it is not already cached.
+
+        :param asset: :class:`str` name of the asset the surface belongs to
+        :param frame: :class:`int` index of the animation frame, 0 for single frame assets
+        :param angle: Union[:class:`int`, :class:`float`] angle in degrees to rotate by
+        :param base_surface: The unrotated :class:`pygame.Surface` to rotate on a cache miss
+        :return: The rotated :class:`pygame.Surface`
+        """
+        quantized_angle = self.quantize(angle)
+        key = (asset, frame, quantized_angle)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = pygame.transform.rotate(base_surface, quantized_angle)
+        self.add(asset, frame, quantized_angle, surface)
+        return surface
+
+    def add(
+        self,
+        asset: str,
+        frame: int,
+        angle: typing.Union[int, float],
+        surface: pygame.Surface,
+    ) -> None:
+        """
+        Stores a surface already rotated to a quantized angle, such as one rotated ahead of time
+        on a worker thread by the :class:`source.preload.Preloader`.
+
+        :param asset: :class:`str` name of the asset the surface belongs to
+        :param frame: :class:`int` index of the animation frame, 0 for single frame assets
+        :param angle: Union[:class:`int`, :class:`float`] quantized angle in degrees the surface is rotated by
+        :param surface: The rotated :class:`pygame.Surface`
+        :return: `None`
+        """
+        key = (asset, frame, angle)
+        previous = self.surfaces.pop(key, None)
+        if previous is not None:
+            self.bytes_held -= surface_size_in_bytes(previous)
+        self.surfaces[key] = surface
+        self.bytes_held += surface_size_in_bytes(surface)
+        self.evict_if_required()
+
+
+# Shared instance used by all sprites
+rotation_cache = RotationCache()
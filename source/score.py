@@ -1,6 +1,8 @@
 import pygame
+import typing
 
-from . import utils
+from .hud import WHITE
+from .text_cache import get_text_cache
 
 PADDING = 2
 SCORE_LENGTH = 10
@@ -26,7 +28,7 @@ class Score:
         self.game_surface = game_surface
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.font = utils.load_font("source.fonts", "fixedsys.ttf", font_size)
+        self.text_cache = get_text_cache(font_size, WHITE)
         self.value = 0
 
     def reset(self) -> None:
@@ -56,15 +58,37 @@ class Score:
         zero_padding = "0" * (SCORE_LENGTH - len(str_score))
         return "SCORE " + zero_padding + str_score
 
-    def update(self) -> None:
+    def step(self) -> None:
         """
-        Renders the score onto the game surface.
+        The score has no per-frame state to advance, it only changes when incremented or reset.
 
         :return: `None`
         """
-        text_surface = self.font.render(
-            self.score_to_text(), True, pygame.Color("#ffffff")
-        )
+
+    def blits(self) -> typing.List[typing.Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Gets the rendered score and where it is drawn, the text is only rasterized when the score changes.
+
+        :return: :class:`list` of :class:`tuple` of :class:`pygame.Surface` and :class:`pygame.Rect`
+        """
+        text_surface = self.text_cache.render(self.score_to_text())
         text_rect = text_surface.get_rect()
         text_rect.topright = (self.screen_width - PADDING, PADDING)
-        self.game_surface.blit(text_surface, text_rect)
+        return [(text_surface, text_rect)]
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draws the score onto the game surface.
+
+        :param alpha: Optional[:class:`float`] interpolation factor, unused as the score does not move
+        :return: `None`
+        """
+        self.game_surface.blits(self.blits(), False)
+
+    def update(self) -> None:
+        """
+        Renders the score onto the game surface.
+
+        :return: `None`
+        """
+        self.draw()
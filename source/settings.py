@@ -1,5 +1,12 @@
+import os
 import pygame
 
+# Constants
+ENEMY_BACKENDS = ("SPRITE", "SWARM")
+# Seeds are recorded in replay files as signed 64-bit integers
+MIN_SEED = -(2 ** 63)
+MAX_SEED = 2 ** 63 - 1
+
 
 class ControlScheme:
     """
@@ -18,11 +25,28 @@ class ControlScheme:
 class Settings:
     """
     Class to contain a player's gameplay settings.
-    Contains the control scheme and game difficulty.
+    Contains the control scheme, game difficulty, the enemy backend, one of :data:`ENEMY_BACKENDS`
+    selected with the ``MISSILE_DEFENCE_ENEMY_BACKEND`` environment variable, and the random
+    seed, which can be fixed with the ``MISSILE_DEFENCE_SEED`` environment variable.
+    A seed of `None` gives every game a different random seed, otherwise it must be
+    between :data:`MIN_SEED` and :data:`MAX_SEED`.
     """
     def __init__(self):
         self.control_scheme = ControlScheme()
         self.difficulty = "NORMAL"
+        self.enemy_backend = os.environ.get(
+            "MISSILE_DEFENCE_ENEMY_BACKEND", "SPRITE"
+        ).upper()
+        if self.enemy_backend not in ENEMY_BACKENDS:
+            raise ValueError(
+                f"MISSILE_DEFENCE_ENEMY_BACKEND must be one of {', '.join(ENEMY_BACKENDS)}"
+            )
+        seed = os.environ.get("MISSILE_DEFENCE_SEED")
+        self.seed = None if seed is None else int(seed)
+        if self.seed is not None and not MIN_SEED <= self.seed <= MAX_SEED:
+            raise ValueError(
+                f"MISSILE_DEFENCE_SEED must be between {MIN_SEED} and {MAX_SEED}"
+            )
 
     def change_keybind(self, direction: str, key: int) -> None:
         """
@@ -0,0 +1,140 @@
+import pygame
+import typing
+
+# Constants
+CELL_SIZE = 64
+
+
+class SpatialHash:
+    """
+    Uniform grid used as a broad-phase for collision checks and as a targeting index.
+    Items are stored in every cell their :class:`pygame.Rect` overlaps, so a query only has
+    to test items in the cells overlapped by the query rect rather than every item.
+
+    :param cell_size: :class:`int` width and height of each grid cell in pixels
+    """
+
+    def __init__(self, cell_size: int = CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def __len__(self) -> int:
+        """
+        Gets the number of non-empty cells in the grid.
+
+        :return: :class:`int` number of occupied cells
+        """
+        return len(self.cells)
+
+    def clear(self) -> None:
+        """
+        Removes every item from the grid.
+
+        :return: `None`
+        """
+        self.cells.clear()
+
+    def cell_range(self, rect: pygame.Rect) -> typing.Tuple[range, range]:
+        """
+        Gets the range of cell columns and rows overlapped by a rect.
+
+        :param rect: :class:`pygame.Rect` to find the cells of
+        :return: :class:`tuple`[:class:`range`] column and row ranges
+        """
+        cell_size = self.cell_size
+        return (
+            range(rect.left // cell_size, (rect.right - 1) // cell_size + 1),
+            range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1),
+        )
+
+    def insert(self, item, rect: pygame.Rect) -> None:
+        """
+        Adds an item to every cell overlapped by its rect.
+
+        :param item: Any object to store
+        :param rect: :class:`pygame.Rect` of the item
+        :return: `None`
+        """
+        columns, rows = self.cell_range(rect)
+        entry = (item, rect)
+        cells = self.cells
+        for column in columns:
+            for row in rows:
+                key = (column, row)
+                if key in cells:
+                    cells[key].append(entry)
+                else:
+                    cells[key] = [entry]
+
+    def rebuild(self, items: typing.Iterable, get_rect: typing.Callable) -> None:
+        """
+        Empties the grid and re-inserts all given items.
+
+        :param items: Iterable of objects to store
+        :param get_rect: Function returning the :class:`pygame.Rect` of an item
+        :return: `None`
+        """
+        self.cells.clear()
+        for item in items:
+            self.insert(item, get_rect(item))
+
+    def query(self, rect: pygame.Rect) -> typing.List:
+        """
+        Gets every item whose rect collides with the given rect. Each item is only returned once.
+
+        :param rect: :class:`pygame.Rect` to test against
+        :return: :class:`list` of colliding items
+        """
+        columns, rows = self.cell_range(rect)
+        cells = self.cells
+        found = []
+        seen = set()
+        for column in columns:
+            for row in rows:
+                for item, item_rect in cells.get((column, row), ()):
+                    if id(item) not in seen and rect.colliderect(item_rect):
+                        seen.add(id(item))
+                        found.append(item)
+        return found
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        predicate: typing.Optional[typing.Callable] = None,
+    ):
+        """
+        Gets the item whose :math:`x`, :math:`y` position is closest to a point, within a radius.
+        Cells are searched in rings of increasing distance around the point, stopping once no
+        unsearched cell can hold a closer item. Distances are compared squared.
+
+        :param x: :math:`x` coordinate of the point
+        :param y: :math:`y` coordinate of the point
+        :param radius: Maximum distance of the item from the point
+        :param predicate: Optional function returning whether an item can be returned
+        :return: The nearest item, or `None` if there is none in range
+        """
+        cell_size = self.cell_size
+        cells = self.cells
+        centre_column, centre_row = int(x // cell_size), int(y // cell_size)
+        best = None
+        best_distance = radius * radius
+        for ring in range(int(radius // cell_size) + 2):
+            # Any item in this ring or beyond is at least this far from the point
+            ring_distance = max(ring - 1, 0) * cell_size
+            if best is not None and ring_distance * ring_distance > best_distance:
+                break
+            for column in range(centre_column - ring, centre_column + ring + 1):
+                on_edge = column in (centre_column - ring, centre_column + ring)
+                step = 1 if on_edge else 2 * ring
+                for row in range(centre_row - ring, centre_row + ring + 1, step or 1):
+                    for item, _ in cells.get((column, row), ()):
+                        if predicate is not None and not predicate(item):
+                            continue
+                        distance = (item.x - x) ** 2 + (item.y - y) ** 2
+                        if distance < best_distance or (
+                            best is None and distance == best_distance
+                        ):
+                            best, best_distance = item, distance
+        return best
@@ -0,0 +1,142 @@
+import builtins
+import importlib.util
+import os
+import sys
+import time
+import typing
+
+# Constants
+ENVIRONMENT_VARIABLE = "MISSILE_DEFENCE_STARTUP_REPORT"
+# Number of the slowest imports listed in the report
+REPORTED_IMPORTS = 15
+
+
+class StartupReport:
+    """
+    Measures how long the game takes to start, printing a report once the first frame has been
+    drawn. While enabled, every module imported is timed through :func:`builtins.__import__`,
+    the time of each including the modules it imports in turn, and milestones such as the display
+    being created are marked with the time since the report was created.
+
+    Created by :mod:`source.__main__` before the rest of the game is imported, and does nothing
+    unless enabled.
+
+    :param enabled: Optional[:class:`bool`] whether to time the startup
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.start_time = time.perf_counter()
+        self.import_times = {}
+        self.milestones = []
+        self.original_import = None
+
+    @classmethod
+    def from_environment(cls) -> "StartupReport":
+        """
+        Creates a startup report, enabled if the ``MISSILE_DEFENCE_STARTUP_REPORT`` environment variable is set.
+
+        :return: :class:`source.startup.StartupReport`
+        """
+        return cls(bool(os.environ.get(ENVIRONMENT_VARIABLE)))
+
+    def install(self) -> None:
+        """
+        Starts timing imports if the report is enabled.
+
+        :return: `None`
+        """
+        if self.enabled and self.original_import is None:
+            self.original_import = builtins.__import__
+            builtins.__import__ = self.timed_import
+
+    def uninstall(self) -> None:
+        """
+        Stops timing imports.
+
+        :return: `None`
+        """
+        if self.original_import is not None:
+            builtins.__import__ = self.original_import
+            self.original_import = None
+
+    def timed_import(
+        self,
+        name: str,
+        globals: typing.Optional[dict] = None,
+        locals: typing.Optional[dict] = None,
+        fromlist: typing.Sequence[str] = (),
+        level: int = 0,
+    ):
+        """
+        Imports a module in place of :func:`builtins.__import__`, recording how long it took
+        if it had not been imported before. A statement importing several new modules,
+        such as ``from . import a, b``, is recorded against the first of them.
+
+        :return: The imported module
+        """
+        package = globals.get("__package__") if globals else None
+        try:
+            absolute_name = (
+                importlib.util.resolve_name("." * level + name, package)
+                if level
+                else name
+            )
+        except (ImportError, ValueError):
+            return self.original_import(name, globals, locals, fromlist, level)
+        new_modules = [
+            module_name
+            for module_name in [absolute_name]
+            + [f"{absolute_name}.{item}" for item in fromlist or () if item != "*"]
+            if module_name not in sys.modules
+        ]
+
+        start = time.perf_counter()
+        module = self.original_import(name, globals, locals, fromlist, level)
+        for module_name in new_modules:
+            if module_name in sys.modules:
+                self.import_times[module_name] = time.perf_counter() - start
+                break
+        return module
+
+    def mark(self, label: str) -> None:
+        """
+        Records a milestone in the startup if the report is enabled.
+
+        :param label: :class:`str` description of what has just finished
+        :return: `None`
+        """
+        if self.enabled:
+            self.milestones.append((label, time.perf_counter() - self.start_time))
+
+    def lines(self) -> typing.List[str]:
+        """
+        Gets the lines of the report, the slowest imports followed by each milestone.
+
+        :return: :class:`list` of :class:`str` lines
+        """
+        slowest = sorted(self.import_times.items(), key=lambda item: item[1], reverse=True)
+        lines = [f"{'import':<40}{'ms':>9}"]
+        for module, seconds in slowest[:REPORTED_IMPORTS]:
+            lines.append(f"{module:<40}{seconds * 1000:>9.1f}")
+        lines.append(f"{'milestone':<40}{'ms':>9}")
+        for label, seconds in self.milestones:
+            lines.append(f"{label:<40}{seconds * 1000:>9.1f}")
+        return lines
+
+    def finish(self) -> None:
+        """
+        Marks the first frame as drawn, stops timing imports and prints the report, only once.
+
+        :return: `None`
+        """
+        if not self.enabled:
+            return
+        self.mark("first frame")
+        self.uninstall()
+        self.enabled = False
+        print("\n".join(self.lines()))
+
+
+# Shared instance, installed by source.__main__ before the game is imported
+startup_report = StartupReport.from_environment()
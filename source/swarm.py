@@ -0,0 +1,376 @@
+import numpy
+import pygame
+import random
+import typing
+
+from . import enemy
+from . import utils
+from .enemy import Enemy
+from .rotation_cache import rotation_cache
+
+
+class SwarmEnemy:
+    """
+    Lightweight view of a single enemy stored in an :class:`source.swarm.EnemySwarm`.
+    Provides the attributes read by :class:`source.tower.Tower` targeting so that
+    towers work against either enemy backend.
+
+    :param swarm: The :class:`source.swarm.EnemySwarm` containing the enemy
+    :param index: :class:`int` index of the enemy in the swarm's arrays
+    """
+
+    score_value = 150
+    balance_value = 5
+
+    def __init__(self, swarm, index: int) -> None:
+        self.swarm = swarm
+        self.index = index
+
+    @property
+    def x(self) -> float:
+        """
+        The :math:`x` position of the enemy, read from the swarm.
+        """
+        return float(self.swarm.x[self.index])
+
+    @property
+    def y(self) -> float:
+        """
+        The :math:`y` position of the enemy, read from the swarm.
+        """
+        return float(self.swarm.y[self.index])
+
+    @property
+    def visible(self) -> bool:
+        """
+        Whether the enemy is still alive. Read only, enemies are killed through the swarm
+        so that its count of destroyed enemies stays correct.
+        """
+        return bool(self.swarm.alive[self.index])
+
+
+# Arrays needed to recreate a swarm mid-wave
+SNAPSHOT_ARRAYS = (
+    "x",
+    "y",
+    "previous_x",
+    "previous_y",
+    "velocity_x",
+    "velocity_y",
+    "alive",
+    "animation_frame",
+    "spawn_frame",
+    "angle",
+    "width",
+    "height",
+)
+
+
+class EnemySwarm:
+    """
+    Alternative to a :class:`pygame.sprite.Group` of :class:`source.enemy.Enemy` sprites
+    which stores every enemy of a wave in struct-of-arrays form. The whole swarm is moved
+    with vectorised operations and ground hits are resolved with a single mask each frame.
+    Dead enemies are compacted out of the arrays at the end of each step, so the arrays only
+    ever hold live enemies, and any enemy killed since the last step.
+
+    :param capacity: :class:`int` maximum number of enemies the swarm can hold
+    :param game_surface: The :class:`pygame.Surface` to blit the enemies onto
+    :param screen_width: :class:`int` width of the screen in pixels
+    :param screen_height: :class:`int` height of the screen in pixels
+    :param hit_ground_func: Procedure called with the amount of enemies that reached the bottom of the screen
+    :param rng: Optional[:class:`random.Random`] random number generator to draw positions from, the global :mod:`random` module if unspecified
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        game_surface: pygame.Surface,
+        screen_width: int,
+        screen_height: int,
+        hit_ground_func: typing.Callable[[int], None],
+        rng: random.Random = None,
+    ) -> None:
+        if Enemy.animation is None:
+            Enemy.animation = Enemy.load_animation()
+        self.animation = Enemy.animation
+
+        self.capacity = capacity
+        self.game_surface = game_surface
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.hit_ground_func = hit_ground_func
+        self.rng = random if rng is None else rng
+        # Number of enemies held in the arrays, and totals since the swarm was created
+        self.count = 0
+        self.spawned = 0
+        self.destroyed = 0
+
+        self.x = numpy.zeros(capacity, dtype=numpy.float64)
+        self.y = numpy.zeros(capacity, dtype=numpy.float64)
+        self.previous_x = numpy.zeros(capacity, dtype=numpy.float64)
+        self.previous_y = numpy.zeros(capacity, dtype=numpy.float64)
+        self.velocity_x = numpy.zeros(capacity, dtype=numpy.float64)
+        self.velocity_y = numpy.zeros(capacity, dtype=numpy.float64)
+        self.alive = numpy.zeros(capacity, dtype=bool)
+        self.animation_frame = numpy.zeros(capacity, dtype=numpy.int32)
+        self.spawn_frame = numpy.zeros(capacity, dtype=numpy.int32)
+        self.angle = numpy.zeros(capacity, dtype=numpy.float64)
+        self.width = numpy.zeros(capacity, dtype=numpy.int32)
+        self.height = numpy.zeros(capacity, dtype=numpy.int32)
+
+    def __len__(self) -> int:
+        """
+        Gets the number of enemies spawned into the swarm so far, alive or not.
+
+        :return: :class:`int` number of spawned enemies
+        """
+        return self.spawned
+
+    def live_count(self) -> int:
+        """
+        Gets the number of enemies that are still alive.
+
+        :return: :class:`int` number of live enemies
+        """
+        return self.spawned - self.destroyed
+
+    def snapshot(self) -> dict:
+        """
+        Copies the arrays of every spawned enemy into a :class:`dict`.
+
+        :return: :class:`dict` snapshot of the swarm
+        """
+        state = {
+            name: getattr(self, name)[: self.count].copy() for name in SNAPSHOT_ARRAYS
+        }
+        state["count"] = self.count
+        state["spawned"] = self.spawned
+        state["destroyed"] = self.destroyed
+        return state
+
+    def restore(self, state: dict) -> None:
+        """
+        Restores every spawned enemy from a snapshot.
+
+        :param state: :class:`dict` made by :func:`source.swarm.EnemySwarm.snapshot`
+        :return: `None`
+        """
+        self.count = state["count"]
+        self.spawned = state["spawned"]
+        self.destroyed = state["destroyed"]
+        for name in SNAPSHOT_ARRAYS:
+            getattr(self, name)[: self.count] = state[name]
+
+    def spawn(self, frame_number: int, course: typing.Optional[tuple] = None) -> None:
+        """
+        Spawns a single enemy, at a random position at the top of the screen aimed
+        towards a random position at the bottom of the screen unless a course is given.
+
+        :param frame_number: :class:`int` frame of the wave the enemy spawned on
+        :param course: Optional[:class:`tuple`] of start x, start y, end x, end y, velocity x, velocity y,
+            see :func:`source.wave_plan.WavePlan.course`
+        :return: `None`
+        """
+        if self.spawned >= self.capacity:
+            return
+        index = self.count
+        if course is None:
+            start_x = self.rng.randint(0, self.screen_width - enemy.SPRITE_WIDTH)
+            start_y = 0
+            end_x = self.rng.randint(0, self.screen_width - enemy.SPRITE_WIDTH)
+            end_y = self.screen_height - enemy.SPRITE_HEIGHT
+            velocity_x, velocity_y = utils.vector_from_positions(
+                start_x, start_y, end_x, end_y, enemy.ENEMY_VELOCITY
+            )
+        else:
+            start_x, start_y, end_x, end_y, velocity_x, velocity_y = course
+
+        self.x[index], self.y[index] = start_x, start_y
+        self.previous_x[index], self.previous_y[index] = start_x, start_y
+        self.velocity_x[index], self.velocity_y[index] = velocity_x, velocity_y
+        angle = rotation_cache.quantize(
+            utils.get_angle_positions(
+                start_x, start_y, end_x, end_y, enemy.ANGLE_OFFSET
+            )
+        )
+        self.angle[index] = angle
+        self.width[index], self.height[index] = rotation_cache.get(
+            "enemy", 0, angle, self.animation.frame(0)
+        ).get_size()
+        self.animation_frame[index] = 0
+        self.spawn_frame[index] = frame_number
+        self.alive[index] = True
+        self.count += 1
+        self.spawned += 1
+
+    def compact(self) -> None:
+        """
+        Moves every live enemy to the front of the arrays, keeping their order,
+        and drops the dead enemies after them.
+
+        :return: `None`
+        """
+        live = numpy.flatnonzero(self.alive[: self.count])
+        if len(live) == self.count:
+            return
+        for name in SNAPSHOT_ARRAYS:
+            array = getattr(self, name)
+            array[: len(live)] = array[live]
+        self.count = len(live)
+
+    def step(self) -> None:
+        """
+        Removes enemies killed since the last step, resolves ground hits for every enemy at once,
+        reporting the total lives lost in a single call, then moves and animates all live enemies.
+
+        :return: `None`
+        """
+        self.compact()
+        count = self.count
+        alive = self.alive[:count]
+        grounded = alive & (self.y[:count] >= self.screen_height - enemy.SPRITE_HEIGHT)
+        lives_lost = int(numpy.count_nonzero(grounded))
+        if lives_lost:
+            alive &= ~grounded
+            self.destroyed += lives_lost
+            self.hit_ground_func(lives_lost)
+
+        self.previous_x[:count] = self.x[:count]
+        self.previous_y[:count] = self.y[:count]
+        self.x[:count] += numpy.where(alive, self.velocity_x[:count], 0)
+        self.y[:count] += numpy.where(alive, self.velocity_y[:count], 0)
+        self.animation_frame[:count] = (self.animation_frame[:count] + 1) % len(
+            self.animation
+        )
+
+    def blits(self, alpha: float = 1.0) -> list:
+        """
+        Gets the rotated animation frame and position of every live enemy,
+        to be submitted with :func:`pygame.Surface.blits`.
+
+        :param alpha: Optional[:class:`float`] fraction of a step to interpolate positions by
+        :return: :class:`list` of (:class:`pygame.Surface`, position) pairs to draw
+        """
+        animation = self.animation
+        indices = numpy.flatnonzero(self.alive[: self.count])
+        previous_x, previous_y = self.previous_x[indices], self.previous_y[indices]
+        draw_x = previous_x + (self.x[indices] - previous_x) * alpha
+        draw_y = previous_y + (self.y[indices] - previous_y) * alpha
+        return [
+            (
+                rotation_cache.get("enemy", frame, angle, animation.frame(frame)),
+                (x, y),
+            )
+            for frame, angle, x, y in zip(
+                self.animation_frame[indices].tolist(),
+                self.angle[indices].tolist(),
+                draw_x.tolist(),
+                draw_y.tolist(),
+            )
+        ]
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draws every live enemy onto the game surface in a single batched blit.
+
+        :param alpha: Optional[:class:`float`] fraction of a step to interpolate positions by
+        :return: `None`
+        """
+        self.game_surface.blits(self.blits(alpha), False)
+
+    def update(self) -> None:
+        """
+        Steps and draws the swarm, matching :func:`pygame.sprite.Group.update`.
+
+        :return: `None`
+        """
+        self.step()
+        self.draw()
+
+    def sprites(self) -> typing.List[SwarmEnemy]:
+        """
+        Gets a view of every live enemy, matching :func:`pygame.sprite.Group.sprites`.
+
+        :return: :class:`list` of :class:`source.swarm.SwarmEnemy`
+        """
+        return [
+            SwarmEnemy(self, index)
+            for index in numpy.flatnonzero(self.alive[: self.count]).tolist()
+        ]
+
+    def nearest(self, x: float, y: float, radius: float) -> typing.Optional[SwarmEnemy]:
+        """
+        Gets the live enemy closest to a point within a radius, comparing squared
+        distances for every enemy at once.
+
+        :param x: :math:`x` coordinate of the point
+        :param y: :math:`y` coordinate of the point
+        :param radius: Maximum distance of the enemy from the point
+        :return: Optional[:class:`source.swarm.SwarmEnemy`] nearest enemy in range
+        """
+        count = self.count
+        if count == 0:
+            return None
+        distances = (self.x[:count] - x) ** 2 + (self.y[:count] - y) ** 2
+        distances[~self.alive[:count]] = numpy.inf
+        index = int(numpy.argmin(distances))
+        if distances[index] > radius * radius:
+            return None
+        return SwarmEnemy(self, index)
+
+    def hit_by_swept(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        displacement_x: float,
+        displacement_y: float,
+    ) -> int:
+        """
+        Kills every live enemy touched by a missile at any point during the last step, solving
+        the swept bounding box test of :func:`source.collision.intercept_time` for every enemy at once,
+        so fast missiles cannot pass through an enemy between steps.
+
+        :param x: :math:`x` position of the missile at the start of the step
+        :param y: :math:`y` position of the missile at the start of the step
+        :param width: Width of the missile
+        :param height: Height of the missile
+        :param displacement_x: :math:`x` distance the missile moved over the step
+        :param displacement_y: :math:`y` distance the missile moved over the step
+        :return: :class:`int` number of enemies killed
+        """
+        count = self.count
+        if count == 0:
+            return 0
+        entry = numpy.full(count, -numpy.inf)
+        exit_ = numpy.full(count, numpy.inf)
+        for start, size, positions, previous_positions, sizes, displacement in (
+            (x, width, self.x, self.previous_x, self.width, displacement_x),
+            (y, height, self.y, self.previous_y, self.height, displacement_y),
+        ):
+            other_start = previous_positions[:count]
+            relative = displacement - (positions[:count] - other_start)
+            near = other_start - (start + size)
+            far = other_start + sizes[:count] - start
+            moving = relative != 0
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                near_time = numpy.where(moving, near / relative, 0)
+                far_time = numpy.where(moving, far / relative, 0)
+            # Enemies not moving relative to the missile along this axis either always
+            # or never overlap it
+            apart = ~moving & ((near >= 0) | (far <= 0))
+            entry = numpy.maximum(
+                entry, numpy.where(moving, numpy.minimum(near_time, far_time), -numpy.inf)
+            )
+            exit_ = numpy.minimum(
+                exit_, numpy.where(moving, numpy.maximum(near_time, far_time), numpy.inf)
+            )
+            exit_[apart] = -numpy.inf
+        hit = self.alive[:count] & (entry < exit_) & (entry <= 1) & (exit_ > 0)
+        killed = int(numpy.count_nonzero(hit))
+        if killed:
+            self.alive[:count] &= ~hit
+            self.destroyed += killed
+        return killed
@@ -0,0 +1,102 @@
+import collections
+import pygame
+import typing
+
+from .assets import assets, FONT_PACKAGE
+
+# Constants
+FONT_NAME = "fixedsys.ttf"
+# Rendered lines kept by each cache, the least recently used are rasterized again if needed
+CAPACITY = 128
+
+
+class TextCache:
+    """
+    Renders text in a single font, size and colour, keeping the most recently used lines so
+    that text drawn every frame, such as the game over message or the current controls, is only
+    rasterized once. Every TrueType rasterization is counted in
+    :attr:`source.text_cache.TextCache.rasterizations`, shown as text renders per second by the
+    :class:`source.profiler.FrameProfiler` overlay.
+
+    Surfaces are shared between every caller asking for the same text, so must not be drawn onto.
+
+    :param font: The :class:`pygame.font.Font` to render with
+    :param colour: :class:`pygame.Color` of the text
+    :param capacity: Optional[:class:`int`] number of rendered lines to keep
+    """
+
+    rasterizations = 0
+
+    def __init__(
+        self, font: pygame.font.Font, colour: pygame.Color, capacity: int = CAPACITY
+    ) -> None:
+        self.font = font
+        self.colour = pygame.Color(colour)
+        self.capacity = capacity
+        self.lines = collections.OrderedDict()
+
+    def render(self, text: str) -> pygame.Surface:
+        """
+        Gets the rendered surface of a line of text, in place of :func:`pygame.font.Font.render`.
+
+        :param text: :class:`str` to render
+        :return: :class:`pygame.Surface` of the text
+        """
+        lines = self.lines
+        surface = lines.get(text)
+        if surface is None:
+            surface = self.font.render(text, True, self.colour)
+            TextCache.rasterizations += 1
+            lines[text] = surface
+            if len(lines) > self.capacity:
+                lines.popitem(last=False)
+        else:
+            lines.move_to_end(text)
+        return surface
+
+    def get_rect(self, text: str) -> pygame.Rect:
+        """
+        Gets the :class:`pygame.Rect` a line of text occupies when drawn at the origin.
+
+        :param text: :class:`str` to measure
+        :return: :class:`pygame.Rect` of the text
+        """
+        return self.render(text).get_rect()
+
+    def draw(
+        self, target: pygame.Surface, text: str, position: typing.Tuple[int, int]
+    ) -> None:
+        """
+        Draws a line of text onto a surface.
+
+        :param target: :class:`pygame.Surface` to draw onto
+        :param text: :class:`str` to draw
+        :param position: :class:`tuple` of :class:`int` top left position of the text
+        :return: `None`
+        """
+        target.blit(self.render(text), position)
+
+
+# Shared caches, keyed by font name, size and colour
+text_caches = {}
+
+
+def get_text_cache(
+    size: int, colour: pygame.Color, font_name: str = FONT_NAME
+) -> TextCache:
+    """
+    Gets the shared :class:`source.text_cache.TextCache` for a font, size and colour,
+    creating it the first time it is requested. Fonts are shared through the
+    :class:`source.assets.AssetRegistry`.
+
+    :param size: :class:`int` height of the font in pixels
+    :param colour: :class:`pygame.Color` of the text
+    :param font_name: Optional[:class:`str`] file name of the font in the fonts package, fixedsys if unspecified
+    :return: :class:`source.text_cache.TextCache`
+    """
+    key = (font_name, size, tuple(pygame.Color(colour)))
+    text_cache = text_caches.get(key)
+    if text_cache is None:
+        text_cache = TextCache(assets.font(FONT_PACKAGE, font_name, size), colour)
+        text_caches[key] = text_cache
+    return text_cache
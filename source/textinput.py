@@ -1,8 +1,7 @@
 import pygame
 
-from . import utils
+from .text_cache import get_text_cache
 
-PACKAGE = "source.fonts"
 ALLOWED_KEYS = {
     pygame.K_0: "0",
     pygame.K_1: "1",
@@ -69,7 +68,7 @@ class TextInput:
         self.game_surface = game_surface
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.font = utils.load_font(PACKAGE, font_name, font_size)
+        self.text_cache = get_text_cache(font_size, pygame.Color("#FFFFFF"), font_name)
         self.font_size = font_size
         self.text = []
         self.char_limit = char_limit
@@ -103,34 +102,53 @@ class TextInput:
                 elif event.key == pygame.K_RETURN and len(self.text) == self.char_limit:
                     self.listening = False
 
-    def draw(self) -> None:
+    def blits(self, alpha: float = 1.0) -> list:
         """
-        Generates the text input interface :class:`pygame.Surface` and
-        blits it onto the game's screen
+        Gets the text input interface text and the positions to draw it at,
+        to be submitted with :func:`pygame.Surface.blits`.
 
-        :return: `None`
+        :param alpha: Optional[:class:`float`] interpolation factor, unused as the text input does not move
+        :return: :class:`list` of (:class:`pygame.Surface`, position) pairs to draw
         """
         game_surface_center = self.game_surface.get_rect().center
 
-        input_title = "Type your name, press Enter when finished."
-        input_title_surface = self.font.render(
-            input_title, True, pygame.Color("#FFFFFF")
+        input_title_surface = self.text_cache.render(
+            "Type your name, press Enter when finished."
         )
         input_title_rect = input_title_surface.get_rect()
         input_title_rect.center = (
             game_surface_center[0],
             game_surface_center[1] - self.font_size,
         )
-        self.game_surface.blit(input_title_surface, input_title_rect)
 
         input_text = " ".join(self.text)
         input_text += " _" * (3 - len(self.text))
-        input_surface = self.font.render(
-            input_text.strip(), True, pygame.Color("#FFFFFF")
-        )
+        input_text = input_text.strip()
+        input_surface = self.text_cache.render(input_text)
         input_surface_rect = input_surface.get_rect()
         input_surface_rect.center = game_surface_center
-        self.game_surface.blit(input_surface, input_surface_rect)
+        return [
+            (input_title_surface, input_title_rect),
+            (input_surface, input_surface_rect),
+        ]
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Generates the text input interface :class:`pygame.Surface` and
+        blits it onto the game's screen
+
+        :param alpha: Optional[:class:`float`] interpolation factor, unused as the text input does not move
+        :return: `None`
+        """
+        self.game_surface.blits(self.blits(alpha), False)
+
+    def step(self) -> None:
+        """
+        The text input only changes when an event is processed,
+        so has no per-frame state to advance
+
+        :return: `None`
+        """
 
     def update(self) -> None:
         """
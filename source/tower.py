@@ -1,11 +1,14 @@
 import pygame
 import math
 import typing
-import copy
 
 from .missile import Missile
+from .pool import ObjectPool
 from . import enemy
 from . import utils
+from .text_cache import get_text_cache
+from .rotation_cache import rotation_cache
+from .assets import assets, IMAGE_PACKAGE
 
 SPRITE_WIDTH = 35
 SPRITE_HEIGHT = 35
@@ -24,10 +27,11 @@ class Tower(pygame.sprite.Sprite):
     :param y_pos: :class:`int` :math:`y` postition of the tower
     :param get_enemies_func: Function called to get all enemies currently on the screen
     :param missile_velocity: :class:`int` velocity of the tower's missiles
+    :param missile_pool: Optional[:class:`source.pool.ObjectPool`] of :class:`source.missile.Missile` to reuse missiles from
+    :param find_nearest_enemy_func: Optional function called with a position and radius to get the nearest enemy in range
+        from a targeting index shared by all towers, enemies from get_enemies_func are searched if unspecified
     """
 
-    asset = None
-
     def __init__(
         self,
         game_surface: pygame.Surface,
@@ -37,18 +41,16 @@ class Tower(pygame.sprite.Sprite):
         y_pos: int,
         get_enemies_func: typing.Callable[[None], typing.Optional[typing.List]],
         missile_velocity: int,
+        missile_pool: typing.Optional[ObjectPool] = None,
+        find_nearest_enemy_func: typing.Optional[typing.Callable] = None,
     ):
         super().__init__()
 
-        if Tower.asset is None:
-            Tower.asset = utils.load_image("source.images", "tower.png").convert_alpha()
-        self.asset = Tower.asset
-        self.font = utils.load_font("source.fonts", "fixedsys.ttf", 10)
-
         self.game_surface = game_surface
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.get_enemies_func = get_enemies_func
+        self.find_nearest_enemy_func = find_nearest_enemy_func
 
         self.range = 300
         self.fire_rate = 50
@@ -60,6 +62,7 @@ class Tower(pygame.sprite.Sprite):
 
         self.missiles = []
         self.missile_velocity = missile_velocity
+        self.missile_pool = ObjectPool(Missile) if missile_pool is None else missile_pool
 
         self.x = x_pos
         self.y = y_pos
@@ -72,7 +75,7 @@ class Tower(pygame.sprite.Sprite):
         unplaced_marker_center = pygame.Surface((SPRITE_WIDTH - 4, SPRITE_HEIGHT - 4))
         unplaced_marker_center.fill(pygame.Color("#000000"))
 
-        price_marker = self.font.render(str(self.price), True, pygame.Color("#FFFFFF"))
+        price_marker = get_text_cache(10, pygame.Color("#FFFFFF")).render(str(self.price))
         position_to_blit = (
             SPRITE_WIDTH - price_marker.get_width() * 1.5,
             SPRITE_HEIGHT - price_marker.get_height() * 2,
@@ -81,14 +84,17 @@ class Tower(pygame.sprite.Sprite):
         self.unplaced_marker.blit(unplaced_marker_center, (2, 2))
         self.unplaced_marker.blit(price_marker, position_to_blit)
 
-        self.original_image = pygame.Surface(
-            (self.asset.get_width(), self.asset.get_height()), pygame.SRCALPHA
-        )
-        self.original_image.blit(self.asset, (0, 0))
-        self.original_image = pygame.transform.scale(
-            self.original_image, (SPRITE_WIDTH, SPRITE_HEIGHT)
-        )
-        self.image = copy.copy(self.original_image)
+        self.original_image = Tower.load_image()
+        self.image = self.original_image
+
+    @staticmethod
+    def load_image() -> pygame.Surface:
+        """
+        Gets the unrotated tower image at its drawn size, shared through the :class:`source.assets.AssetRegistry`.
+
+        :return: :class:`pygame.Surface` of the tower
+        """
+        return assets.image(IMAGE_PACKAGE, "tower.png", (SPRITE_WIDTH, SPRITE_HEIGHT))
 
     def place(self):
         """
@@ -114,19 +120,24 @@ class Tower(pygame.sprite.Sprite):
     def find_nearest_enemy_in_range(self) -> typing.Optional[enemy.Enemy]:
         """
         Checks if there is an enemy in range of the tower and returns the closest
-        if multiple are found
+        if multiple are found. Squared distances are compared to avoid square roots.
 
         :return: Nearest Optional[:class:`source.enemy.Enemy`] in range
         """
-        closest = [None, 1000000]
+        if self.find_nearest_enemy_func is not None:
+            return self.find_nearest_enemy_func(self.x, self.y, self.range)
+
+        closest = None
+        closest_distance = self.range ** 2
         current_enemies = self.get_enemies_func()
         for enemy in [] if current_enemies is None else current_enemies:
             if enemy.visible:
-                dist = self.calculate_distance(enemy)
-                if dist < closest[1]:
-                    closest = [enemy, dist]
-        if closest[1] <= self.range:
-            return closest[0]
+                distance = (self.x - enemy.x) ** 2 + (self.y - enemy.y) ** 2
+                if distance < closest_distance or (
+                    closest is None and distance == closest_distance
+                ):
+                    closest, closest_distance = enemy, distance
+        return closest
 
     def increment_frames(self) -> None:
         """
@@ -146,9 +157,11 @@ class Tower(pygame.sprite.Sprite):
         :param enemy: :class:`source.enemy.Enemy` to point towards
         :return: `None`
         """
-        self.image = pygame.transform.rotate(
-            self.original_image,
+        self.image = rotation_cache.get(
+            "tower",
+            0,
             utils.get_angle_positions(self.x, self.y, enemy.x, enemy.y, ANGLE_OFFSET),
+            self.original_image,
         )
 
     def fire_towards_nearest_in_range_enemy(self) -> None:
@@ -167,7 +180,7 @@ class Tower(pygame.sprite.Sprite):
                 image_rect = self.image.get_rect()
                 image_rect.topleft = self.x, self.y
                 self.missiles.append(
-                    Missile(
+                    self.missile_pool.acquire(
                         self.game_surface,
                         self.screen_width,
                         self.screen_height,
@@ -179,22 +192,91 @@ class Tower(pygame.sprite.Sprite):
                     )
                 )
 
-    def update(self) -> None:
+    def snapshot(self) -> dict:
+        """
+        Copies the tower's simulation state, including its missiles, into a :class:`dict`
+
+        :return: :class:`dict` snapshot of the tower
+        """
+        return {
+            "placed": self.placed,
+            "frames_since_last_fired": self.frames_since_last_fired,
+            "missiles": [missile.snapshot() for missile in self.missiles],
+        }
+
+    def restore(self, state: dict) -> None:
+        """
+        Restores the tower's simulation state from a snapshot, recreating its missiles
+
+        :param state: :class:`dict` made by :func:`source.tower.Tower.snapshot`
+        :return: `None`
         """
-        Blits the tower's image onto the game surface
-        and updates all missiles currently travelling fired by the tower
+        self.placed = state["placed"]
+        self.frames_since_last_fired = state["frames_since_last_fired"]
+        for missile in self.missiles:
+            self.missile_pool.release(missile)
+        self.missiles = []
+        for missile_state in state["missiles"]:
+            missile = self.missile_pool.acquire(
+                self.game_surface,
+                self.screen_width,
+                self.screen_height,
+                missile_state["start_x"],
+                missile_state["start_y"],
+                missile_state["end_x"],
+                missile_state["end_y"],
+                missile_state["fire_velocity"],
+            )
+            missile.restore(missile_state)
+            self.missiles.append(missile)
+
+    def step(self) -> None:
+        """
+        Fires at the nearest enemy if required and steps all missiles
+        currently travelling fired by the tower
 
         :return: `None`
         """
         if self.placed:
             self.fire_towards_nearest_in_range_enemy()
-            self.game_surface.blit(self.image, (self.x, self.y))
             for missile in self.missiles[:]:
-                missile.update()
+                missile.step()
                 if not missile.visible:
                     self.missiles.remove(missile)
+                    self.missile_pool.release(missile)
 
             self.increment_frames()
 
-        else:
-            self.game_surface.blit(self.unplaced_marker, (self.x, self.y))
+    def blits(self, alpha: float = 1.0) -> list:
+        """
+        Gets the tower's image followed by its missiles, or the price marker if the tower
+        has not been placed, to be submitted with :func:`pygame.Surface.blits`.
+
+        :param alpha: Optional[:class:`float`] fraction of a step to interpolate missile positions by
+        :return: :class:`list` of (:class:`pygame.Surface`, position) pairs to draw
+        """
+        if not self.placed:
+            return [(self.unplaced_marker, (self.x, self.y))]
+        blits = [(self.image, (self.x, self.y))]
+        for missile in self.missiles:
+            blits += missile.blits(alpha)
+        return blits
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Blits the tower's image and its missiles onto the game surface,
+        or the price marker if the tower has not been placed
+
+        :param alpha: Optional[:class:`float`] fraction of a step to interpolate missile positions by
+        :return: `None`
+        """
+        self.game_surface.blits(self.blits(alpha), False)
+
+    def update(self) -> None:
+        """
+        Steps the tower then draws it onto the game surface
+
+        :return: `None`
+        """
+        self.step()
+        self.draw()
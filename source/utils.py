@@ -1,8 +1,6 @@
 import math
 import pygame
 import typing
-import os
-import importlib_resources as resources
 
 
 def vector_from_positions(
@@ -32,6 +30,23 @@ def vector_from_positions(
     return velocity_x, velocity_y
 
 
+def interpolate(
+    previous: typing.Union[int, float],
+    current: typing.Union[int, float],
+    alpha: float,
+) -> float:
+    """
+    Linearly interpolates between a value at the previous simulation step and its
+    value at the current step, used to draw moving sprites between steps.
+
+    :param previous: Value at the previous step
+    :param current: Value at the current step
+    :param alpha: :class:`float` fraction of a step elapsed since the current step, between 0 and 1
+    :return: :class:`float` interpolated value
+    """
+    return previous + (current - previous) * alpha
+
+
 def get_angle_positions(
     x: typing.Union[int, float],
     y: typing.Union[int, float],
@@ -53,27 +68,25 @@ def get_angle_positions(
     return -angle - offset
 
 
-def load_image(package, path) -> pygame.Surface:
+def snapshot_attributes(instance, names: typing.Iterable[str]) -> dict:
     """
-    Calculates the angle between any set of two x, y coordinates.
+    Copies a set of plain data attributes of an instance into a :class:`dict`,
+    used to snapshot simulation state for replay keyframes.
 
-    :param package: Package path to resource
-    :param path: Filename of resource
-    :return: :class:`pygame.Surface` containing loaded resource
+    :param instance: The object to snapshot
+    :param names: Names of the attributes to copy
+    :return: :class:`dict` of attribute name to value
     """
-    with resources.path(package, path) as image_path:
-        image_path = os.path.relpath(image_path)
-    return pygame.image.load(image_path)
+    return {name: getattr(instance, name) for name in names}
 
 
-def load_font(package, path, size) -> pygame.font.Font:
+def restore_attributes(instance, state: dict) -> None:
     """
-    Calculates the angle between any set of two x, y coordinates.
+    Sets every attribute stored in a snapshot made by :func:`source.utils.snapshot_attributes`.
 
-    :param package: Package path to resource
-    :param path: Filename of resource
-    :return: :class:`pygame.font.Font` for the loaded font
+    :param instance: The object to restore
+    :param state: :class:`dict` of attribute name to value
+    :return: `None`
     """
-    with resources.path(package, path) as font_path:
-        font_path = os.path.relpath(font_path)
-    return pygame.font.Font(font_path, size)
+    for name, value in state.items():
+        setattr(instance, name, value)
@@ -1,15 +1,20 @@
+import heapq
 import pygame
 import random
 import typing
 
-from .enemy import Enemy
-from . import utils
+from .enemy import Enemy, RESERVED_COURSE
+from .pool import ObjectPool
+from .wave_plan import WavePlan
+from .hud import WHITE
+from .text_cache import get_text_cache
 
 
 class Wave:
     """
     Class to represent a 'wave' of enemies. Controls how enemies are spawned over a specific time frame
-    using a :class:`pygame.sprite.Group` to contain all enemies for any specific wave.
+    using a :class:`pygame.sprite.Group` to contain all enemies for any specific wave, or an
+    :class:`source.swarm.EnemySwarm` when the swarm backend is selected.
 
     :param number_of_enemies: Int amount of enemies to be spawned during the wave
     :param time_limit: Length of the enemy spawn period in frames
@@ -19,6 +24,11 @@ class Wave:
     :param hit_ground_func: Procedure called when any :class:`source.enemy.Enemy` reaches the bottom of the screen
     :param wave_num: :class:`int` number of the the current wave
     :param font_size: :class:`int` height of the font in pixels
+    :param backend: Optional[:class:`str`] enemy backend to use, either "SPRITE" or "SWARM"
+    :param rng: Optional[:class:`random.Random`] random number generator for spawn times and enemy positions, the global :mod:`random` module if unspecified
+    :param enemy_pool: Optional[:class:`source.pool.ObjectPool`] of :class:`source.enemy.Enemy` to reuse enemies from, shared between waves
+    :param plan: Optional[:class:`source.wave_plan.WavePlan`] of enemy spawns to play out, randomly generated if unspecified,
+        in which case the number of enemies is taken from the plan
     """
 
     def __init__(
@@ -31,22 +41,67 @@ class Wave:
         hit_ground_func: typing.Callable,
         wave_num: int,
         font_size: int,
+        backend: str = "SPRITE",
+        rng: random.Random = None,
+        enemy_pool: typing.Optional[ObjectPool] = None,
+        plan: typing.Optional[WavePlan] = None,
     ) -> None:
-        self.number_of_enemies = number_of_enemies
         self.time_limit_in_frames = time_limit
         self.game_surface = game_surface
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.hit_ground_func = hit_ground_func
-        self.enemies = pygame.sprite.Group()
+        self.rng = random if rng is None else rng
+        self.plan = (
+            WavePlan.generate(
+                number_of_enemies, time_limit, screen_width, screen_height, self.rng
+            )
+            if plan is None
+            else plan
+        )
+        self.number_of_enemies = number_of_enemies = len(self.plan)
+        self.backend = backend
+        if self.backend == "SWARM":
+            # Imported here so the default sprite backend does not load the swarm
+            from .swarm import EnemySwarm
+
+            self.enemies = EnemySwarm(
+                number_of_enemies,
+                self.game_surface,
+                self.screen_width,
+                self.screen_height,
+                self.hit_ground_func,
+                self.rng,
+            )
+        else:
+            self.enemies = pygame.sprite.Group()
+        self.enemy_pool = ObjectPool(Enemy) if enemy_pool is None else enemy_pool
+        if self.backend != "SWARM":
+            # Allocates as many enemies as can be in flight at once before the wave starts,
+            # rather than one per spawn, as destroyed and grounded enemies are released back
+            # to the pool. They are given a fixed course so that no random numbers are drawn
+            self.enemy_pool.reserve(
+                self.plan.peak_concurrency(self.screen_height),
+                None,
+                None,
+                self.screen_width,
+                self.screen_height,
+                None,
+                None,
+                RESERVED_COURSE,
+            )
+        # Counts down as enemies are destroyed or reach the ground, the wave is
+        # finished once every enemy has spawned and been removed
+        self.enemies_remaining = number_of_enemies
+        # Heap of (frame, spawn number, enemy) for every enemy's ground impact, and the
+        # enemies destroyed since the last step which are yet to be removed
+        self.impacts = []
+        self.enemies_spawned = 0
+        self.dead_enemies = []
         self.finished = False
         self.frames_since_start = 0
         self.num = wave_num + 1
-        self.font = utils.load_font("source.fonts", "fixedsys.ttf", font_size)
-        self.enemy_spawn_times = [
-            round(random.random() * self.time_limit_in_frames)
-            for _ in range(number_of_enemies)
-        ]
+        self.text_cache = get_text_cache(font_size, WHITE)
 
     def register_enemies(self) -> None:
         """
@@ -58,91 +113,256 @@ class Wave:
         :return: `None`
         """
         for _ in range(self.number_of_enemies):
-            self.enemies.add(
-                Enemy(
-                    self.enemies,
-                    self.game_surface,
-                    self.screen_width,
-                    self.screen_height,
-                    self.hit_ground_func,
-                    self.mark_incomplete,
-                )
-            )
+            self.register_enemy()
 
-    def register_enemy(self) -> None:
+    def register_enemy(self, plan_index: typing.Optional[int] = None) -> None:
         """
-        Adds a single :class:`source.enemy.Enemy` to the :attr:`source.wave.Wave.enemies` :class:`pygame.sprite.Group`. Enemies spawn as soon as they are registered.
+        Adds a single :class:`source.enemy.Enemy` to the :attr:`source.wave.Wave.enemies` :class:`pygame.sprite.Group`,
+        taken from the enemy pool. Enemies spawn as soon as they are registered.
 
+        :param plan_index: Optional[:class:`int`] index of the enemy in the wave's plan, a random course is drawn if unspecified
         :return: `None`
         """
-        self.enemies.add(
-            Enemy(
-                self.enemies,
-                self.game_surface,
-                self.screen_width,
-                self.screen_height,
-                self.hit_ground_func,
-                self.mark_incomplete,
-            )
+        course = None if plan_index is None else self.plan.course(plan_index)
+        if self.backend == "SWARM":
+            self.enemies.spawn(self.frames_since_start, course)
+            return
+
+        enemy = self.enemy_pool.acquire(
+            self.enemies,
+            self.game_surface,
+            self.screen_width,
+            self.screen_height,
+            self.hit_ground_func,
+            self.rng,
+            course,
+            self,
         )
+        self.schedule_impact(enemy)
+
+    def schedule_impact(self, enemy: Enemy) -> None:
+        """
+        Queues the frame an enemy will reach the ground, if it ever does.
+
+        :param enemy: :class:`source.enemy.Enemy` to schedule
+        :return: `None`
+        """
+        self.enemies_spawned += 1
+        if enemy.impact_frame is not None:
+            heapq.heappush(
+                self.impacts, (enemy.impact_frame, self.enemies_spawned, enemy)
+            )
+
+    def destroy_enemy(self, enemy: Enemy) -> None:
+        """
+        Hides an enemy that has been hit, it is removed from the wave on the next step.
+
+        :param enemy: :class:`source.enemy.Enemy` that was hit
+        :return: `None`
+        """
+        enemy.visible = False
+        self.dead_enemies.append(enemy)
+
+    def resolve_impacts(self) -> None:
+        """
+        Removes every enemy that had reached the ground by the start of the current step,
+        calling the hit ground function for each. Entries for enemies that have since been
+        destroyed, or reused with a new course, are skipped.
+
+        :return: `None`
+        """
+        impacts = self.impacts
+        frame = self.frames_since_start
+        while impacts and impacts[0][0] <= frame:
+            impact_frame, _, enemy = heapq.heappop(impacts)
+            if enemy.visible and enemy.impact_frame == impact_frame:
+                enemy.hit_ground = True
+                self.hit_ground_func()
+                self.destroy_enemy(enemy)
+
+    def release_enemies(self) -> None:
+        """
+        Removes every enemy from the wave and returns them to the enemy pool.
+        Called once the wave is over.
+
+        :return: `None`
+        """
+        if self.backend == "SWARM":
+            return
+        for enemy in self.enemies.sprites():
+            self.release_enemy(enemy)
+
+    def release_enemy(self, enemy: Enemy) -> None:
+        """
+        Removes an enemy from the wave and returns it to the enemy pool, dropping its references
+        to the wave, so that the pool, which outlives the wave, does not keep finished waves alive.
+
+        :param enemy: :class:`source.enemy.Enemy` to release
+        :return: `None`
+        """
+        enemy.kill()
+        enemy.wave = None
+        enemy.hit_ground_func = None
+        enemy.game_surface = None
+        self.enemy_pool.release(enemy)
 
     def register_new_enemy_if_required(self) -> None:
         """
         Checks whether sufficient time has passed to spawn a new :class:`source.enemy.Enemy`.
-        If it has, a new enemy is registered.
+        If it has, every enemy due this frame in the wave's plan is registered.
 
         :return: `None`
         """
-        if self.frames_since_start in self.enemy_spawn_times:
-            for _ in range(self.enemy_spawn_times.count(self.frames_since_start)):
-                self.register_enemy()
+        for plan_index in self.plan.due(self.frames_since_start):
+            self.register_enemy(plan_index)
+
+    def wave_number_blit(self) -> typing.Tuple[pygame.Surface, pygame.Rect]:
+        """
+        Gets the current wave number, it is only rasterized once per wave, and the
+        :class:`pygame.Rect` to draw it at along the top of the game surface.
+
+        :return: :class:`tuple` of the :class:`pygame.Surface` text and its :class:`pygame.Rect`
+        """
+        text_surface = self.text_cache.render(f"Wave {self.num}")
+        text_rect = text_surface.get_rect()
+        text_rect.midtop = self.game_surface.get_rect().midtop
+        return text_surface, text_rect
 
     def draw_wave_number(self) -> None:
         """
-        Renders and draws the current wave number onto the game surface.
+        Draws the current wave number onto the game surface, it is only rasterized once per wave.
         Acts as an indicator to the user as to when the wave ends/a new wave begins.
 
         :return: `None`
         """
-        text_surface = self.font.render(
-            f"Wave {self.num}", True, pygame.Color("#ffffff")
-        )
-        text_rect = text_surface.get_rect()
-        text_rect.midtop = self.game_surface.get_rect().midtop
-        self.game_surface.blit(text_surface, text_rect)
+        self.game_surface.blit(*self.wave_number_blit())
 
-    def mark_incomplete(self) -> None:
+    def remove_dead_enemy(self, enemy: Enemy) -> None:
         """
-        Marks the wave as unfinished.
+        Removes a destroyed or grounded enemy from the wave, returning it to the enemy pool,
+        so that only live enemies are stepped, targeted and collision checked.
 
+        :param enemy: :class:`source.enemy.Enemy` that is no longer visible
         :return: `None`
         """
-        self.finished = False
+        self.release_enemy(enemy)
+        self.enemies_remaining -= 1
 
     def get_all_enemies(self) -> typing.Optional[typing.List]:
         """
-        Function to get all enemies for the wave
+        Function to get all live enemies for the wave, along with any destroyed since the wave last stepped
 
-        :return: Optional[:class:`list`] of all wave enemies
+        :return: Optional[:class:`list`] of live wave enemies
         """
         return self.enemies.sprites()
 
-    def update(self) -> None:
+    def snapshot(self) -> dict:
+        """
+        Copies the wave's simulation state, including every enemy, into a :class:`dict`.
+
+        :return: :class:`dict` snapshot of the wave
+        """
+        if self.backend == "SWARM":
+            enemies = self.enemies.snapshot()
+        else:
+            enemies = [enemy.snapshot() for enemy in self.enemies]
+        return {
+            "number_of_enemies": self.number_of_enemies,
+            "time_limit_in_frames": self.time_limit_in_frames,
+            "num": self.num,
+            "backend": self.backend,
+            "finished": self.finished,
+            "enemies_remaining": self.enemies_remaining,
+            "enemies_spawned": self.enemies_spawned,
+            "frames_since_start": self.frames_since_start,
+            "plan": self.plan.to_dict(),
+            "enemies": enemies,
+        }
+
+    def restore(self, state: dict) -> None:
         """
-        Calls the update method on the :attr:`souce.wave.Wave.enemies` :class:`pygame.sprite.Group` and increments the frames since start counter.
-        Draws the wave counter onto the surface.
+        Restores the wave's simulation state from a snapshot, recreating its enemies.
+        The wave must have been created with the same number of enemies and backend.
 
+        :param state: :class:`dict` made by :func:`source.wave.Wave.snapshot`
         :return: `None`
         """
-        self.draw_wave_number()
-        self.register_new_enemy_if_required()
+        self.finished = state["finished"]
+        self.enemies_remaining = state["enemies_remaining"]
+        self.frames_since_start = state["frames_since_start"]
+        self.plan = WavePlan.from_dict(state["plan"])
+        if self.backend == "SWARM":
+            self.enemies.restore(state["enemies"])
+            return
+
+        self.release_enemies()
+        for _ in state["enemies"]:
+            self.register_enemy()
+        self.impacts = []
+        self.dead_enemies = []
+        for enemy, enemy_state in zip(self.enemies.sprites(), state["enemies"]):
+            enemy.restore(enemy_state)
+            if not enemy.visible:
+                self.dead_enemies.append(enemy)
+        self.enemies_spawned = 0
+        for enemy in self.enemies.sprites():
+            if enemy.visible:
+                self.schedule_impact(enemy)
+        self.enemies_spawned = state["enemies_spawned"]
 
-        current_enemies = self.enemies.sprites()
-        if 0 < len(current_enemies) <= self.number_of_enemies:
-            self.finished = True
-            self.enemies.update()
+    def step(self) -> None:
+        """
+        Spawns any enemies due this frame, resolves the ground impacts scheduled for this frame
+        and removes every enemy destroyed since the last step, then increments the frames since
+        start counter, which moves every enemy. Enemies are not stepped individually.
+
+        :return: `None`
+        """
+        self.register_new_enemy_if_required()
 
-        if len(current_enemies) != self.number_of_enemies:
-            self.finished = False
+        if self.backend == "SWARM":
+            self.enemies.step()
+            self.enemies_remaining = self.number_of_enemies - self.enemies.destroyed
+        else:
+            self.resolve_impacts()
+            for enemy in self.dead_enemies:
+                self.remove_dead_enemy(enemy)
+            self.dead_enemies.clear()
 
+        self.finished = self.enemies_remaining == 0
         self.frames_since_start += 1
+
+    def blits(self, alpha: float = 1.0) -> list:
+        """
+        Gets the wave counter followed by every visible enemy,
+        to be submitted with :func:`pygame.Surface.blits`.
+
+        :param alpha: Optional[:class:`float`] fraction of a step to interpolate enemy positions by
+        :return: :class:`list` of (:class:`pygame.Surface`, position) pairs to draw
+        """
+        blits = [self.wave_number_blit()]
+        if self.backend == "SWARM":
+            blits += self.enemies.blits(alpha)
+        else:
+            blits += [
+                enemy.frame_blit(alpha) for enemy in self.enemies if enemy.visible
+            ]
+        return blits
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draws the wave counter and every visible enemy onto the surface.
+
+        :param alpha: Optional[:class:`float`] fraction of a step to interpolate enemy positions by
+        :return: `None`
+        """
+        self.game_surface.blits(self.blits(alpha), False)
+
+    def update(self) -> None:
+        """
+        Steps the wave then draws it onto the surface.
+
+        :return: `None`
+        """
+        self.step()
+        self.draw()
@@ -0,0 +1,209 @@
+import json
+import numpy
+import random
+import typing
+
+from . import enemy
+from . import utils
+
+
+class WavePlan:
+    """
+    Precomputed timeline of every enemy spawn in a wave. Spawn frames are stored in
+    ascending order alongside each enemy's start and aim positions and velocity, and a
+    cursor marks the next enemy to spawn, so finding the enemies due each frame only
+    looks at those spawning that frame.
+
+    Plans can be saved to and loaded from JSON, allowing a fixed wave to be replayed.
+
+    :param spawn_frames: Sequence of :class:`int` frames of the wave each enemy spawns on, in ascending order
+    :param start_x: Sequence of :math:`x` positions each enemy spawns at
+    :param start_y: Sequence of :math:`y` positions each enemy spawns at
+    :param end_x: Sequence of :math:`x` positions each enemy is aimed towards
+    :param end_y: Sequence of :math:`y` positions each enemy is aimed towards
+    """
+
+    def __init__(
+        self,
+        spawn_frames: typing.Sequence[int],
+        start_x: typing.Sequence[int],
+        start_y: typing.Sequence[int],
+        end_x: typing.Sequence[int],
+        end_y: typing.Sequence[int],
+    ) -> None:
+        self.spawn_frames = numpy.array(spawn_frames, dtype=numpy.int64)
+        self.start_x = numpy.array(start_x, dtype=numpy.int64)
+        self.start_y = numpy.array(start_y, dtype=numpy.int64)
+        self.end_x = numpy.array(end_x, dtype=numpy.int64)
+        self.end_y = numpy.array(end_y, dtype=numpy.int64)
+        velocities = [
+            utils.vector_from_positions(x, y, aim_x, aim_y, enemy.ENEMY_VELOCITY)
+            for x, y, aim_x, aim_y in zip(start_x, start_y, end_x, end_y)
+        ]
+        self.velocity_x = numpy.array(
+            [velocity[0] for velocity in velocities], dtype=numpy.float64
+        )
+        self.velocity_y = numpy.array(
+            [velocity[1] for velocity in velocities], dtype=numpy.float64
+        )
+        self.cursor = 0
+
+    @classmethod
+    def generate(
+        cls,
+        number_of_enemies: int,
+        time_limit: typing.Union[int, float],
+        screen_width: int,
+        screen_height: int,
+        rng: random.Random = None,
+    ):
+        """
+        Randomly generates a plan. Spawn times are spread over the spawn period, and each
+        enemy spawns at a random position at the top of the screen aimed towards a random
+        position at the bottom of the screen.
+
+        Numbers are drawn in the same order as when enemies drew their own positions as they
+        spawned, so a seeded game plays out the same.
+
+        :param number_of_enemies: :class:`int` amount of enemies in the wave
+        :param time_limit: Length of the enemy spawn period in frames
+        :param screen_width: :class:`int` width of the screen in pixels
+        :param screen_height: :class:`int` height of the screen in pixels
+        :param rng: Optional[:class:`random.Random`] random number generator to draw from, the global :mod:`random` module if unspecified
+        :return: :class:`source.wave_plan.WavePlan`
+        """
+        rng = random if rng is None else rng
+        spawn_frames = sorted(
+            round(rng.random() * time_limit) for _ in range(number_of_enemies)
+        )
+        start_x, end_x = [], []
+        for _ in range(number_of_enemies):
+            start_x.append(rng.randint(0, screen_width - enemy.SPRITE_WIDTH))
+            end_x.append(rng.randint(0, screen_width - enemy.SPRITE_WIDTH))
+        return cls(
+            spawn_frames,
+            start_x,
+            [0] * number_of_enemies,
+            end_x,
+            [screen_height - enemy.SPRITE_HEIGHT] * number_of_enemies,
+        )
+
+    def __len__(self) -> int:
+        """
+        Gets the number of enemies in the plan.
+
+        :return: :class:`int` number of enemies
+        """
+        return len(self.spawn_frames)
+
+    def due(self, frame_number: int) -> range:
+        """
+        Gets the enemies that spawn on or before a given frame and have not yet spawned,
+        moving the cursor past them.
+
+        :param frame_number: :class:`int` current frame of the wave
+        :return: :class:`range` of indices of the enemies to spawn
+        """
+        start = self.cursor
+        end = start
+        spawn_frames = self.spawn_frames
+        while end < len(spawn_frames) and spawn_frames[end] <= frame_number:
+            end += 1
+        self.cursor = end
+        return range(start, end)
+
+    def course(self, index: int) -> typing.Tuple[int, int, int, int, float, float]:
+        """
+        Gets the positions and velocity of a single enemy in the plan.
+
+        :param index: :class:`int` index of the enemy
+        :return: :class:`tuple` of start x, start y, end x, end y, velocity x, velocity y
+        """
+        return (
+            int(self.start_x[index]),
+            int(self.start_y[index]),
+            int(self.end_x[index]),
+            int(self.end_y[index]),
+            float(self.velocity_x[index]),
+            float(self.velocity_y[index]),
+        )
+
+    def peak_concurrency(self, screen_height: int) -> int:
+        """
+        Calculates the most enemies in flight at once if none of them are destroyed, each flying
+        from its spawn frame until it reaches the ground. Used to size the enemy pool for a wave,
+        which only needs as many enemies as are alive together rather than one per spawn.
+
+        :param screen_height: :class:`int` height of the screen in pixels
+        :return: :class:`int` largest number of enemies in flight on any frame
+        """
+        if not len(self):
+            return 0
+        ground = screen_height - enemy.SPRITE_HEIGHT
+        flight_frames = numpy.full(len(self), numpy.inf)
+        falling = self.velocity_y > 0
+        flight_frames[falling] = numpy.ceil(
+            numpy.maximum(ground - self.start_y[falling], 0) / self.velocity_y[falling]
+        )
+        landings = numpy.sort(self.spawn_frames + flight_frames)
+        # Enemies spawned by each spawn frame, less those that have landed by then
+        spawned = numpy.searchsorted(self.spawn_frames, self.spawn_frames, side="right")
+        landed = numpy.searchsorted(landings, self.spawn_frames, side="right")
+        return int(numpy.max(spawned - landed))
+
+    def to_dict(self) -> dict:
+        """
+        Converts the plan into a :class:`dict` of lists. Velocities are not included
+        as they are recalculated from the positions.
+
+        :return: :class:`dict` representation of the plan
+        """
+        return {
+            "spawn_frames": self.spawn_frames.tolist(),
+            "start_x": self.start_x.tolist(),
+            "start_y": self.start_y.tolist(),
+            "end_x": self.end_x.tolist(),
+            "end_y": self.end_y.tolist(),
+            "cursor": self.cursor,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Creates a plan from a :class:`dict` made by :func:`source.wave_plan.WavePlan.to_dict`.
+
+        :param data: :class:`dict` representation of the plan
+        :return: :class:`source.wave_plan.WavePlan`
+        """
+        plan = cls(
+            data["spawn_frames"],
+            data["start_x"],
+            data["start_y"],
+            data["end_x"],
+            data["end_y"],
+        )
+        plan.cursor = data.get("cursor", 0)
+        return plan
+
+    def save(self, path: str) -> None:
+        """
+        Writes the plan to a JSON file, with the cursor at the start.
+
+        :param path: :class:`str` path of the file to write
+        :return: `None`
+        """
+        data = self.to_dict()
+        data["cursor"] = 0
+        with open(path, "w") as plan_file:
+            json.dump(data, plan_file)
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Reads a plan from a JSON file written by :func:`source.wave_plan.WavePlan.save`.
+
+        :param path: :class:`str` path of the file to read
+        :return: :class:`source.wave_plan.WavePlan`
+        """
+        with open(path) as plan_file:
+            return cls.from_dict(json.load(plan_file))
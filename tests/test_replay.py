@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pygame
+
+from source.game import create_headless_controller
+from source.replay import ReplayPlayer, ReplayRecorder
+from source.settings import Settings
+
+# Constants
+STEPS = 900
+
+
+class ReplayRoundTripTest(unittest.TestCase):
+    """
+    Records a headless game and plays it back, checking the replay reproduces it exactly.
+    """
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_negative_seed(self) -> None:
+        with mock.patch.dict(os.environ, {"MISSILE_DEFENCE_SEED": "-3"}):
+            settings = Settings()
+        controller = create_headless_controller(settings)
+        self.assertEqual(controller.seed, -3)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "game.mdr")
+            recorder = ReplayRecorder(path, controller, keyframe_interval=300)
+            fire = pygame.event.Event(
+                pygame.KEYDOWN, key=settings.control_scheme.fire, unicode=""
+            )
+            while controller.ticks < STEPS and not controller.internal_game_over:
+                if controller.ticks % 60 == 0:
+                    recorder.record_event(controller.ticks, fire)
+                    controller.process_event(fire)
+                controller.step_all()
+                recorder.step(controller)
+            recorder.close()
+
+            player = ReplayPlayer(path)
+            player.play()
+
+        self.assertEqual(player.seed, -3)
+        self.assertEqual(player.controller.ticks, controller.ticks)
+        self.assertEqual(player.controller.score.value, controller.score.value)
+        self.assertEqual(player.controller.rng.getstate(), controller.rng.getstate())
+
+    def test_seed_out_of_range(self) -> None:
+        with mock.patch.dict(os.environ, {"MISSILE_DEFENCE_SEED": str(2 ** 64)}):
+            with self.assertRaises(ValueError):
+                Settings()
+
+
+if __name__ == "__main__":
+    unittest.main()
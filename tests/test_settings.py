@@ -0,0 +1,24 @@
+import os
+import unittest
+from unittest import mock
+
+from source.settings import Settings
+
+
+class EnemyBackendTest(unittest.TestCase):
+    """
+    Checks the enemy backend selected through the environment.
+    """
+
+    def test_backend_is_case_insensitive(self) -> None:
+        with mock.patch.dict(os.environ, {"MISSILE_DEFENCE_ENEMY_BACKEND": "swarm"}):
+            self.assertEqual(Settings().enemy_backend, "SWARM")
+
+    def test_unknown_backend_is_rejected(self) -> None:
+        with mock.patch.dict(os.environ, {"MISSILE_DEFENCE_ENEMY_BACKEND": "SWRAM"}):
+            with self.assertRaises(ValueError):
+                Settings()
+
+
+if __name__ == "__main__":
+    unittest.main()